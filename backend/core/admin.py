@@ -0,0 +1,22 @@
+from django.contrib import admin
+from .models import DueDate, DueSummary, StatusCounter
+
+@admin.register(StatusCounter)
+class StatusCounterAdmin(admin.ModelAdmin):
+    list_display = ('model', 'dimension', 'value', 'count', 'updated_at')
+    list_filter = ('model', 'dimension')
+    readonly_fields = ('model', 'dimension', 'value', 'count', 'updated_at')
+
+
+@admin.register(DueDate)
+class DueDateAdmin(admin.ModelAdmin):
+    list_display = ('due_date', 'kind', 'asset_type', 'asset_id', 'name', 'type', 'location')
+    list_filter = ('asset_type', 'kind')
+    search_fields = ('name', 'location')
+    readonly_fields = ('asset_type', 'asset_id', 'kind', 'due_date', 'name', 'type', 'location')
+
+
+@admin.register(DueSummary)
+class DueSummaryAdmin(admin.ModelAdmin):
+    list_display = ('computed_on', 'asset_type', 'kind', 'dimension', 'value', 'overdue', 'due_soon')
+    list_filter = ('computed_on', 'asset_type', 'kind', 'dimension')
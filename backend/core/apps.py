@@ -0,0 +1,31 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'core'
+
+    def ready(self):
+        from wayne_backend import response_cache
+
+        from . import calendar, lookup
+        from .signals import bulk_changed, require_pks
+
+        for asset_type in lookup.IdentifierIndex.SOURCES:
+            model = lookup.IdentifierIndex.model_for(asset_type)
+            post_save.connect(lookup.handle_save, sender=model)
+            post_delete.connect(lookup.handle_delete, sender=model)
+            bulk_changed.connect(lookup.handle_bulk_change, sender=model)
+            require_pks(model, lookup.IdentifierIndex.indexed_fields(asset_type))
+
+        for model in response_cache.versioned_models():
+            post_save.connect(response_cache.handle_change, sender=model)
+            post_delete.connect(response_cache.handle_change, sender=model)
+            bulk_changed.connect(response_cache.handle_change, sender=model)
+
+        for model in calendar.source_models():
+            post_save.connect(calendar.handle_save, sender=model)
+            post_delete.connect(calendar.handle_delete, sender=model)
+            bulk_changed.connect(calendar.handle_bulk_change, sender=model)
+            require_pks(model, calendar.tracked_fields(model))
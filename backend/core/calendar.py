@@ -0,0 +1,222 @@
+"""
+Calendário unificado de vencimentos de manutenção e garantia.
+
+``core.DueDate`` guarda uma linha por (ativo, tipo de vencimento) com data
+preenchida e é indexado por (data, id), de modo que "o que vence nos
+próximos 30 dias" é uma varredura de intervalo em um único índice, já na
+ordem da agenda. As linhas são mantidas pelos sinais conectados em
+``core.apps``: post_save/post_delete dos ativos e ``bulk_changed`` das
+operações em massa. Uma gravação só escreve na agenda se algum vencimento do
+ativo mudou; criação em massa insere só os novos e update em massa recria
+apenas as linhas alteradas, e só quando altera um campo copiado para a agenda.
+"""
+import datetime
+from collections import Counter
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import DueDate, DueSummary
+
+# Modelo -> (tipo de ativo, {vencimento: campo de data}, campo de local)
+SOURCES = {
+    'vehicles.Vehicle': ('vehicle', {'maintenance': 'next_maintenance'}, None),
+    'equipment.Equipment': ('equipment', {'maintenance': 'next_maintenance', 'warranty': 'warranty_expiry'}, 'location'),
+    'devices.Device': ('device', {'warranty': 'warranty_expiry'}, 'location'),
+}
+
+
+def source_models():
+    return [apps.get_model(label) for label in SOURCES]
+
+
+def source_for(model):
+    return SOURCES.get(model._meta.label)
+
+
+def tracked_fields(model):
+    """
+    Campos do ativo copiados para a agenda.
+    """
+    _, kinds, location_field = source_for(model)
+    fields = {'name', 'type', *kinds.values()}
+    if location_field:
+        fields.add(location_field)
+    return fields
+
+
+def entries_for(model, item):
+    """
+    Linhas da agenda de um ativo (instância ou linha de ``values()``).
+    """
+    asset_type, kinds, location_field = source_for(model)
+    get = item.get if isinstance(item, dict) else lambda name: getattr(item, name)
+    entries = []
+    for kind, field in kinds.items():
+        due_date = get(field)
+        if due_date is None:
+            continue
+        entries.append(DueDate(
+            asset_type=asset_type,
+            asset_id=get('pk'),
+            kind=kind,
+            due_date=due_date,
+            name=get('name'),
+            type=get('type'),
+            location=get(location_field) if location_field else '',
+        ))
+    return entries
+
+
+def _entry_key(entry):
+    return (entry.due_date, entry.name, entry.type, entry.location)
+
+
+def sync_instance(instance):
+    """
+    Ajusta as linhas de um ativo: só grava os vencimentos que mudaram.
+    """
+    model = type(instance)
+    asset_type = source_for(model)[0]
+    wanted = {entry.kind: entry for entry in entries_for(model, instance)}
+    stored = {
+        entry.kind: entry
+        for entry in DueDate.objects.filter(asset_type=asset_type, asset_id=instance.pk).order_by()
+    }
+    removed = [entry.pk for kind, entry in stored.items() if kind not in wanted]
+    changed = []
+    for kind, entry in wanted.items():
+        if kind in stored:
+            if _entry_key(stored[kind]) == _entry_key(entry):
+                continue
+            entry.pk = stored[kind].pk
+        changed.append(entry)
+    if not removed and not changed:
+        return
+    with transaction.atomic():
+        if removed:
+            DueDate.objects.filter(pk__in=removed).delete()
+        for entry in changed:
+            entry.save(force_update=entry.pk is not None)
+
+
+def sync_pks(model, pks, batch_size=500):
+    """
+    Recria as linhas da agenda apenas dos ativos em ``pks``.
+    """
+    asset_type = source_for(model)[0]
+    columns = ['pk', *tracked_fields(model)]
+    pks = list(pks)
+    with transaction.atomic():
+        for start in range(0, len(pks), batch_size):
+            chunk = pks[start:start + batch_size]
+            DueDate.objects.filter(asset_type=asset_type, asset_id__in=chunk).delete()
+            rows = model._default_manager.filter(pk__in=chunk).order_by().values(*columns)
+            DueDate.objects.bulk_create([entry for row in rows for entry in entries_for(model, row)])
+
+
+def rebuild(model, batch_size=2000):
+    """
+    Recria as linhas da agenda de um modelo a partir da tabela do ativo.
+    """
+    asset_type, kinds, _ = source_for(model)
+    columns = ['pk', *tracked_fields(model)]
+    with transaction.atomic():
+        DueDate.objects.filter(asset_type=asset_type).delete()
+        batch = []
+        has_date = Q()
+        for field in kinds.values():
+            has_date |= Q(**{f'{field}__isnull': False})
+        rows = model._default_manager.filter(has_date).order_by().values(*columns)
+        for row in rows.iterator(chunk_size=batch_size):
+            batch.extend(entries_for(model, row))
+            if len(batch) >= batch_size:
+                DueDate.objects.bulk_create(batch)
+                batch = []
+        DueDate.objects.bulk_create(batch)
+
+
+def handle_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not set(update_fields) & tracked_fields(sender):
+        return
+    sync_instance(instance)
+
+
+def handle_delete(sender, instance, **kwargs):
+    DueDate.objects.filter(asset_type=source_for(sender)[0], asset_id=instance.pk).delete()
+
+
+def handle_bulk_change(sender, operation=None, objs=None, fields=None, pks=None, **kwargs):
+    if operation == 'delete':
+        # O delete do queryset dispara post_delete por objeto
+        return
+    if operation == 'create' and objs is not None and all(obj.pk is not None for obj in objs):
+        DueDate.objects.bulk_create([entry for obj in objs for entry in entries_for(sender, obj)])
+        return
+    if operation == 'update' and fields is not None:
+        if not set(fields) & tracked_fields(sender):
+            return
+        if pks is not None:
+            sync_pks(sender, pks)
+            return
+    rebuild(sender)
+
+
+def due_queryset(until=None, overdue=True, today=None):
+    """
+    Vencimentos até ``until`` (inclusive); com ``overdue=False``, só a partir de hoje.
+    """
+    today = today or timezone.localdate()
+    queryset = DueDate.objects.all()
+    if until is not None:
+        queryset = queryset.filter(due_date__lte=until)
+    if not overdue:
+        queryset = queryset.filter(due_date__gte=today)
+    return queryset
+
+
+def precompute_summary(today=None, horizon_days=None):
+    """
+    Conta, por tipo de ativo, vencimento e local/tipo, os itens vencidos e os
+    que vencem em até ``horizon_days`` dias, gravando o resumo do dia.
+    """
+    today = today or timezone.localdate()
+    horizon_days = horizon_days or settings.DUE_CALENDAR['HORIZON_DAYS']
+    until = today + datetime.timedelta(days=horizon_days)
+
+    overdue, due_soon = Counter(), Counter()
+    rows = DueDate.objects.filter(due_date__lte=until).values_list(
+        'asset_type', 'kind', 'type', 'location', 'due_date'
+    )
+    for asset_type, kind, asset_kind, location, due_date in rows.iterator(chunk_size=5000):
+        target = overdue if due_date < today else due_soon
+        target[(asset_type, kind, 'type', asset_kind)] += 1
+        if location:
+            target[(asset_type, kind, 'location', location)] += 1
+
+    with transaction.atomic():
+        DueSummary.objects.filter(computed_on=today).delete()
+        DueSummary.objects.bulk_create([
+            DueSummary(
+                computed_on=today,
+                asset_type=asset_type,
+                kind=kind,
+                dimension=dimension,
+                value=value,
+                overdue=overdue[key],
+                due_soon=due_soon[key],
+            )
+            for key in set(overdue) | set(due_soon)
+            for asset_type, kind, dimension, value in [key]
+        ])
+        retention = settings.DUE_CALENDAR['SUMMARY_RETENTION_DAYS']
+        if retention is not None:
+            DueSummary.objects.filter(
+                computed_on__lt=today - datetime.timedelta(days=retention)
+            ).delete()
+    return len(set(overdue) | set(due_soon))
@@ -0,0 +1,263 @@
+"""
+Contadores materializados por status/tipo dos modelos de inventário.
+
+Os modelos que herdam de ``CountedModel`` declaram ``counter_dimensions`` e
+passam a manter a tabela ``core.StatusCounter`` dentro da mesma transação de
+cada create, update, delete e operação em massa (``bulk_create``,
+``update`` e ``delete`` do queryset).
+"""
+from collections import Counter
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F
+
+from .models import StatusCounter
+from .signals import bulk_changed, needs_pks
+
+
+def model_key(model):
+    return model._meta.label_lower
+
+
+def aggregate_counts(model, using=None):
+    """
+    Calcula os contadores direto da tabela do modelo (uma consulta por dimensão).
+    """
+    counts = Counter()
+    queryset = models.QuerySet(model, using=using).order_by()
+    for dimension in model.counter_dimensions:
+        rows = queryset.values(dimension).annotate(total=Count('pk'))
+        for row in rows:
+            counts[(dimension, row[dimension] or '')] += row['total']
+    return counts
+
+
+def stored_counts(model, using=None):
+    """
+    Lê os contadores materializados de um modelo.
+    """
+    rows = StatusCounter.objects.using(using).filter(
+        model=model_key(model)
+    ).values_list('dimension', 'value', 'count')
+    return Counter({(dimension, value): count for dimension, value, count in rows})
+
+
+def apply_deltas(model, deltas, using=None):
+    """
+    Aplica variações (dimensão, valor) -> n nos contadores do modelo.
+    """
+    key = model_key(model)
+    counters = StatusCounter.objects.using(using)
+    for (dimension, value), delta in deltas.items():
+        if not delta:
+            continue
+        lookup = {'model': key, 'dimension': dimension, 'value': value or ''}
+        if counters.filter(**lookup).update(count=F('count') + delta):
+            continue
+        try:
+            with transaction.atomic(using=using):
+                counters.create(count=delta, **lookup)
+        except IntegrityError:
+            # Criado por outra transação entre o update e o insert
+            counters.filter(**lookup).update(count=F('count') + delta)
+
+
+def rebuild(model, using=None):
+    """
+    Recria os contadores de um modelo a partir da tabela de origem.
+    """
+    with transaction.atomic(using=using):
+        StatusCounter.objects.using(using).filter(model=model_key(model)).delete()
+        StatusCounter.objects.using(using).bulk_create([
+            StatusCounter(
+                model=model_key(model),
+                dimension=dimension,
+                value=value,
+                count=count
+            )
+            for (dimension, value), count in aggregate_counts(model, using).items()
+        ])
+
+
+def drift(model, using=None):
+    """
+    Retorna {(dimensão, valor): (materializado, real)} para as chaves divergentes.
+    """
+    actual = aggregate_counts(model, using)
+    stored = stored_counts(model, using)
+    return {
+        key: (stored[key], actual[key])
+        for key in set(actual) | set(stored)
+        if stored[key] != actual[key]
+    }
+
+
+def _counts_query(model, dimension):
+    return StatusCounter.objects.filter(
+        model=model_key(model),
+        dimension=dimension,
+        count__gt=0
+    ).values_list('value', 'count')
+
+
+def read_counts(model, dimension):
+    """
+    Retorna {valor: quantidade} de uma dimensão, sem varrer a tabela do modelo.
+    """
+    return dict(_counts_query(model, dimension))
+
+
+async def aread_counts(model, dimension):
+    """
+    Versão assíncrona de ``read_counts``.
+    """
+    return {value: count async for value, count in _counts_query(model, dimension)}
+
+
+def _instance_values(instance):
+    return {
+        dimension: getattr(instance, dimension)
+        for dimension in instance.counter_dimensions
+    }
+
+
+def _grouped_counts(queryset, dimensions):
+    counts = Counter()
+    queryset = queryset.order_by()
+    for dimension in dimensions:
+        for row in queryset.values(dimension).annotate(total=Count('pk')):
+            counts[(dimension, row[dimension] or '')] += row['total']
+    return counts
+
+
+class CountedQuerySet(models.QuerySet):
+    """
+    QuerySet que mantém os contadores nas operações em massa.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        with transaction.atomic(using=self.db):
+            created = super().bulk_create(objs, *args, **kwargs)
+            if kwargs.get('ignore_conflicts') or kwargs.get('update_conflicts'):
+                # Não é possível saber quais linhas entraram de fato
+                rebuild(self.model, using=self.db)
+            else:
+                deltas = Counter()
+                for obj in created:
+                    for dimension, value in _instance_values(obj).items():
+                        deltas[(dimension, value or '')] += 1
+                apply_deltas(self.model, deltas, using=self.db)
+        bulk_changed.send(sender=self.model, operation='create', objs=created)
+        return created
+
+    def update(self, **kwargs):
+        dimensions = [
+            dimension for dimension in self.model.counter_dimensions
+            if dimension in kwargs
+        ]
+        with transaction.atomic(using=self.db):
+            # Chaves das linhas alteradas, lidas antes do UPDATE (que pode
+            # mudar os campos do filtro), só se algum receptor as usa
+            pks = None
+            if needs_pks(self.model, kwargs):
+                pks = list(self.order_by().values_list('pk', flat=True))
+            if not dimensions:
+                rows = super().update(**kwargs)
+                bulk_changed.send(sender=self.model, operation='update', fields=set(kwargs), pks=pks)
+                return rows
+
+            before = _grouped_counts(self, dimensions)
+            rows = super().update(**kwargs)
+            if any(hasattr(kwargs[d], 'resolve_expression') for d in dimensions):
+                rebuild(self.model, using=self.db)
+            else:
+                deltas = Counter()
+                for key, total in before.items():
+                    deltas[key] -= total
+                for dimension in dimensions:
+                    deltas[(dimension, kwargs[dimension] or '')] += rows
+                apply_deltas(self.model, deltas, using=self.db)
+        bulk_changed.send(sender=self.model, operation='update', fields=set(kwargs), pks=pks)
+        return rows
+
+    update.alters_data = True
+
+    def delete(self):
+        with transaction.atomic(using=self.db):
+            before = _grouped_counts(self, self.model.counter_dimensions)
+            result = super().delete()
+            apply_deltas(
+                self.model,
+                Counter({key: -total for key, total in before.items()}),
+                using=self.db
+            )
+        bulk_changed.send(sender=self.model, operation='delete')
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
+class CountedModel(models.Model):
+    """
+    Base abstrata para modelos com contadores materializados.
+    """
+    counter_dimensions = ()
+
+    objects = CountedQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    def _stored_values(self, using):
+        """
+        Lê os valores gravados das dimensões, bloqueando a linha até o fim da
+        transação. Os valores carregados na instância podem estar defasados
+        (outra instância, ``update`` em massa), e decrementar a partir deles
+        desviaria os contadores.
+        """
+        if self.pk is None:
+            return None
+        return type(self)._base_manager.using(using).select_for_update().filter(
+            pk=self.pk
+        ).values(*self.counter_dimensions).first()
+
+    def save(self, *args, **kwargs):
+        using = kwargs.get('using') or self._state.db or 'default'
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and not set(update_fields) & set(self.counter_dimensions):
+            return super().save(*args, **kwargs)
+
+        with transaction.atomic(using=using):
+            previous = self._stored_values(using)
+            super().save(*args, **kwargs)
+            current = _instance_values(self)
+            if previous is not None and update_fields is not None:
+                # Dimensões fora de update_fields continuam com o valor gravado
+                current = {
+                    dimension: value if dimension in update_fields else previous[dimension]
+                    for dimension, value in current.items()
+                }
+            deltas = Counter()
+            for dimension, value in current.items():
+                deltas[(dimension, value or '')] += 1
+                if previous is not None:
+                    deltas[(dimension, previous[dimension] or '')] -= 1
+            apply_deltas(type(self), deltas, using=using)
+
+    def delete(self, *args, **kwargs):
+        using = kwargs.get('using') or self._state.db or 'default'
+        with transaction.atomic(using=using):
+            previous = self._stored_values(using)
+            result = super().delete(*args, **kwargs)
+            if previous is not None:
+                apply_deltas(
+                    type(self),
+                    Counter({
+                        (dimension, value or ''): -1
+                        for dimension, value in previous.items()
+                    }),
+                    using=using
+                )
+        return result
@@ -0,0 +1,170 @@
+"""
+Importação em massa de inventário a partir de CSV.
+
+O arquivo é lido em streaming e processado em lotes de ``BATCH_SIZE`` linhas.
+Cada linha passa pelo serializer do app (sem os ``UniqueValidator``, que
+fariam uma consulta por linha); a unicidade de placa, chassi e número de
+série é verificada com uma única consulta por lote e contra as linhas já
+vistas no próprio arquivo. As linhas válidas entram com ``bulk_create`` em
+uma transação por lote, o que mantém os contadores e invalida os caches.
+"""
+import csv
+from functools import reduce
+from operator import or_
+
+from django.apps import apps
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils.module_loading import import_string
+from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
+
+# Origem -> (modelo 'app.Model', serializer, campos únicos)
+SOURCES = {
+    'vehicles': ('vehicles.Vehicle', 'vehicles.serializers.VehicleSerializer', ('license_plate', 'vin')),
+    'equipment': ('equipment.Equipment', 'equipment.serializers.EquipmentSerializer', ('serial_number',)),
+    'devices': ('devices.Device', 'devices.serializers.DeviceSerializer', ('serial_number',)),
+}
+
+
+class ImportReport:
+    def __init__(self, max_errors):
+        self.total = 0
+        self.valid = 0
+        self.created = 0
+        self.error_count = 0
+        self.errors = []
+        self.max_errors = max_errors
+
+    def add_error(self, row, errors):
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({'row': row, 'errors': errors})
+
+    def as_dict(self):
+        return {
+            'total': self.total,
+            'valid': self.valid,
+            'created': self.created,
+            'error_count': self.error_count,
+            'errors': sorted(self.errors, key=lambda error: error['row']),
+            'errors_truncated': self.error_count > len(self.errors),
+        }
+
+
+class CSVImporter:
+    def __init__(self, source, batch_size=None, dry_run=False):
+        label, serializer_path, unique_fields = SOURCES[source]
+        options = settings.INVENTORY_IMPORT
+        self.model = apps.get_model(label)
+        self.serializer = import_string(serializer_path)()
+        self.unique_fields = unique_fields
+        self.batch_size = batch_size or options['BATCH_SIZE']
+        self.dry_run = dry_run
+        self.report = ImportReport(options['MAX_REPORTED_ERRORS'])
+        self.seen = {field: set() for field in unique_fields}
+        # A unicidade é verificada por lote em ``check_unique``
+        for field in unique_fields:
+            self.serializer.fields[field].validators = [
+                validator for validator in self.serializer.fields[field].validators
+                if not isinstance(validator, UniqueValidator)
+            ]
+
+    def run(self, lines):
+        """
+        Importa as linhas de um iterável de texto (arquivo aberto, stream).
+        """
+        reader = csv.DictReader(lines)
+        batch = []
+        for row in reader:
+            self.report.total += 1
+            # Linha 1 é o cabeçalho
+            batch.append((reader.line_num, row))
+            if len(batch) >= self.batch_size:
+                self.import_batch(batch)
+                batch = []
+        if batch:
+            self.import_batch(batch)
+        return self.report
+
+    def clean(self, row):
+        """
+        Converte células vazias: mantém '' em campos que aceitam texto em
+        branco, vira None nos que aceitam nulo e é omitida nos demais.
+        """
+        data = {}
+        for name, value in row.items():
+            if name is None:
+                continue
+            # BOM gravado por planilhas no início do cabeçalho
+            name = name.strip().lstrip('\ufeff')
+            field = self.serializer.fields.get(name)
+            if field is None or field.read_only:
+                continue
+            value = (value or '').strip()
+            if value == '' and not getattr(field, 'allow_blank', False):
+                if field.allow_null:
+                    data[name] = None
+                continue
+            data[name] = value
+        return data
+
+    def import_batch(self, batch):
+        valid = []
+        for line, row in batch:
+            try:
+                valid.append((line, self.serializer.run_validation(self.clean(row))))
+            except serializers.ValidationError as exc:
+                self.report.add_error(line, exc.detail)
+
+        valid = self.check_unique(valid)
+        self.report.valid += len(valid)
+        if not valid or self.dry_run:
+            return
+
+        try:
+            with transaction.atomic():
+                self.model.objects.bulk_create(
+                    [self.model(**data) for _, data in valid],
+                    batch_size=settings.INVENTORY_IMPORT['INSERT_CHUNK_SIZE']
+                )
+        except IntegrityError:
+            # Outro processo gravou os mesmos valores após a verificação do lote
+            for line, _ in valid:
+                self.report.add_error(line, {'non_field_errors': [
+                    'Conflito de unicidade com um registro gravado durante a importação.'
+                ]})
+            self.report.valid -= len(valid)
+            return
+        self.report.created += len(valid)
+
+    def check_unique(self, valid):
+        """
+        Remove linhas cujos campos únicos já existem no banco (uma consulta
+        por lote) ou apareceram antes no arquivo.
+        """
+        if not valid:
+            return valid
+        values = {field: {data[field] for _, data in valid} for field in self.unique_fields}
+        existing = {field: set() for field in self.unique_fields}
+        query = reduce(or_, [Q(**{f'{field}__in': values[field]}) for field in self.unique_fields])
+        for row in self.model.objects.filter(query).values_list(*self.unique_fields):
+            for field, value in zip(self.unique_fields, row):
+                existing[field].add(value)
+
+        accepted = []
+        for line, data in valid:
+            errors = {}
+            for field in self.unique_fields:
+                if data[field] in existing[field]:
+                    errors[field] = ['Já existe um registro com este valor.']
+                elif data[field] in self.seen[field]:
+                    errors[field] = ['Valor repetido em outra linha do arquivo.']
+            if errors:
+                self.report.add_error(line, errors)
+                continue
+            for field in self.unique_fields:
+                self.seen[field].add(data[field])
+            accepted.append((line, data))
+        return accepted
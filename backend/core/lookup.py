@@ -0,0 +1,343 @@
+"""
+Índice em memória para busca aproximada de identificadores de ativos.
+
+Placas, chassis e números de série são normalizados (maiúsculas, sem
+separadores) e guardados em uma BK-tree pela distância de edição, de modo
+que uma consulta com até ``max_distance`` caracteres errados visita apenas
+uma fração das chaves. O índice é carregado na subida do servidor (ver
+``warm_up``) e atualizado incrementalmente pelos sinais de save/delete e
+pelas operações em massa (só as linhas criadas ou alteradas são relidas); as
+alterações que chegam durante uma recarga são enfileiradas e reaplicadas
+sobre o índice novo. Recargas completas de um índice já carregado rodam em
+segundo plano, sem bloquear as consultas.
+"""
+import logging
+import re
+import threading
+from collections import namedtuple
+
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+NON_ALNUM_RE = re.compile(r'[^0-9A-Z]')
+
+Entry = namedtuple('Entry', ['asset_type', 'pk', 'field', 'value', 'name'])
+
+
+def normalize(value):
+    return NON_ALNUM_RE.sub('', (value or '').upper())
+
+
+def edit_distance(a, b):
+    """
+    Distância de Levenshtein entre duas strings.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """
+    BK-tree sobre chaves normalizadas. Remoções são lógicas: a chave continua
+    na árvore e é ignorada quando não tem mais entradas.
+    """
+
+    def __init__(self):
+        self.root = None
+
+    def add(self, key):
+        if self.root is None:
+            self.root = (key, {})
+            return
+        node = self.root
+        while True:
+            node_key, children = node
+            distance = edit_distance(key, node_key)
+            if distance == 0:
+                return
+            if distance not in children:
+                children[distance] = (key, {})
+                return
+            node = children[distance]
+
+    def search(self, key, max_distance):
+        if self.root is None:
+            return []
+        found = []
+        stack = [self.root]
+        while stack:
+            node_key, children = stack.pop()
+            distance = edit_distance(key, node_key)
+            if distance <= max_distance:
+                found.append((distance, node_key))
+            low, high = distance - max_distance, distance + max_distance
+            stack.extend(
+                child for edge, child in children.items()
+                if low <= edge <= high
+            )
+        return found
+
+
+class IdentifierIndex:
+    # Tipo de ativo -> (modelo 'app.Model', campos indexados)
+    SOURCES = {
+        'vehicle': ('vehicles.Vehicle', ('license_plate', 'vin')),
+        'equipment': ('equipment.Equipment', ('serial_number',)),
+        'device': ('devices.Device', ('serial_number',)),
+    }
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # Serializa as recargas: requisições simultâneas não repetem o build
+        self._build_lock = threading.Lock()
+        self.tree = BKTree()
+        self.entries = {}  # chave normalizada -> {(tipo, pk, campo): Entry}
+        self.by_asset = {}  # (tipo, pk) -> [chaves]
+        self.dead_keys = 0
+        self.stale = set()
+        # Incrementada a cada invalidação; um build só limpa ``stale`` se
+        # nenhuma invalidação chegou enquanto ele lia o banco
+        self.generation = 0
+        # Alterações recebidas durante um build, reaplicadas após a troca
+        self.pending = []
+        self.building = False
+        self.build_scheduled = False
+        self.ready = False
+
+    @classmethod
+    def model_for(cls, asset_type):
+        from django.apps import apps
+        return apps.get_model(cls.SOURCES[asset_type][0])
+
+    @classmethod
+    def asset_type_for(cls, model):
+        label = model._meta.label
+        for asset_type, (source, _) in cls.SOURCES.items():
+            if source == label:
+                return asset_type
+        return None
+
+    @classmethod
+    def indexed_fields(cls, asset_type):
+        return {'name', *cls.SOURCES[asset_type][1]}
+
+    def build(self):
+        with self._build_lock:
+            self._build()
+
+    def schedule_build(self):
+        """
+        Agenda uma recarga em segundo plano; no máximo uma fica à espera.
+        """
+        with self._lock:
+            if self.build_scheduled:
+                return None
+            self.build_scheduled = True
+        thread = threading.Thread(target=self._scheduled_build, name='identifier-index-build', daemon=True)
+        thread.start()
+        return thread
+
+    def _scheduled_build(self):
+        with self._build_lock:
+            # Invalidações a partir daqui agendam uma nova recarga
+            with self._lock:
+                self.build_scheduled = False
+            try:
+                if self.needs_build():
+                    self._build()
+            except Exception as e:
+                logger.error(f'Erro ao carregar o índice de identificadores: {str(e)}')
+
+    def _build(self):
+        with self._lock:
+            self.building = True
+            generation = self.generation
+        try:
+            tree, entries, by_asset = BKTree(), {}, {}
+            for asset_type, (_, fields) in self.SOURCES.items():
+                rows = self.model_for(asset_type).objects.order_by().values_list('pk', 'name', *fields)
+                for pk, name, *values in rows.iterator(chunk_size=5000):
+                    for field, value in zip(fields, values):
+                        self._insert(tree, entries, by_asset, Entry(asset_type, pk, field, value, name))
+        except Exception:
+            with self._lock:
+                self.building = False
+                self.pending = []
+            raise
+        with self._lock:
+            self.tree, self.entries, self.by_asset = tree, entries, by_asset
+            self.dead_keys = 0
+            for asset_type, pk, new_entries in self.pending:
+                self._apply(asset_type, pk, new_entries)
+            self.pending = []
+            if self.generation == generation:
+                self.stale.clear()
+            self.building = False
+            self.ready = True
+        logger.info(f'Índice de identificadores carregado com {len(entries)} chaves')
+
+    @staticmethod
+    def _insert(tree, entries, by_asset, entry):
+        key = normalize(entry.value)
+        if not key:
+            return
+        if key not in entries:
+            entries[key] = {}
+            tree.add(key)
+        entries[key][(entry.asset_type, entry.pk, entry.field)] = entry
+        by_asset.setdefault((entry.asset_type, entry.pk), []).append(key)
+
+    def _apply(self, asset_type, pk, new_entries):
+        for key in self.by_asset.pop((asset_type, pk), []):
+            bucket = self.entries.get(key, {})
+            for entry_key in [k for k in bucket if k[:2] == (asset_type, pk)]:
+                del bucket[entry_key]
+            if not bucket:
+                self.dead_keys += 1
+        for entry in new_entries:
+            self._insert(self.tree, self.entries, self.by_asset, entry)
+
+    def _change(self, asset_type, pk, new_entries):
+        with self._lock:
+            if self.building:
+                # O build pode ter lido a linha antes desta alteração
+                self.pending.append((asset_type, pk, new_entries))
+            elif self.ready:
+                self._apply(asset_type, pk, new_entries)
+            # Sem índice carregado, o próximo build lê o estado atual
+
+    def remove(self, asset_type, pk):
+        self._change(asset_type, pk, [])
+
+    def update(self, instance):
+        asset_type = self.asset_type_for(type(instance))
+        _, fields = self.SOURCES[asset_type]
+        self._change(asset_type, instance.pk, [
+            Entry(asset_type, instance.pk, field, getattr(instance, field), instance.name)
+            for field in fields
+        ])
+
+    def refresh(self, asset_type, pks, batch_size=1000):
+        """
+        Relê do banco as chaves dos ativos em ``pks`` (operações em massa).
+        """
+        with self._lock:
+            if not self.ready and not self.building:
+                return
+        model = self.model_for(asset_type)
+        _, fields = self.SOURCES[asset_type]
+        pks = list(pks)
+        for start in range(0, len(pks), batch_size):
+            chunk = pks[start:start + batch_size]
+            found = set()
+            for instance in model.objects.filter(pk__in=chunk).only('name', *fields):
+                found.add(instance.pk)
+                self.update(instance)
+            for pk in set(chunk) - found:
+                self.remove(asset_type, pk)
+
+    def mark_stale(self, asset_type):
+        with self._lock:
+            self.stale.add(asset_type)
+            self.generation += 1
+
+    def needs_build(self):
+        # Operações em massa e excesso de remoções lógicas forçam recarga
+        return not self.ready or self.stale or self.dead_keys > max(1000, len(self.entries) // 2)
+
+    def ensure_fresh(self):
+        if not self.needs_build():
+            return
+        if self.ready:
+            # A consulta usa o índice atual enquanto a recarga roda
+            self.schedule_build()
+            return
+        # Índice frio: espera o build (o da subida, se já em andamento)
+        with self._build_lock:
+            if self.needs_build():
+                self._build()
+
+    def lookup(self, query, max_distance=2, limit=10, asset_types=None):
+        key = normalize(query)
+        if not key:
+            return []
+        self.ensure_fresh()
+        with self._lock:
+            matches = self.tree.search(key, max_distance)
+            results = []
+            for distance, match_key in matches:
+                for entry in self.entries.get(match_key, {}).values():
+                    if asset_types and entry.asset_type not in asset_types:
+                        continue
+                    results.append((distance, abs(len(match_key) - len(key)), entry))
+        results.sort(key=lambda item: (item[0], item[1], item[2].value))
+        return [
+            {
+                'type': entry.asset_type,
+                'id': entry.pk,
+                'field': entry.field,
+                'value': entry.value,
+                'name': entry.name,
+                'distance': distance,
+            }
+            for distance, _, entry in results[:limit]
+        ]
+
+
+index = IdentifierIndex()
+
+
+def warm_up():
+    """
+    Carrega o índice em segundo plano na subida do servidor.
+    """
+    index.schedule_build()
+
+
+def handle_save(sender, instance, **kwargs):
+    # A decisão entre aplicar, enfileirar (build em andamento) ou descartar
+    # (índice não carregado) é tomada no commit
+    transaction.on_commit(lambda: index.update(instance))
+
+
+def handle_delete(sender, instance, **kwargs):
+    asset_type = index.asset_type_for(sender)
+    pk = instance.pk
+    transaction.on_commit(lambda: index.remove(asset_type, pk))
+
+
+def handle_bulk_change(sender, operation=None, objs=None, fields=None, pks=None, **kwargs):
+    asset_type = index.asset_type_for(sender)
+    if not asset_type or operation == 'delete':
+        # O delete do queryset dispara post_delete por objeto
+        return
+    if operation == 'update' and fields is not None:
+        if not set(fields) & index.indexed_fields(asset_type):
+            return
+        if pks is not None:
+            transaction.on_commit(lambda: index.refresh(asset_type, pks))
+            return
+    if operation == 'create' and objs is not None and all(obj.pk is not None for obj in objs):
+        def add():
+            for obj in objs:
+                index.update(obj)
+        transaction.on_commit(add)
+        return
+
+    # Sem as linhas afetadas: recarga completa em segundo plano
+    def reload():
+        index.mark_stale(asset_type)
+        index.schedule_build()
+    transaction.on_commit(reload)
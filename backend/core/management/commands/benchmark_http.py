@@ -0,0 +1,99 @@
+import http.client
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from users.tokens import issue_token
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede vazão e latência (p50/p95/p99) de requisições simultâneas contra '
+        'servidores já em execução, por exemplo o WSGI (gunicorn wayne_backend.wsgi) '
+        'e o ASGI (uvicorn wayne_backend.asgi:application) na mesma máquina.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--target',
+            action='append',
+            required=True,
+            help='nome=URL, ex.: wsgi=http://127.0.0.1:8000/api/vehicles/ '
+                 'asgi=http://127.0.0.1:8001/api/async/vehicles/ (repetível).',
+        )
+        parser.add_argument('--requests', type=int, default=2000, help='Requisições por alvo.')
+        parser.add_argument('--concurrency', type=int, default=64, help='Requisições simultâneas.')
+        parser.add_argument('--warmup', type=int, default=50, help='Requisições descartadas antes de medir.')
+        token = parser.add_mutually_exclusive_group(required=True)
+        token.add_argument('--token', help='Token Knox já emitido.')
+        token.add_argument('--user', help='Usuário para o qual um token será emitido.')
+
+    def handle(self, *args, **options):
+        targets = []
+        for target in options['target']:
+            name, sep, url = target.partition('=')
+            if not sep or not url.startswith(('http://', 'https://')):
+                raise CommandError(f'Alvo inválido: {target!r} (use nome=URL).')
+            targets.append((name, url))
+
+        token = options['token']
+        if token is None:
+            try:
+                user = get_user_model().objects.get_by_natural_key(options['user'])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f'Usuário {options["user"]!r} não encontrado.')
+            token = issue_token(user)[1]
+
+        for name, url in targets:
+            self.run_target(name, url, token, options)
+
+    def run_target(self, name, url, token, options):
+        parts = urlsplit(url)
+        path = parts.path + (f'?{parts.query}' if parts.query else '')
+        connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        headers = {'Authorization': f'Token {token}', 'Accept': 'application/json'}
+        local = threading.local()
+
+        def request(_):
+            # Uma conexão keep-alive por thread do cliente
+            connection = getattr(local, 'connection', None)
+            if connection is None:
+                connection = local.connection = connection_class(parts.netloc, timeout=30)
+            started = time.perf_counter()
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                ok = response.status == 200
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                local.connection = None
+                ok = False
+            return time.perf_counter() - started, ok
+
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as pool:
+            list(pool.map(request, range(options['warmup'])))
+            started = time.perf_counter()
+            results = list(pool.map(request, range(options['requests'])))
+            elapsed = time.perf_counter() - started
+
+        latencies = [latency for latency, ok in results if ok]
+        errors = len(results) - len(latencies)
+        style = self.style.SUCCESS if not errors else self.style.WARNING
+        self.stdout.write(style(
+            f'{name}: {len(results)} req em {elapsed:.2f}s | {len(results) / elapsed:.1f} req/s | '
+            f'p50 {percentile(latencies, 0.50) * 1000:.1f} ms | '
+            f'p95 {percentile(latencies, 0.95) * 1000:.1f} ms | '
+            f'p99 {percentile(latencies, 0.99) * 1000:.1f} ms | '
+            f'{errors} erros'
+        ))
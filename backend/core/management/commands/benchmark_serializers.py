@@ -0,0 +1,75 @@
+import itertools
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from devices.serializers import DeviceSerializer
+from equipment.serializers import EquipmentSerializer
+from security.serializers import SecurityIncidentSerializer, SecurityLogSerializer
+from vehicles.serializers import VehicleSerializer
+from wayne_backend.fastread import get_plan
+
+SERIALIZERS = {
+    'vehicles': VehicleSerializer,
+    'equipment': EquipmentSerializer,
+    'devices': DeviceSerializer,
+    'incidents': SecurityIncidentSerializer,
+    'logs': SecurityLogSerializer,
+}
+
+
+class Command(BaseCommand):
+    help = 'Compara o tempo por linha do serializer do DRF com a leitura compilada'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=100000,
+            help='Linhas serializadas por medição (as linhas do banco são repetidas até o total).',
+        )
+        parser.add_argument(
+            '--only',
+            choices=sorted(SERIALIZERS),
+            action='append',
+            help='Mede apenas os serializers informados.',
+        )
+
+    def handle(self, *args, **options):
+        total = options['rows']
+        for name in options['only'] or SERIALIZERS:
+            serializer_class = SERIALIZERS[name]
+            plan = get_plan(serializer_class)
+            if plan is None:
+                self.stdout.write(self.style.WARNING(f'{name}: serializer não compilável'))
+                continue
+
+            queryset = serializer_class.Meta.model.objects.order_by('pk')
+            instances = list(queryset[:total])
+            if not instances:
+                self.stdout.write(self.style.WARNING(f'{name}: tabela vazia, nada a medir'))
+                continue
+            rows = list(queryset.values(*plan.columns)[:total])
+
+            # Paridade na amostra real antes de medir
+            if JSONRenderer().render(plan.render(rows)) != JSONRenderer().render(
+                serializer_class(instances, many=True).data
+            ):
+                raise CommandError(f'{name}: saída compilada diverge do serializer')
+
+            instances = list(itertools.islice(itertools.cycle(instances), total))
+            rows = list(itertools.islice(itertools.cycle(rows), total))
+
+            started = time.perf_counter()
+            serializer_class(instances, many=True).data
+            drf_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            plan.render(rows)
+            fast_seconds = time.perf_counter() - started
+
+            self.stdout.write(self.style.SUCCESS(
+                f'{name}: {total} linhas | DRF {drf_seconds * 1e6 / total:.2f} µs/linha | '
+                f'compilado {fast_seconds * 1e6 / total:.2f} µs/linha | '
+                f'{drf_seconds / fast_seconds:.1f}x'
+            ))
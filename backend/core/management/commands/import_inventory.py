@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+from core.imports import SOURCES, CSVImporter
+
+
+class Command(BaseCommand):
+    help = 'Importa veículos, equipamentos ou dispositivos de um arquivo CSV'
+
+    def add_arguments(self, parser):
+        parser.add_argument('source', choices=sorted(SOURCES), help='Tipo de inventário.')
+        parser.add_argument('path', help='Arquivo CSV com cabeçalho.')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help='Linhas validadas por lote (padrão: INVENTORY_IMPORT["BATCH_SIZE"]).',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Apenas valida, sem gravar.',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            csv_file = open(options['path'], encoding='utf-8', newline='')
+        except OSError as e:
+            raise CommandError(f'Não foi possível abrir {options["path"]}: {e}')
+
+        with csv_file:
+            report = CSVImporter(
+                options['source'],
+                batch_size=options['batch_size'],
+                dry_run=options['dry_run']
+            ).run(csv_file)
+
+        for error in report.errors:
+            self.stdout.write(self.style.WARNING(f'Linha {error["row"]}: {error["errors"]}'))
+        if report.error_count > len(report.errors):
+            self.stdout.write(self.style.WARNING(
+                f'... mais {report.error_count - len(report.errors)} linhas com erro'
+            ))
+
+        action = 'válidas' if options['dry_run'] else 'criadas'
+        count = report.valid if options['dry_run'] else report.created
+        self.stdout.write(self.style.SUCCESS(
+            f'{report.total} linhas lidas, {count} {action}, {report.error_count} com erro'
+        ))
@@ -0,0 +1,38 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from core import calendar
+
+
+class Command(BaseCommand):
+    help = (
+        'Calcula o resumo diário de vencimentos (vencidos e a vencer) por local e '
+        'por tipo de ativo. Agende uma execução por dia (ex.: cron às 00:05).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, help='Janela de "a vencer" em dias (padrão: DUE_CALENDAR).')
+        parser.add_argument('--date', help='Dia de referência AAAA-MM-DD (padrão: hoje).')
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='Recria a agenda a partir das tabelas dos ativos antes de calcular.',
+        )
+
+    def handle(self, *args, **options):
+        today = None
+        if options['date']:
+            try:
+                today = datetime.date.fromisoformat(options['date'])
+            except ValueError:
+                raise CommandError(f'Data inválida: {options["date"]!r} (use AAAA-MM-DD).')
+        if options['days'] is not None and options['days'] < 1:
+            raise CommandError('--days deve ser maior que zero.')
+
+        if options['rebuild']:
+            for model in calendar.source_models():
+                calendar.rebuild(model)
+                self.stdout.write(f'{model._meta.label}: agenda recriada')
+
+        rows = calendar.precompute_summary(today=today, horizon_days=options['days'])
+        self.stdout.write(self.style.SUCCESS(f'Resumo de vencimentos gravado: {rows} linhas'))
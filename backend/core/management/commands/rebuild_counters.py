@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+from core import counters
+from devices.models import Device
+from equipment.models import Equipment
+from vehicles.models import Vehicle
+
+COUNTED_MODELS = (Vehicle, Equipment, Device)
+
+
+class Command(BaseCommand):
+    help = 'Verifica divergências e recria os contadores materializados de status'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Apenas verifica divergências, sem recriar os contadores.',
+        )
+
+    def handle(self, *args, **options):
+        drifted = False
+        for model in COUNTED_MODELS:
+            label = counters.model_key(model)
+            differences = counters.drift(model)
+            if not differences:
+                self.stdout.write(self.style.SUCCESS(f'{label}: contadores consistentes'))
+                continue
+
+            drifted = True
+            for (dimension, value), (stored, actual) in sorted(differences.items()):
+                self.stdout.write(self.style.WARNING(
+                    f'{label}.{dimension}={value!r}: materializado={stored} real={actual}'
+                ))
+
+            if not options['check']:
+                counters.rebuild(model)
+                self.stdout.write(self.style.SUCCESS(f'{label}: contadores recriados'))
+
+        if drifted and options['check']:
+            raise CommandError('Contadores divergentes encontrados.')
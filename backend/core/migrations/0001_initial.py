@@ -0,0 +1,34 @@
+# Generated by Django 4.2.10 on 2026-10-18 14:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatusCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=100, verbose_name='Modelo')),
+                ('dimension', models.CharField(max_length=50, verbose_name='Dimensão')),
+                ('value', models.CharField(max_length=100, verbose_name='Valor')),
+                ('count', models.BigIntegerField(default=0, verbose_name='Quantidade')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Atualizado em')),
+            ],
+            options={
+                'verbose_name': 'Contador de Status',
+                'verbose_name_plural': 'Contadores de Status',
+                'ordering': ['model', 'dimension', 'value'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='statuscounter',
+            constraint=models.UniqueConstraint(fields=('model', 'dimension', 'value'), name='core_statuscounter_unique_key'),
+        ),
+    ]
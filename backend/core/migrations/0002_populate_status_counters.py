@@ -0,0 +1,45 @@
+from django.db import migrations
+from django.db.models import Count
+
+COUNTED_MODELS = {
+    ('vehicles', 'Vehicle'): ('status', 'type', 'fuel_type'),
+    ('equipment', 'Equipment'): ('status', 'type'),
+    ('devices', 'Device'): ('status', 'type'),
+}
+
+
+def populate_counters(apps, schema_editor):
+    StatusCounter = apps.get_model('core', 'StatusCounter')
+    db_alias = schema_editor.connection.alias
+    counters = []
+    for (app_label, model_name), dimensions in COUNTED_MODELS.items():
+        model = apps.get_model(app_label, model_name)
+        queryset = model.objects.using(db_alias).order_by()
+        for dimension in dimensions:
+            for row in queryset.values(dimension).annotate(total=Count('pk')):
+                counters.append(StatusCounter(
+                    model=f'{app_label}.{model_name.lower()}',
+                    dimension=dimension,
+                    value=row[dimension] or '',
+                    count=row['total']
+                ))
+    StatusCounter.objects.using(db_alias).bulk_create(counters)
+
+
+def clear_counters(apps, schema_editor):
+    StatusCounter = apps.get_model('core', 'StatusCounter')
+    StatusCounter.objects.using(schema_editor.connection.alias).all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('vehicles', '0004_alter_vehicle_vin'),
+        ('equipment', '0001_initial'),
+        ('devices', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_counters, clear_counters),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 4.2.10 on 2026-10-18 15:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_populate_status_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DueDate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('asset_type', models.CharField(max_length=20, verbose_name='Tipo de Ativo')),
+                ('asset_id', models.BigIntegerField(verbose_name='ID do Ativo')),
+                ('kind', models.CharField(choices=[('maintenance', 'Manutenção'), ('warranty', 'Garantia')], max_length=20, verbose_name='Vencimento')),
+                ('due_date', models.DateField(verbose_name='Data')),
+                ('name', models.CharField(max_length=100, verbose_name='Nome')),
+                ('type', models.CharField(max_length=20, verbose_name='Tipo')),
+                ('location', models.CharField(blank=True, max_length=100, verbose_name='Local')),
+            ],
+            options={
+                'verbose_name': 'Vencimento',
+                'verbose_name_plural': 'Vencimentos',
+                'ordering': ['due_date', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='DueSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('computed_on', models.DateField(verbose_name='Calculado em')),
+                ('asset_type', models.CharField(max_length=20, verbose_name='Tipo de Ativo')),
+                ('kind', models.CharField(choices=[('maintenance', 'Manutenção'), ('warranty', 'Garantia')], max_length=20, verbose_name='Vencimento')),
+                ('dimension', models.CharField(choices=[('location', 'Local'), ('type', 'Tipo')], max_length=20, verbose_name='Dimensão')),
+                ('value', models.CharField(max_length=100, verbose_name='Valor')),
+                ('overdue', models.PositiveIntegerField(default=0, verbose_name='Vencidos')),
+                ('due_soon', models.PositiveIntegerField(default=0, verbose_name='A vencer')),
+            ],
+            options={
+                'verbose_name': 'Resumo de Vencimentos',
+                'verbose_name_plural': 'Resumos de Vencimentos',
+                'ordering': ['-computed_on', 'asset_type', 'kind', 'dimension', 'value'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='duesummary',
+            constraint=models.UniqueConstraint(fields=('computed_on', 'asset_type', 'kind', 'dimension', 'value'), name='core_duesummary_unique_key'),
+        ),
+        migrations.AddIndex(
+            model_name='duedate',
+            index=models.Index(fields=['due_date', 'id'], name='core_duedate_calendar_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='duedate',
+            constraint=models.UniqueConstraint(fields=('asset_type', 'asset_id', 'kind'), name='core_duedate_unique_asset'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+from django.db import migrations
+
+DUE_SOURCES = {
+    ('vehicles', 'Vehicle'): ('vehicle', {'maintenance': 'next_maintenance'}, None),
+    ('equipment', 'Equipment'): ('equipment', {'maintenance': 'next_maintenance', 'warranty': 'warranty_expiry'}, 'location'),
+    ('devices', 'Device'): ('device', {'warranty': 'warranty_expiry'}, 'location'),
+}
+
+
+def populate_due_dates(apps, schema_editor):
+    DueDate = apps.get_model('core', 'DueDate')
+    db_alias = schema_editor.connection.alias
+    entries = []
+    for (app_label, model_name), (asset_type, kinds, location_field) in DUE_SOURCES.items():
+        model = apps.get_model(app_label, model_name)
+        columns = ['pk', 'name', 'type', *kinds.values()] + ([location_field] if location_field else [])
+        for row in model.objects.using(db_alias).order_by().values(*columns).iterator():
+            for kind, field in kinds.items():
+                if row[field] is None:
+                    continue
+                entries.append(DueDate(
+                    asset_type=asset_type,
+                    asset_id=row['pk'],
+                    kind=kind,
+                    due_date=row[field],
+                    name=row['name'],
+                    type=row['type'],
+                    location=row[location_field] if location_field else '',
+                ))
+    DueDate.objects.using(db_alias).bulk_create(entries, batch_size=500)
+
+
+def clear_due_dates(apps, schema_editor):
+    DueDate = apps.get_model('core', 'DueDate')
+    DueDate.objects.using(schema_editor.connection.alias).all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_due_calendar'),
+        ('vehicles', '0005_alter_vehicle_fuel_type_alter_vehicle_status_and_more'),
+        ('equipment', '0002_alter_equipment_status_alter_equipment_type'),
+        ('devices', '0002_alter_device_os_alter_device_status_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_due_dates, clear_due_dates),
+    ]
@@ -0,0 +1,103 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class StatusCounter(models.Model):
+    """
+    Contador materializado de registros por (modelo, dimensão, valor).
+
+    Mantido na mesma transação das escritas em veículos, equipamentos e
+    dispositivos (ver core.counters).
+    """
+    model = models.CharField(_('Modelo'), max_length=100)
+    dimension = models.CharField(_('Dimensão'), max_length=50)
+    value = models.CharField(_('Valor'), max_length=100)
+    count = models.BigIntegerField(_('Quantidade'), default=0)
+    updated_at = models.DateTimeField(_('Atualizado em'), auto_now=True)
+
+    class Meta:
+        verbose_name = _('Contador de Status')
+        verbose_name_plural = _('Contadores de Status')
+        ordering = ['model', 'dimension', 'value']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['model', 'dimension', 'value'],
+                name='core_statuscounter_unique_key'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.model}.{self.dimension}={self.value}: {self.count}"
+
+
+class DueDate(models.Model):
+    """
+    Calendário unificado de vencimentos (manutenção e garantia) de veículos,
+    equipamentos e dispositivos.
+
+    Uma linha por (ativo, tipo de vencimento) com data preenchida, mantida a
+    cada gravação dos ativos (ver core.calendar). Nome, tipo e local são
+    copiados do ativo para que a agenda seja lida sem juntar as três tabelas.
+    """
+    KIND_CHOICES = [
+        ('maintenance', _('Manutenção')),
+        ('warranty', _('Garantia')),
+    ]
+
+    asset_type = models.CharField(_('Tipo de Ativo'), max_length=20)
+    asset_id = models.BigIntegerField(_('ID do Ativo'))
+    kind = models.CharField(_('Vencimento'), max_length=20, choices=KIND_CHOICES)
+    due_date = models.DateField(_('Data'))
+    name = models.CharField(_('Nome'), max_length=100)
+    type = models.CharField(_('Tipo'), max_length=20)
+    location = models.CharField(_('Local'), max_length=100, blank=True)
+
+    class Meta:
+        verbose_name = _('Vencimento')
+        verbose_name_plural = _('Vencimentos')
+        ordering = ['due_date', 'id']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['asset_type', 'asset_id', 'kind'],
+                name='core_duedate_unique_asset'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['due_date', 'id'], name='core_duedate_calendar_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.asset_type}:{self.asset_id} {self.kind} {self.due_date}"
+
+
+class DueSummary(models.Model):
+    """
+    Contagem diária de vencimentos por local e por tipo de ativo, gerada por
+    ``manage.py precompute_due_summary``.
+    """
+    DIMENSION_CHOICES = [
+        ('location', _('Local')),
+        ('type', _('Tipo')),
+    ]
+
+    computed_on = models.DateField(_('Calculado em'))
+    asset_type = models.CharField(_('Tipo de Ativo'), max_length=20)
+    kind = models.CharField(_('Vencimento'), max_length=20, choices=DueDate.KIND_CHOICES)
+    dimension = models.CharField(_('Dimensão'), max_length=20, choices=DIMENSION_CHOICES)
+    value = models.CharField(_('Valor'), max_length=100)
+    overdue = models.PositiveIntegerField(_('Vencidos'), default=0)
+    due_soon = models.PositiveIntegerField(_('A vencer'), default=0)
+
+    class Meta:
+        verbose_name = _('Resumo de Vencimentos')
+        verbose_name_plural = _('Resumos de Vencimentos')
+        ordering = ['-computed_on', 'asset_type', 'kind', 'dimension', 'value']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['computed_on', 'asset_type', 'kind', 'dimension', 'value'],
+                name='core_duesummary_unique_key'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.computed_on} {self.asset_type}.{self.kind} {self.dimension}={self.value}"
@@ -0,0 +1,23 @@
+from rest_framework import serializers
+from .models import DueDate, DueSummary
+
+
+class DueDateSerializer(serializers.ModelSerializer):
+    kind_display = serializers.CharField(source='get_kind_display', read_only=True)
+    overdue = serializers.SerializerMethodField()
+
+    class Meta:
+        model = DueDate
+        fields = [
+            'id', 'asset_type', 'asset_id', 'kind', 'kind_display', 'due_date',
+            'overdue', 'name', 'type', 'location',
+        ]
+
+    def get_overdue(self, obj):
+        return obj.due_date < self.context['today']
+
+
+class DueSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = DueSummary
+        fields = ['asset_type', 'kind', 'dimension', 'value', 'overdue', 'due_soon']
@@ -0,0 +1,21 @@
+from django.dispatch import Signal
+
+# Enviado pelos querysets de inventário (e pelo bulk_create dos logs de
+# segurança) após bulk_create, update e delete em massa, que não disparam
+# post_save/post_delete. Argumentos: sender (modelo), operation ('create',
+# 'update' ou 'delete'), objs (objetos criados, em 'create'), fields e pks
+# (campos alterados e chaves das linhas, em 'update'). ``pks`` só é lido
+# quando o update altera um campo registrado com ``require_pks``; nos demais
+# casos é None e o receptor faz a sincronização completa, se precisar.
+bulk_changed = Signal()
+
+# Modelo -> campos cujo update em massa envia as chaves das linhas
+PK_FIELDS = {}
+
+
+def require_pks(model, fields):
+    PK_FIELDS.setdefault(model, set()).update(fields)
+
+
+def needs_pks(model, fields):
+    return bool(PK_FIELDS.get(model, set()) & set(fields))
@@ -0,0 +1,253 @@
+import datetime
+import threading
+import time
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from devices.models import Device
+from equipment.models import Equipment
+from . import counters
+from . import lookup
+from .lookup import IdentifierIndex
+from .models import DueDate
+
+
+class StatusCounterTest(TestCase):
+    """
+    Os contadores materializados batem com a tabela após cada tipo de escrita.
+    """
+
+    def create(self, serial_number, **fields):
+        return Equipment.objects.create(
+            name='Equipamento', type='tool', model='M', manufacturer='Wayne',
+            serial_number=serial_number, location='Caverna', **fields
+        )
+
+    def assertNoDrift(self):
+        self.assertEqual(counters.drift(Equipment), {})
+
+    def test_create_save_and_delete(self):
+        equipment = self.create('EQ-1')
+        self.create('EQ-2', status='in_use')
+        self.assertEqual(counters.read_counts(Equipment, 'status'), {'available': 1, 'in_use': 1})
+
+        equipment.status = 'maintenance'
+        equipment.save()
+        equipment.type = 'machine'
+        equipment.save(update_fields=['type'])
+        self.assertNoDrift()
+
+        equipment.delete()
+        self.assertEqual(counters.read_counts(Equipment, 'status'), {'in_use': 1})
+        self.assertNoDrift()
+
+    def test_bulk_operations(self):
+        Equipment.objects.bulk_create([
+            Equipment(name='E', type='tool', model='M', manufacturer='Wayne',
+                      serial_number=f'EQ-{index}', location='Caverna')
+            for index in range(5)
+        ])
+        Equipment.objects.filter(serial_number__in=['EQ-0', 'EQ-1']).update(status='retired')
+        Equipment.objects.filter(serial_number='EQ-2').delete()
+        self.assertEqual(counters.read_counts(Equipment, 'status'), {'available': 2, 'retired': 2})
+        self.assertNoDrift()
+
+    def test_save_of_stale_instance(self):
+        equipment = self.create('EQ-1')
+        stale = Equipment.objects.get(pk=equipment.pk)
+
+        # A linha muda por outros caminhos depois que ``stale`` foi carregada
+        equipment.status = 'in_use'
+        equipment.save()
+        Equipment.objects.filter(pk=equipment.pk).update(type='machine')
+
+        stale.status = 'retired'
+        stale.save()
+        self.assertEqual(counters.read_counts(Equipment, 'status'), {'retired': 1})
+        self.assertNoDrift()
+
+    def test_partial_save_of_stale_instance(self):
+        equipment = self.create('EQ-1')
+        stale = Equipment.objects.get(pk=equipment.pk)
+        Equipment.objects.filter(pk=equipment.pk).update(type='machine')
+
+        # ``type`` defasado na instância não é gravado nem contado
+        stale.status = 'maintenance'
+        stale.save(update_fields=['status'])
+        self.assertEqual(counters.read_counts(Equipment, 'type'), {'machine': 1})
+        self.assertNoDrift()
+
+    def test_delete_of_stale_instance(self):
+        equipment = self.create('EQ-1')
+        stale = Equipment.objects.get(pk=equipment.pk)
+        Equipment.objects.filter(pk=equipment.pk).update(status='retired')
+
+        stale.delete()
+        self.assertEqual(counters.read_counts(Equipment, 'status'), {})
+        self.assertNoDrift()
+
+
+class DueCalendarSyncTest(TestCase):
+    """
+    A agenda acompanha as gravações dos ativos sem recriar a tabela.
+    """
+
+    def setUp(self):
+        self.today = timezone.localdate()
+        self.equipment = Equipment.objects.create(
+            name='Gancho', type='tool', model='G1', manufacturer='Wayne', serial_number='EQ-1',
+            location='Caverna', next_maintenance=self.today + datetime.timedelta(days=3),
+        )
+        Device.objects.bulk_create([
+            Device(
+                name=f'Rádio {index}', type='mobile', model='R', manufacturer='Wayne',
+                serial_number=f'DV-{index}', location='Torre',
+                warranty_expiry=self.today + datetime.timedelta(days=index),
+            )
+            for index in range(1, 4)
+        ])
+
+    def entries(self, asset_type):
+        return list(DueDate.objects.filter(asset_type=asset_type).values_list('name', 'kind', 'due_date', 'location'))
+
+    def test_save_without_calendar_changes_skips_writes(self):
+        self.equipment.notes = 'Revisado'
+        with CaptureQueriesContext(connection) as captured:
+            self.equipment.save()
+        writes = [
+            query['sql'] for query in captured.captured_queries
+            if 'core_duedate' in query['sql'] and not query['sql'].startswith('SELECT')
+        ]
+        self.assertEqual(writes, [])
+
+    def test_save_updates_changed_entries(self):
+        entry_id = DueDate.objects.get(asset_type='equipment').pk
+        self.equipment.next_maintenance = self.today
+        self.equipment.warranty_expiry = self.today + datetime.timedelta(days=90)
+        self.equipment.save()
+        self.assertEqual(DueDate.objects.get(asset_type='equipment', kind='maintenance').pk, entry_id)
+        self.assertCountEqual(self.entries('equipment'), [
+            ('Gancho', 'maintenance', self.today, 'Caverna'),
+            ('Gancho', 'warranty', self.today + datetime.timedelta(days=90), 'Caverna'),
+        ])
+
+        self.equipment.next_maintenance = None
+        self.equipment.save()
+        self.assertEqual([kind for _, kind, _, _ in self.entries('equipment')], ['warranty'])
+
+    def test_bulk_update_syncs_only_affected_rows(self):
+        untouched = set(DueDate.objects.exclude(asset_type='device', name='Rádio 1').values_list('pk', flat=True))
+        Device.objects.filter(serial_number='DV-1').update(location='Mansão')
+        self.assertEqual(DueDate.objects.get(name='Rádio 1').location, 'Mansão')
+        self.assertTrue(untouched <= set(DueDate.objects.values_list('pk', flat=True)))
+
+    def test_bulk_update_of_untracked_fields_keeps_calendar(self):
+        before = list(DueDate.objects.values_list('pk', flat=True))
+        with CaptureQueriesContext(connection) as captured:
+            Device.objects.update(status='maintenance')
+        self.assertEqual(list(DueDate.objects.values_list('pk', flat=True)), before)
+        # Nenhum receptor usa as chaves: elas não são lidas
+        self.assertFalse([
+            query for query in captured
+            if query['sql'].startswith('SELECT "devices_device"."id" FROM')
+        ])
+
+    def test_delete_removes_entries(self):
+        Device.objects.filter(serial_number__in=['DV-1', 'DV-2']).delete()
+        self.equipment.delete()
+        self.assertEqual(self.entries('equipment'), [])
+        self.assertEqual([name for name, _, _, _ in self.entries('device')], ['Rádio 3'])
+
+
+class IdentifierIndexTest(TestCase):
+    """
+    Alterações e invalidações que chegam durante um build não se perdem.
+    """
+
+    def setUp(self):
+        self.device = Device.objects.create(
+            name='Rádio', type='mobile', model='R', manufacturer='Wayne',
+            serial_number='SN-0001', location='Torre'
+        )
+
+    def index_with_hook(self, hook):
+        # Executa ``hook`` uma vez, no meio da leitura do banco
+        class HookedIndex(IdentifierIndex):
+            @staticmethod
+            def _insert(tree, entries, by_asset, entry):
+                if hook and entry.value == 'SN-0001':
+                    hook.pop()()
+                IdentifierIndex._insert(tree, entries, by_asset, entry)
+        return HookedIndex()
+
+    def test_changes_during_build_are_replayed(self):
+        hook = []
+        index = self.index_with_hook(hook)
+        self.device.serial_number = 'SN-9999'
+        hook.append(lambda: index.update(self.device))
+        index.build()
+        self.assertEqual([r['value'] for r in index.lookup('SN-9999', max_distance=0)], ['SN-9999'])
+        self.assertEqual(index.lookup('SN-0001', max_distance=0), [])
+
+    def test_invalidation_during_build_keeps_index_stale(self):
+        hook = []
+        index = self.index_with_hook(hook)
+        hook.append(lambda: index.mark_stale('device'))
+        index.build()
+        self.assertTrue(index.ready)
+        self.assertEqual(index.stale, {'device'})
+        # Com o índice carregado, a recarga vai para segundo plano
+        with mock.patch.object(index, 'schedule_build') as schedule:
+            index.ensure_fresh()
+        schedule.assert_called_once_with()
+        index.build()
+        self.assertEqual(index.stale, set())
+
+    def test_changes_before_first_build_are_not_applied_twice(self):
+        index = IdentifierIndex()
+        index.remove('device', self.device.pk)
+        self.assertEqual(index.pending, [])
+        index.build()
+        self.assertEqual(len(index.lookup('SN-0001', max_distance=0)), 1)
+
+    def test_concurrent_requests_build_once(self):
+        builds = []
+
+        class SlowIndex(IdentifierIndex):
+            def _build(self):
+                builds.append(1)
+                time.sleep(0.05)
+                with self._lock:
+                    self.ready = True
+
+        index = SlowIndex()
+        threads = [threading.Thread(target=index.ensure_fresh) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(builds), 1)
+
+    def test_bulk_writes_update_index_without_reload(self):
+        index = IdentifierIndex()
+        index.build()
+        with mock.patch.object(lookup, 'index', index), \
+                mock.patch.object(index, 'schedule_build') as schedule:
+            with self.captureOnCommitCallbacks(execute=True):
+                Device.objects.filter(pk=self.device.pk).update(status='retired')
+            with self.captureOnCommitCallbacks(execute=True):
+                Device.objects.filter(pk=self.device.pk).update(serial_number='SN-7777')
+            with self.captureOnCommitCallbacks(execute=True):
+                Device.objects.bulk_create([Device(
+                    name='Tablet', type='tablet', model='T', manufacturer='Wayne',
+                    serial_number='SN-0002', location='Torre'
+                )])
+        schedule.assert_not_called()
+        self.assertEqual(index.stale, set())
+        self.assertEqual(index.lookup('SN-0001', max_distance=0), [])
+        self.assertEqual(len(index.lookup('SN-7777', max_distance=0)), 1)
+        self.assertEqual(len(index.lookup('SN-0002', max_distance=0)), 1)
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import IdentifierLookupView
+
+urlpatterns = [
+    path('', IdentifierLookupView.as_view(), name='identifier-lookup'),
+]
@@ -0,0 +1,174 @@
+import codecs
+import datetime
+import logging
+import time
+
+from django.conf import settings
+from django.utils import timezone
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import generics, permissions, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from users.permissions import IsAdminOrManager
+from wayne_backend.pagination import DueDatePagination
+from wayne_backend.parsers import CSVParser
+from . import calendar
+from .imports import CSVImporter
+from .lookup import IdentifierIndex, index, normalize
+from .models import DueSummary
+from .serializers import DueDateSerializer, DueSummarySerializer
+
+logger = logging.getLogger(__name__)
+
+
+class IdentifierLookupView(APIView):
+    """
+    Busca aproximada de placas, chassis e números de série.
+
+    Parâmetros: ``q`` (obrigatório), ``max_distance`` (0-3, padrão 2),
+    ``limit`` (até 50, padrão 10) e ``types`` (ex.: ``vehicle,device``).
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        query = request.query_params.get('q', '')
+        if not normalize(query):
+            return Response(
+                {'error': 'Informe o identificador no parâmetro "q".'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            max_distance = min(max(int(request.query_params.get('max_distance', 2)), 0), 3)
+            limit = min(max(int(request.query_params.get('limit', 10)), 1), 50)
+        except ValueError:
+            return Response(
+                {'error': '"max_distance" e "limit" devem ser inteiros.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        types = request.query_params.get('types')
+        asset_types = set(types.split(',')) & set(IdentifierIndex.SOURCES) if types else None
+
+        started = time.perf_counter()
+        results = index.lookup(query, max_distance, limit, asset_types)
+        return Response({
+            'query': query,
+            'normalized': normalize(query),
+            'results': results,
+            'took_ms': round((time.perf_counter() - started) * 1000, 3),
+        })
+
+
+class CSVImportView(APIView):
+    """
+    Importação em massa de ``source`` a partir de um CSV com cabeçalho.
+
+    Aceita o arquivo no campo ``file`` (multipart) ou o corpo ``text/csv``.
+    ``?dry_run=1`` apenas valida e devolve o relatório, sem gravar.
+    """
+    permission_classes = [IsAdminOrManager]
+    parser_classes = [CSVParser, MultiPartParser]
+    source = None
+
+    def post(self, request):
+        if request.content_type.startswith('text/csv'):
+            lines = request.data
+        elif 'file' in request.FILES:
+            lines = codecs.iterdecode(request.FILES['file'], 'utf-8')
+        else:
+            return Response(
+                {'error': 'Envie o CSV no campo "file" ou como corpo text/csv.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        dry_run = request.query_params.get('dry_run') in ('1', 'true')
+        report = CSVImporter(self.source, dry_run=dry_run).run(lines)
+        logger.info(
+            f'Importação de {self.source}: {report.total} linhas, '
+            f'{report.created} criadas, {report.error_count} com erro'
+        )
+
+        if dry_run or not report.error_count:
+            response_status = status.HTTP_200_OK if dry_run else status.HTTP_201_CREATED
+        elif report.created:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response(report.as_dict(), status=response_status)
+
+
+class DueCalendarView(generics.ListAPIView):
+    """
+    Agenda unificada de vencimentos de veículos, equipamentos e dispositivos,
+    em ordem de data, paginada por cursor sobre o índice (data, id).
+
+    Parâmetros: ``days`` (janela a partir de hoje, padrão
+    ``DUE_CALENDAR['HORIZON_DAYS']``) ou ``until`` (AAAA-MM-DD);
+    ``overdue=0`` omite os já vencidos. Filtros: ``asset_type``, ``kind``,
+    ``type`` e ``location``.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = DueDateSerializer
+    pagination_class = DueDatePagination
+    # Sem busca/ordenação livres: a ordem é sempre a do índice
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['asset_type', 'kind', 'type', 'location']
+
+    def get_queryset(self):
+        today = timezone.localdate()
+        return calendar.due_queryset(
+            until=self.get_until(today),
+            overdue=self.request.query_params.get('overdue') not in ('0', 'false'),
+            today=today,
+        )
+
+    def get_until(self, today):
+        params = self.request.query_params
+        config = settings.DUE_CALENDAR
+        if 'until' in params:
+            try:
+                return datetime.date.fromisoformat(params['until'])
+            except ValueError:
+                raise ValidationError({'until': ['Use o formato AAAA-MM-DD.']})
+        try:
+            days = int(params.get('days', config['HORIZON_DAYS']))
+        except ValueError:
+            raise ValidationError({'days': ['Informe um número inteiro de dias.']})
+        days = max(0, min(days, config['MAX_DAYS']))
+        return today + datetime.timedelta(days=days)
+
+    def get_serializer_context(self):
+        return {**super().get_serializer_context(), 'today': timezone.localdate()}
+
+
+class DueSummaryView(APIView):
+    """
+    Resumo de vencimentos por local e por tipo de ativo, do cálculo diário
+    mais recente (``manage.py precompute_due_summary``). ``?date=AAAA-MM-DD``
+    consulta um dia anterior e ``?dimension=location|type`` filtra a dimensão.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        computed_on = request.query_params.get('date')
+        if computed_on:
+            try:
+                computed_on = datetime.date.fromisoformat(computed_on)
+            except ValueError:
+                return Response(
+                    {'error': '"date" deve estar no formato AAAA-MM-DD.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        else:
+            computed_on = DueSummary.objects.order_by('-computed_on') \
+                .values_list('computed_on', flat=True).first()
+
+        summaries = DueSummary.objects.filter(computed_on=computed_on)
+        dimension = request.query_params.get('dimension')
+        if dimension:
+            summaries = summaries.filter(dimension=dimension)
+        return Response({
+            'computed_on': computed_on,
+            'results': DueSummarySerializer(summaries, many=True).data,
+        })
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.10 on 2026-10-18 14:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='device',
+            name='os',
+            field=models.CharField(blank=True, db_index=True, max_length=50, verbose_name='Sistema Operacional'),
+        ),
+        migrations.AlterField(
+            model_name='device',
+            name='status',
+            field=models.CharField(choices=[('active', 'Ativo'), ('inactive', 'Inativo'), ('maintenance', 'Em Manutenção'), ('retired', 'Aposentado')], db_index=True, default='active', max_length=20, verbose_name='Status'),
+        ),
+        migrations.AlterField(
+            model_name='device',
+            name='type',
+            field=models.CharField(choices=[('mobile', 'Dispositivo Móvel'), ('desktop', 'Computador Desktop'), ('laptop', 'Notebook'), ('tablet', 'Tablet'), ('printer', 'Impressora'), ('network', 'Equipamento de Rede'), ('other', 'Outro')], db_index=True, max_length=20, verbose_name='Tipo'),
+        ),
+    ]
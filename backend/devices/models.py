@@ -1,7 +1,10 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
+from core.counters import CountedModel
+
+class Device(CountedModel):
+    counter_dimensions = ('status', 'type')
 
-class Device(models.Model):
     STATUS_CHOICES = [
         ('active', _('Ativo')),
         ('inactive', _('Inativo')),
@@ -20,14 +23,14 @@ class Device(models.Model):
     ]
 
     name = models.CharField(_('Nome'), max_length=100)
-    type = models.CharField(_('Tipo'), max_length=20, choices=DEVICE_TYPES)
+    type = models.CharField(_('Tipo'), max_length=20, choices=DEVICE_TYPES, db_index=True)
     model = models.CharField(_('Modelo'), max_length=100)
     manufacturer = models.CharField(_('Fabricante'), max_length=100)
     serial_number = models.CharField(_('Número de Série'), max_length=50, unique=True)
-    status = models.CharField(_('Status'), max_length=20, choices=STATUS_CHOICES, default='active')
+    status = models.CharField(_('Status'), max_length=20, choices=STATUS_CHOICES, default='active', db_index=True)
     ip_address = models.GenericIPAddressField(_('Endereço IP'), null=True, blank=True)
     mac_address = models.CharField(_('Endereço MAC'), max_length=17, blank=True)
-    os = models.CharField(_('Sistema Operacional'), max_length=50, blank=True)
+    os = models.CharField(_('Sistema Operacional'), max_length=50, blank=True, db_index=True)
     os_version = models.CharField(_('Versão do SO'), max_length=50, blank=True)
     purchase_date = models.DateField(_('Data de Compra'), null=True, blank=True)
     warranty_expiry = models.DateField(_('Fim da Garantia'), null=True, blank=True)
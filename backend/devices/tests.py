@@ -1,3 +1,99 @@
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from core.counters import read_counts
+from core.imports import CSVImporter
+from users.models import User
+from .models import Device
+
+HEADER = 'name,type,model,manufacturer,serial_number,status,ip_address,location\n'
+
+
+def csv_rows(*rows):
+    return HEADER + ''.join(f'{row}\n' for row in rows)
+
+
+class DeviceImportTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('lucius', password='x', user_type='manager')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        Device.objects.create(
+            name='Servidor', type='desktop', model='R1', manufacturer='Wayne',
+            serial_number='SN-0', location='Torre'
+        )
+
+    def post_csv(self, content, dry_run=False):
+        query = '?dry_run=1' if dry_run else ''
+        return self.client.generic(
+            'POST', f'/api/devices/import/{query}', content.encode('utf-8'), content_type='text/csv'
+        )
+
+    def test_import_creates_rows_and_counters(self):
+        response = self.post_csv(csv_rows(
+            'Notebook A,laptop,X1,Wayne,SN-1,active,10.0.0.1,Torre',
+            'Tablet B,tablet,T2,Wayne,SN-2,maintenance,,Caverna',
+        ))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['errors'], [])
+        device = Device.objects.get(serial_number='SN-2')
+        self.assertIsNone(device.ip_address)
+        self.assertEqual(read_counts(Device, 'type'), {'desktop': 1, 'laptop': 1, 'tablet': 1})
+
+    def test_multipart_file(self):
+        upload = SimpleUploadedFile(
+            'devices.csv',
+            ('\ufeff' + csv_rows('Notebook A,laptop,X1,Wayne,SN-1,active,,Torre')).encode('utf-8'),
+            content_type='text/csv'
+        )
+        response = self.client.post('/api/devices/import/', {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Device.objects.filter(serial_number='SN-1').exists())
+
+    def test_dry_run_does_not_write(self):
+        response = self.post_csv(csv_rows('Notebook A,laptop,X1,Wayne,SN-1,active,,Torre'), dry_run=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['valid'], 1)
+        self.assertEqual(response.data['created'], 0)
+        self.assertFalse(Device.objects.filter(serial_number='SN-1').exists())
+
+    def test_partial_import_reports_rows(self):
+        response = self.post_csv(csv_rows(
+            'Notebook A,laptop,X1,Wayne,SN-1,active,,Torre',
+            'Celular,pager,P1,Wayne,SN-2,active,,Torre',
+            'Servidor 2,desktop,R1,Wayne,SN-0,active,,Torre',
+            'Notebook B,laptop,X1,Wayne,SN-1,active,,Torre',
+        ))
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual(response.data['error_count'], 3)
+        errors = {error['row']: error['errors'] for error in response.data['errors']}
+        self.assertEqual(sorted(errors), [3, 4, 5])
+        self.assertIn('type', errors[3])
+        self.assertEqual(errors[4]['serial_number'], ['Já existe um registro com este valor.'])
+        self.assertEqual(errors[5]['serial_number'], ['Valor repetido em outra linha do arquivo.'])
+
+    def test_all_rows_invalid(self):
+        response = self.post_csv(csv_rows('Servidor 2,desktop,R1,Wayne,SN-0,active,,Torre'))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['created'], 0)
+        self.assertEqual(Device.objects.count(), 1)
+
+    def test_duplicates_across_batches(self):
+        lines = csv_rows(
+            'A,laptop,X1,Wayne,SN-1,active,,Torre',
+            'B,laptop,X1,Wayne,SN-2,active,,Torre',
+            'C,laptop,X1,Wayne,SN-1,active,,Torre',
+        ).splitlines(keepends=True)
+        report = CSVImporter('devices', batch_size=2).run(lines)
+        self.assertEqual((report.total, report.created, report.error_count), (3, 2, 1))
+        self.assertEqual(report.errors[0]['row'], 4)
+
+    def test_requires_manager(self):
+        self.client.force_authenticate(User.objects.create_user('alfred', password='x'))
+        response = self.post_csv(csv_rows('Notebook A,laptop,X1,Wayne,SN-1,active,,Torre'))
+        self.assertEqual(response.status_code, 403)
@@ -1,7 +1,11 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
+from core.views import CSVImportView
 from .views import DeviceViewSet
 
 router = DefaultRouter()
 router.register('', DeviceViewSet)
 
-urlpatterns = router.urls 
\ No newline at end of file
+urlpatterns = [
+    path('import/', CSVImportView.as_view(source='devices'), name='device-import'),
+] + router.urls 
\ No newline at end of file
@@ -3,10 +3,15 @@ from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 from .models import Device
 from .serializers import DeviceSerializer
+from wayne_backend.bulk import BulkUpdateMixin
+from wayne_backend.conditional import ConditionalGetMixin
+from wayne_backend.fastread import FastReadMixin
+from wayne_backend.response_cache import ResponseCacheMixin
+from wayne_backend.streaming import StreamingListMixin
 
 # Create your views here.
 
-class DeviceViewSet(viewsets.ModelViewSet):
+class DeviceViewSet(BulkUpdateMixin, StreamingListMixin, ResponseCacheMixin, ConditionalGetMixin, FastReadMixin, viewsets.ModelViewSet):
     queryset = Device.objects.all()
     serializer_class = DeviceSerializer
     permission_classes = [IsAuthenticated]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.10 on 2026-10-18 14:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('equipment', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='equipment',
+            name='status',
+            field=models.CharField(choices=[('available', 'Disponível'), ('in_use', 'Em Uso'), ('maintenance', 'Em Manutenção'), ('retired', 'Aposentado')], db_index=True, default='available', max_length=20, verbose_name='Status'),
+        ),
+        migrations.AlterField(
+            model_name='equipment',
+            name='type',
+            field=models.CharField(choices=[('tool', 'Ferramenta'), ('machine', 'Máquina'), ('safety', 'Equipamento de Segurança'), ('electronic', 'Equipamento Eletrônico'), ('other', 'Outro')], db_index=True, max_length=20, verbose_name='Tipo'),
+        ),
+    ]
@@ -1,7 +1,10 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
+from core.counters import CountedModel
+
+class Equipment(CountedModel):
+    counter_dimensions = ('status', 'type')
 
-class Equipment(models.Model):
     STATUS_CHOICES = [
         ('available', _('Disponível')),
         ('in_use', _('Em Uso')),
@@ -18,11 +21,11 @@ class Equipment(models.Model):
     ]
 
     name = models.CharField(_('Nome'), max_length=100)
-    type = models.CharField(_('Tipo'), max_length=20, choices=EQUIPMENT_TYPES)
+    type = models.CharField(_('Tipo'), max_length=20, choices=EQUIPMENT_TYPES, db_index=True)
     model = models.CharField(_('Modelo'), max_length=100)
     manufacturer = models.CharField(_('Fabricante'), max_length=100)
     serial_number = models.CharField(_('Número de Série'), max_length=50, unique=True)
-    status = models.CharField(_('Status'), max_length=20, choices=STATUS_CHOICES, default='available')
+    status = models.CharField(_('Status'), max_length=20, choices=STATUS_CHOICES, default='available', db_index=True)
     purchase_date = models.DateField(_('Data de Compra'), null=True, blank=True)
     warranty_expiry = models.DateField(_('Fim da Garantia'), null=True, blank=True)
     last_maintenance = models.DateField(_('Última Manutenção'), null=True, blank=True)
@@ -1,3 +1,69 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from users.models import User
+from .models import Equipment
+
+
+class EquipmentBulkUpdateTest(TestCase):
+    """
+    PATCH /api/equipment/bulk/ altera só o conjunto filtrado.
+    """
+
+    def setUp(self):
+        for index, equipment_type in enumerate(['tool', 'tool', 'machine']):
+            Equipment.objects.create(
+                name=f'Equipamento {index}', type=equipment_type, model='M', manufacturer='Wayne',
+                serial_number=f'EQ-{index}', location='Caverna'
+            )
+        user = User.objects.create_user('gerente', password='x', user_type='manager')
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+
+    def patch(self, query, data):
+        return self.client.patch(f'/api/equipment/bulk/{query}', data, format='json')
+
+    def statuses(self):
+        return dict(Equipment.objects.values_list('serial_number', 'status'))
+
+    def test_updates_filtered_rows(self):
+        response = self.patch('?type=tool', {'changes': {'status': 'maintenance'}})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['updated'], 2)
+        self.assertEqual(self.statuses(), {
+            'EQ-0': 'maintenance', 'EQ-1': 'maintenance', 'EQ-2': 'available',
+        })
+
+    def test_updates_listed_ids(self):
+        pk = Equipment.objects.get(serial_number='EQ-2').pk
+        response = self.patch('', {'ids': [pk, 999999], 'changes': {'status': 'retired'}})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['updated'], 1)
+        self.assertEqual(response.data['not_found'], [999999])
+        self.assertEqual(self.statuses()['EQ-2'], 'retired')
+
+    def test_refuses_without_filters(self):
+        response = self.patch('', {'changes': {'status': 'retired'}})
+        self.assertEqual(response.status_code, 400)
+        response = self.patch('?type=', {'changes': {'status': 'retired'}})
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn('retired', self.statuses().values())
+
+    def test_refuses_unknown_params(self):
+        for query in ('?stauts=available', '?layout=columnar', '?fields=name'):
+            response = self.patch(query, {'changes': {'status': 'retired'}})
+            self.assertEqual(response.status_code, 400, query)
+        self.assertNotIn('retired', self.statuses().values())
+
+    def test_refuses_invalid_filter_value(self):
+        response = self.patch('?status=quebrado', {'changes': {'status': 'retired'}})
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn('retired', self.statuses().values())
+
+    def test_refuses_unique_fields(self):
+        response = self.patch('?type=tool', {'changes': {'serial_number': 'DUP'}})
+        self.assertEqual(response.status_code, 400)
+
+    def test_updates_all_when_explicit(self):
+        response = self.patch('', {'all': True, 'changes': {'location': 'Torre'}})
+        self.assertEqual(response.data['updated'], 3)
@@ -1,7 +1,11 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
+from core.views import CSVImportView
 from .views import EquipmentViewSet
 
 router = DefaultRouter()
 router.register('', EquipmentViewSet)
 
-urlpatterns = router.urls 
\ No newline at end of file
+urlpatterns = [
+    path('import/', CSVImportView.as_view(source='equipment'), name='equipment-import'),
+] + router.urls 
\ No newline at end of file
@@ -4,13 +4,18 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from .models import Equipment
 from .serializers import EquipmentSerializer
+from wayne_backend.bulk import BulkUpdateMixin
+from wayne_backend.conditional import ConditionalGetMixin
+from wayne_backend.fastread import FastReadMixin
+from wayne_backend.response_cache import ResponseCacheMixin
+from wayne_backend.streaming import StreamingListMixin
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Create your views here.
 
-class EquipmentViewSet(viewsets.ModelViewSet):
+class EquipmentViewSet(BulkUpdateMixin, StreamingListMixin, ResponseCacheMixin, ConditionalGetMixin, FastReadMixin, viewsets.ModelViewSet):
     queryset = Equipment.objects.all()
     serializer_class = EquipmentSerializer
     permission_classes = [IsAuthenticated]
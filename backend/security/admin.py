@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
-from .models import SecurityIncident, SecurityLog
+from .models import ExportJob, SecurityIncident, SecurityLog
 
 @admin.register(SecurityIncident)
 class SecurityIncidentAdmin(admin.ModelAdmin):
@@ -45,3 +45,12 @@ class SecurityLogAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'dataset', 'format', 'status', 'row_count', 'duration_ms', 'requested_by', 'created_at')
+    list_filter = ('dataset', 'format', 'status')
+    readonly_fields = (
+        'filter_hash', 'file_path', 'row_count', 'size_bytes', 'duration_ms',
+        'error', 'created_at', 'started_at', 'finished_at'
+    )
@@ -1,6 +1,22 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate, post_save
+
+
+def install_search_index(sender, using, **kwargs):
+    from django.db import connections
+    from . import search
+    search.install(connections[using])
 
 
 class SecurityConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'security'
+
+    def ready(self):
+        # Migrações que recriam as tabelas no SQLite descartam os triggers do FTS
+        post_migrate.connect(install_search_index, sender=self)
+
+        from . import live
+        from .models import SecurityIncident, SecurityLog
+        post_save.connect(live.handle_log_saved, sender=SecurityLog)
+        post_save.connect(live.handle_incident_saved, sender=SecurityIncident)
@@ -0,0 +1,254 @@
+"""
+Exportações em segundo plano do histórico de segurança.
+
+``submit`` valida os filtros, reaproveita uma exportação igual (mesmo
+conjunto, formato e filtros) ainda válida e, se não houver, cria o job e
+dispara um processo worker (``manage.py run_export_worker --job``), desde que
+haja menos de ``MAX_WORKERS`` jobs em execução; senão o job fica na fila e é
+pego pelo próximo worker que terminar. O worker lê as linhas em blocos com
+``.iterator()``, grava um arquivo gzip em ``SECURITY_EXPORTS['DIRECTORY']``,
+registra linhas, tamanho e duração e, ao esvaziar a fila, remove as
+exportações expiradas.
+"""
+import csv
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.encoders import JSONEncoder
+from wayne_backend.fastread import get_plan
+
+from .filters import SecurityIncidentExportFilter, SecurityLogExportFilter
+from .models import ExportJob, SecurityIncident, SecurityLog
+from .serializers import SecurityIncidentSerializer, SecurityLogSerializer
+
+logger = logging.getLogger(__name__)
+
+# Conjunto -> (modelo, filterset, serializer)
+DATASETS = {
+    'logs': (SecurityLog, SecurityLogExportFilter, SecurityLogSerializer),
+    'incidents': (SecurityIncident, SecurityIncidentExportFilter, SecurityIncidentSerializer),
+}
+
+
+def options():
+    return settings.SECURITY_EXPORTS
+
+
+def normalize_filters(dataset, data):
+    """
+    Valida os filtros pelo filterset do conjunto e retorna apenas os
+    preenchidos, como strings e em ordem estável.
+    """
+    _, filterset_class, _ = DATASETS[dataset]
+    unknown = set(data) - set(filterset_class.base_filters)
+    if unknown:
+        raise ValidationError({'filters': [f'Filtro não suportado: {name}' for name in sorted(unknown)]})
+    filterset = filterset_class(data=data, queryset=filterset_class._meta.model.objects.none())
+    if not filterset.is_valid():
+        raise ValidationError({'filters': filterset.errors})
+    normalized = {}
+    for name, value in sorted(filterset.form.cleaned_data.items()):
+        if value in (None, ''):
+            continue
+        normalized[name] = value.isoformat() if hasattr(value, 'isoformat') else str(value)
+    return normalized
+
+
+def filter_hash(dataset, fmt, filters):
+    raw = json.dumps([dataset, fmt, filters], sort_keys=True)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def find_reusable(digest):
+    """
+    Exportação com o mesmo hash criada (se em andamento) ou concluída (com o
+    arquivo ainda em disco) há menos de ``REUSE_SECONDS``.
+    """
+    cutoff = timezone.now() - timedelta(seconds=options()['REUSE_SECONDS'])
+    jobs = ExportJob.objects.filter(filter_hash=digest)
+    # Jobs parados há mais tempo que a janela (worker interrompido) não bloqueiam novos
+    job = jobs.filter(status__in=['pending', 'running'], created_at__gte=cutoff).first()
+    if job is not None:
+        return job
+    for job in jobs.filter(status='done', finished_at__gte=cutoff).order_by('-finished_at'):
+        if job.file_path and os.path.exists(job.file_path):
+            return job
+    return None
+
+
+def submit(dataset, fmt, data, user=None):
+    """
+    Retorna (job, reaproveitado).
+    """
+    filters = normalize_filters(dataset, data)
+    digest = filter_hash(dataset, fmt, filters)
+    job = find_reusable(digest)
+    if job is not None:
+        return job, True
+
+    job = ExportJob.objects.create(
+        dataset=dataset,
+        format=fmt,
+        filters=filters,
+        filter_hash=digest,
+        requested_by=user if user and user.is_authenticated else None
+    )
+    if options()['SPAWN_WORKER'] and running_count() < options()['MAX_WORKERS']:
+        spawn_worker(job)
+    return job, False
+
+
+def running_count():
+    # Jobs parados há mais tempo que a janela (worker interrompido) não ocupam vaga
+    cutoff = timezone.now() - timedelta(seconds=options()['REUSE_SECONDS'])
+    return ExportJob.objects.filter(status='running', started_at__gte=cutoff).count()
+
+
+def spawn_worker(job):
+    """
+    Executa o job em um processo separado, desligado da requisição.
+    """
+    subprocess.Popen(
+        [sys.executable, str(Path(settings.BASE_DIR) / 'manage.py'), 'run_export_worker', '--job', str(job.pk)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=True,
+        start_new_session=True
+    )
+
+
+def claim(job_id=None):
+    """
+    Marca um job pendente como em execução. Retorna o job ou None se outro
+    worker já o pegou.
+    """
+    pending = ExportJob.objects.filter(status='pending')
+    if job_id is not None:
+        pending = pending.filter(pk=job_id)
+    job = pending.order_by('created_at').first()
+    if job is None:
+        return None
+    claimed = ExportJob.objects.filter(pk=job.pk, status='pending').update(
+        status='running',
+        started_at=timezone.now()
+    )
+    if not claimed:
+        return None
+    job.refresh_from_db()
+    return job
+
+
+def queryset_for(job):
+    model, filterset_class, _ = DATASETS[job.dataset]
+    queryset = model.objects.order_by('pk')
+    return filterset_class(data=job.filters, queryset=queryset).qs
+
+
+def iter_rows(job):
+    """
+    Linhas serializadas como na API, lidas em blocos de ``CHUNK_SIZE``.
+    """
+    _, _, serializer_class = DATASETS[job.dataset]
+    queryset = queryset_for(job)
+    chunk_size = options()['CHUNK_SIZE']
+    plan = get_plan(serializer_class)
+    if plan is not None:
+        yield from plan.iter_render(queryset.values(*plan.columns).iterator(chunk_size=chunk_size))
+        return
+    serializer = serializer_class()
+    for instance in queryset.iterator(chunk_size=chunk_size):
+        yield serializer.to_representation(instance)
+
+
+def _write_csv(handle, rows, fields):
+    writer = csv.writer(handle)
+    writer.writerow(fields)
+    count = 0
+    for row in rows:
+        writer.writerow(['' if row[name] is None else row[name] for name in fields])
+        count += 1
+    return count
+
+
+def _write_ndjson(handle, rows):
+    encoder = JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    count = 0
+    for row in rows:
+        handle.write(encoder.encode(row))
+        handle.write('\n')
+        count += 1
+    return count
+
+
+def run(job):
+    """
+    Gera o arquivo do job (já marcado como em execução).
+    """
+    directory = Path(options()['DIRECTORY'])
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f'security-{job.dataset}-{job.pk}.{job.format}.gz'
+    partial = path.with_suffix('.part')
+    started = time.perf_counter()
+    try:
+        _, _, serializer_class = DATASETS[job.dataset]
+        with gzip.open(partial, 'wb') as raw:
+            handle = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+            if job.format == 'csv':
+                fields = [
+                    name for name, field in serializer_class().fields.items()
+                    if not field.write_only
+                ]
+                count = _write_csv(handle, iter_rows(job), fields)
+            else:
+                count = _write_ndjson(handle, iter_rows(job))
+            handle.flush()
+            handle.detach()
+        os.replace(partial, path)
+    except Exception as e:
+        logger.error(f'Erro na exportação {job.pk}: {str(e)}')
+        if partial.exists():
+            partial.unlink()
+        job.status = 'failed'
+        job.error = str(e)
+        job.finished_at = timezone.now()
+        job.duration_ms = int((time.perf_counter() - started) * 1000)
+        job.save(update_fields=['status', 'error', 'finished_at', 'duration_ms'])
+        return job
+
+    job.status = 'done'
+    job.file_path = str(path)
+    job.row_count = count
+    job.size_bytes = path.stat().st_size
+    job.finished_at = timezone.now()
+    job.duration_ms = int((time.perf_counter() - started) * 1000)
+    job.save(update_fields=['status', 'file_path', 'row_count', 'size_bytes', 'finished_at', 'duration_ms'])
+    logger.info(f'Exportação {job.pk} concluída: {count} linhas em {job.duration_ms} ms')
+    return job
+
+
+def purge_expired(now=None):
+    """
+    Remove arquivos e registros de exportações mais antigas que ``RETENTION_DAYS``.
+    """
+    cutoff = (now or timezone.now()) - timedelta(days=options()['RETENTION_DAYS'])
+    expired = ExportJob.objects.filter(created_at__lt=cutoff).exclude(status='running')
+    removed = 0
+    for job in expired.only('pk', 'file_path').iterator():
+        if job.file_path and os.path.exists(job.file_path):
+            os.remove(job.file_path)
+        removed += 1
+    expired.delete()
+    return removed
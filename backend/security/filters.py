@@ -0,0 +1,43 @@
+import django_filters
+from .models import SecurityIncident, SecurityLog
+
+
+class SecurityLogFilter(django_filters.FilterSet):
+    """
+    Filtros dos logs de segurança. ``since``/``until`` restringem a consulta
+    aos buckets de tempo da janela pedida.
+    """
+    since = django_filters.IsoDateTimeFilter(method='filter_window')
+    until = django_filters.IsoDateTimeFilter(method='filter_window')
+
+    class Meta:
+        model = SecurityLog
+        fields = ['event_type']
+
+    def filter_window(self, queryset, name, value):
+        if name == 'since':
+            return queryset.between(start=value)
+        return queryset.between(end=value)
+
+
+class SecurityLogExportFilter(SecurityLogFilter):
+    """
+    Filtros aceitos nas exportações de logs.
+    """
+
+    class Meta:
+        model = SecurityLog
+        fields = ['event_type', 'user', 'location', 'device_id']
+
+
+class SecurityIncidentExportFilter(django_filters.FilterSet):
+    """
+    Filtros aceitos nas exportações de incidentes; ``since``/``until`` usam
+    a data do relato.
+    """
+    since = django_filters.IsoDateTimeFilter(field_name='reported_at', lookup_expr='gte')
+    until = django_filters.IsoDateTimeFilter(field_name='reported_at', lookup_expr='lt')
+
+    class Meta:
+        model = SecurityIncident
+        fields = ['severity', 'status', 'location', 'reported_by']
@@ -0,0 +1,360 @@
+"""
+Feed ao vivo (Server-Sent Events) de logs e incidentes de segurança.
+
+Logs e incidentes novos e mudanças de status de incidentes são publicados no
+``Broker`` deste processo após o commit. O broker serializa cada evento uma
+única vez e o entrega às assinaturas interessadas, cada uma com uma fila
+limitada (``SECURITY_LIVE['QUEUE_SIZE']``). As conexões são corrotinas no
+event loop do servidor ASGI, sem uma thread por cliente; a publicação, que
+acontece em threads de requisição ou do pipeline de logs, chega a cada loop
+com um único ``call_soon_threadsafe``.
+
+O ``id`` de cada evento é a posição do cliente no banco: último log, último
+incidente e instante da última mudança de status entregues
+(``<log>.<incidente>.<ms>``). Ao reconectar com ``Last-Event-ID`` (ou
+``?last_event_id=``), as linhas posteriores são lidas do banco e enviadas
+antes dos eventos ao vivo; o mesmo acontece quando a fila da assinatura
+transborda. Se houver mais que ``REPLAY_LIMIT`` linhas de um tipo, o cliente
+recebe um evento ``dropped`` com a quantidade não reenviada.
+
+Filtros por assinatura: ``kinds`` (log, incident, incident_status),
+``severity`` (incidentes) e ``event_type`` (logs). Sem assinaturas, nada é
+serializado.
+"""
+import asyncio
+import datetime
+import secrets
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from wayne_backend.renderers import dumps
+
+KINDS = ('log', 'incident', 'incident_status')
+TICKET_KEY = 'security:live:ticket:{}'
+
+
+def options():
+    return settings.SECURITY_LIVE
+
+
+def timestamp_ms(value):
+    return int(value.timestamp() * 1000)
+
+
+class Position:
+    """
+    Posição de um cliente no feed: maior pk de log e de incidente entregues e
+    instante (ms) da última mudança de status entregue.
+    """
+    __slots__ = ('log', 'incident', 'status')
+
+    def __init__(self, log=0, incident=0, status=0):
+        self.log, self.incident, self.status = log, incident, status
+
+    @classmethod
+    def parse(cls, value):
+        try:
+            log, incident, status = (int(part) for part in value.split('.'))
+        except (AttributeError, ValueError):
+            return None
+        return cls(log, incident, status)
+
+    @classmethod
+    def current(cls):
+        from .models import SecurityIncident, SecurityLog
+        return cls(
+            SecurityLog.objects.order_by('-pk').values_list('pk', flat=True).first() or 0,
+            SecurityIncident.objects.order_by('-pk').values_list('pk', flat=True).first() or 0,
+            timestamp_ms(timezone.now()),
+        )
+
+    def advance(self, event):
+        if event.kind == 'log':
+            self.log = max(self.log, event.pk)
+        elif event.kind == 'incident':
+            self.incident = max(self.incident, event.pk)
+        else:
+            self.status = max(self.status, event.stamp)
+
+    def __str__(self):
+        return f'{self.log}.{self.incident}.{self.status}'
+
+
+class Event:
+    __slots__ = ('pk', 'kind', 'stamp', 'severity', 'event_type', 'body')
+
+    def __init__(self, pk, kind, data, stamp=None, severity=None, event_type=None):
+        self.pk = pk
+        self.kind = kind
+        self.stamp = stamp
+        self.severity = severity
+        self.event_type = event_type
+        # Formato SSE pronto (sem o id, que é a posição de cada cliente),
+        # compartilhado por todas as assinaturas
+        self.body = f'event: {kind}\ndata: {dumps(data).rstrip()}\n\n'
+
+    @property
+    def key(self):
+        # Um incidente tem um evento de criação e vários de status
+        return (self.kind, self.pk, self.stamp if self.kind == 'incident_status' else None)
+
+
+class Subscriber:
+    def __init__(self, loop, kinds=None, severities=None, event_types=None, queue_size=100):
+        self.loop = loop
+        self.kinds = set(kinds or KINDS)
+        self.severities = set(severities or ())
+        self.event_types = set(event_types or ())
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def matches(self, event):
+        if event.kind not in self.kinds:
+            return False
+        if event.kind == 'log':
+            return not self.event_types or event.event_type in self.event_types
+        return not self.severities or event.severity in self.severities
+
+    def offer(self, event):
+        # Chamado no loop da assinatura; descarta o mais antigo se a fila encheu
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+
+class Broker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        # loop -> assinaturas; cada conjunto só é alterado no próprio loop
+        self._loops = {}
+        self._stats = {'published': 0, 'delivered': 0, 'dropped': 0}
+
+    def subscribe(self, **filters):
+        loop = asyncio.get_running_loop()
+        subscriber = Subscriber(loop, queue_size=options()['QUEUE_SIZE'], **filters)
+        with self._lock:
+            self._loops.setdefault(loop, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            subscribers = self._loops.get(subscriber.loop)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._loops[subscriber.loop]
+        self.record_dropped(subscriber)
+
+    def record_dropped(self, subscriber):
+        dropped, subscriber.dropped = subscriber.dropped, 0
+        if dropped:
+            with self._lock:
+                self._stats['dropped'] += dropped
+        return dropped
+
+    def has_subscribers(self):
+        return bool(self._loops)
+
+    def publish(self, kind, items):
+        """
+        Publica (pk, instante, dados, severidade, tipo de evento) para cada item.
+        """
+        events = [
+            Event(pk, kind, data, stamp, severity, event_type)
+            for pk, stamp, data, severity, event_type in items
+        ]
+        if not events:
+            return
+        with self._lock:
+            self._stats['published'] += len(events)
+            loops = list(self._loops)
+        for loop in loops:
+            try:
+                loop.call_soon_threadsafe(self._dispatch, loop, events)
+            except RuntimeError:
+                # Loop encerrado sem cancelar as assinaturas
+                with self._lock:
+                    self._loops.pop(loop, None)
+
+    def _dispatch(self, loop, events):
+        delivered = 0
+        for subscriber in list(self._loops.get(loop, ())):
+            for event in events:
+                if subscriber.matches(event):
+                    subscriber.offer(event)
+                    delivered += 1
+        with self._lock:
+            self._stats['delivered'] += delivered
+
+    def metrics(self):
+        with self._lock:
+            return {**self._stats, 'subscribers': sum(len(s) for s in self._loops.values())}
+
+
+broker = Broker()
+
+
+def publish_logs(logs):
+    """
+    Publica logs recém-criados (inclusive por ``bulk_create``) após o commit.
+    """
+    if not broker.has_subscribers():
+        return
+    from .serializers import SecurityLogSerializer
+    serializer = SecurityLogSerializer()
+    items = [(log.pk, None, serializer.to_representation(log), None, log.event_type) for log in logs]
+    transaction.on_commit(lambda: broker.publish('log', items))
+
+
+def handle_log_saved(sender, instance, created, **kwargs):
+    if created:
+        publish_logs([instance])
+
+
+def handle_incident_saved(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_loaded_status', None)
+    if not created and previous == instance.status:
+        return
+    instance._loaded_status = instance.status
+    if not broker.has_subscribers():
+        return
+    from .serializers import SecurityIncidentSerializer
+    data = SecurityIncidentSerializer(instance).data
+    if created:
+        kind = 'incident'
+    else:
+        kind = 'incident_status'
+        data['previous_status'] = previous
+    item = (instance.pk, timestamp_ms(instance.updated_at), data, instance.severity, None)
+    transaction.on_commit(lambda: broker.publish(kind, [item]))
+
+
+def issue_ticket(user):
+    """
+    Ticket de uso único para abrir o feed no navegador (o EventSource não
+    envia cabeçalhos), válido por ``TICKET_TTL`` segundos.
+    """
+    ticket = secrets.token_urlsafe(24)
+    cache.set(TICKET_KEY.format(ticket), user.pk, options()['TICKET_TTL'])
+    return ticket
+
+
+def redeem_ticket(ticket):
+    """
+    Consome o ticket e retorna o id do usuário, ou None se inválido/expirado.
+    """
+    key = TICKET_KEY.format(ticket)
+    user_id = cache.get(key)
+    # Só quem remove a chave usa o ticket
+    if user_id is None or not cache.delete(key):
+        return None
+    return user_id
+
+
+def replay(subscriber, position):
+    """
+    Lê do banco os eventos posteriores a ``position`` que a assinatura
+    aceita. Retorna (eventos, quantidade não reenviada por exceder o limite).
+    """
+    from .models import SecurityIncident, SecurityLog
+    from .serializers import SecurityIncidentSerializer, SecurityLogSerializer
+    limit = options()['REPLAY_LIMIT']
+    events, skipped = [], 0
+
+    def take(queryset):
+        nonlocal skipped
+        rows = list(queryset[:limit + 1])
+        if len(rows) > limit:
+            skipped += queryset.count() - limit
+            rows = rows[:limit]
+        return rows
+
+    if 'log' in subscriber.kinds:
+        logs = SecurityLog.objects.filter(pk__gt=position.log).order_by('pk')
+        if subscriber.event_types:
+            logs = logs.filter(event_type__in=subscriber.event_types)
+        serializer = SecurityLogSerializer()
+        events += [
+            Event(log.pk, 'log', serializer.to_representation(log), event_type=log.event_type)
+            for log in take(logs)
+        ]
+
+    incidents = SecurityIncident.objects.all()
+    if subscriber.severities:
+        incidents = incidents.filter(severity__in=subscriber.severities)
+    serializer = SecurityIncidentSerializer()
+    if 'incident' in subscriber.kinds:
+        events += [
+            Event(incident.pk, 'incident', serializer.to_representation(incident), severity=incident.severity)
+            for incident in take(incidents.filter(pk__gt=position.incident).order_by('pk'))
+        ]
+    if 'incident_status' in subscriber.kinds and position.status:
+        since = datetime.datetime.fromtimestamp(position.status / 1000, tz=datetime.timezone.utc)
+        # O status anterior não é guardado; a reposição envia o estado atual
+        changed = incidents.filter(pk__lte=position.incident, updated_at__gt=since).order_by('updated_at', 'pk')
+        for incident in take(changed):
+            data = serializer.to_representation(incident)
+            data['previous_status'] = None
+            events.append(Event(
+                incident.pk, 'incident_status', data,
+                stamp=timestamp_ms(incident.updated_at), severity=incident.severity
+            ))
+    return events, skipped
+
+
+async def stream(subscriber, position=None):
+    """
+    Gera a resposta SSE de uma assinatura, com keep-alive periódico. Sem
+    ``position`` (primeira conexão), começa no estado atual do banco. A
+    conexão é encerrada após ``MAX_DURATION``; o cliente reconecta com o
+    último id recebido.
+    """
+    loop = asyncio.get_running_loop()
+    config = options()
+    deadline = loop.time() + config['MAX_DURATION']
+    try:
+        yield f'retry: {config["RETRY_MS"]}\n\n'
+        if position is None:
+            position = await sync_to_async(Position.current)()
+            replayed = set()
+        else:
+            replayed = None
+        while True:
+            if replayed is None:
+                # Reconexão ou fila transbordada: o banco cobre o intervalo
+                events, skipped = await sync_to_async(replay)(subscriber, position)
+                broker.record_dropped(subscriber)
+                if skipped:
+                    yield f'event: dropped\ndata: {{"count": {skipped}}}\n\n'
+                replayed = set()
+                for event in events:
+                    replayed.add(event.key)
+                    position.advance(event)
+                    yield f'id: {position}\n{event.body}'
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                event = await asyncio.wait_for(
+                    subscriber.queue.get(),
+                    timeout=min(config['HEARTBEAT'], remaining)
+                )
+            except asyncio.TimeoutError:
+                yield ': keep-alive\n\n'
+                continue
+            if subscriber.dropped:
+                # A fila transbordou: os eventos descartados (e este) são relidos do banco
+                replayed = None
+                continue
+            if event.key in replayed:
+                continue
+            position.advance(event)
+            yield f'id: {position}\n{event.body}'
+    finally:
+        broker.unsubscribe(subscriber)
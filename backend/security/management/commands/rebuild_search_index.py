@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+from security import search
+
+
+class Command(BaseCommand):
+    help = 'Recria o índice de texto completo de incidentes e logs de segurança'
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ('sqlite', 'mysql'):
+            self.stdout.write(self.style.WARNING(
+                f'Banco {connection.vendor} sem suporte; a busca usa icontains.'
+            ))
+            return
+        search.install(connection, rebuild=True)
+        for model, (index, columns) in search.FULLTEXT_INDEXES.items():
+            self.stdout.write(self.style.SUCCESS(
+                f'{index}: {model.objects.count()} registros ({", ".join(columns)})'
+            ))
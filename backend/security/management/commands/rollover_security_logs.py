@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from security import partitions
+from security.models import SecurityLog
+
+
+class Command(BaseCommand):
+    help = 'Aplica a retenção por bucket aos logs de segurança e exibe o tamanho de cada bucket'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Apenas lista os buckets expirados, sem removê-los.',
+        )
+        parser.add_argument(
+            '--rebucket',
+            action='store_true',
+            help='Recalcula o bucket de todas as linhas (após mudar a granularidade).',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Linhas removidas por transação ao descartar um bucket.',
+        )
+
+    def handle(self, *args, **options):
+        if options['rebucket']:
+            updated = partitions.assign_buckets(SecurityLog)
+            self.stdout.write(self.style.SUCCESS(f'{updated} logs movidos de bucket'))
+
+        for bucket in SecurityLog.objects.expired_buckets():
+            if options['dry_run']:
+                self.stdout.write(self.style.WARNING(f'Bucket expirado: {bucket}'))
+                continue
+            removed = SecurityLog.objects.drop_bucket(bucket, batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Bucket {bucket} descartado ({removed} logs)'))
+
+        current = partitions.bucket_for(timezone.now())
+        self.stdout.write(
+            f'Granularidade: {partitions.granularity()} | bucket atual: {current} | '
+            f'próximo: {partitions.next_bucket(current)}'
+        )
+        total = 0
+        for bucket, rows in SecurityLog.objects.bucket_sizes():
+            total += rows
+            self.stdout.write(f'  {bucket}: {rows} logs')
+        self.stdout.write(f'Total: {total} logs')
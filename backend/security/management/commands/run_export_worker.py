@@ -0,0 +1,63 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from security import exports
+
+
+class Command(BaseCommand):
+    help = 'Executa as exportações pendentes do histórico de segurança'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--job',
+            type=int,
+            help='Executa o job informado e os que estiverem na fila, e termina.',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Executa os jobs pendentes e termina, sem aguardar novos.',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5.0,
+            help='Segundos entre verificações de novos jobs.',
+        )
+
+    def handle(self, *args, **options):
+        if options['job'] is not None:
+            job = exports.claim(options['job'])
+            if job is None:
+                self.stdout.write(self.style.WARNING(f'Job {options["job"]} não está pendente'))
+                return
+            self.report(exports.run(job))
+            # Jobs deixados na fila por falta de vaga para novos workers
+            self.drain()
+            return
+
+        while True:
+            self.drain()
+            if options['once']:
+                return
+            close_old_connections()
+            time.sleep(options['poll_interval'])
+
+    def drain(self):
+        while True:
+            job = exports.claim()
+            if job is None:
+                break
+            self.report(exports.run(job))
+        removed = exports.purge_expired()
+        if removed:
+            self.stdout.write(f'{removed} exportações expiradas removidas')
+
+    def report(self, job):
+        if job.status == 'done':
+            self.stdout.write(self.style.SUCCESS(
+                f'Job {job.pk}: {job.row_count} linhas, {job.size_bytes} bytes em {job.duration_ms} ms'
+            ))
+        else:
+            self.stdout.write(self.style.ERROR(f'Job {job.pk} falhou: {job.error}'))
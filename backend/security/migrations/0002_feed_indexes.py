@@ -0,0 +1,21 @@
+# Generated by Django 4.2.10 on 2026-10-18 14:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('security', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='securityincident',
+            index=models.Index(fields=['-reported_at', 'id'], name='security_incident_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='securitylog',
+            index=models.Index(fields=['-created_at', 'id'], name='security_log_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.10 on 2026-10-18 14:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('security', '0002_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='securityincident',
+            name='severity',
+            field=models.CharField(choices=[('low', 'Baixa'), ('medium', 'Média'), ('high', 'Alta'), ('critical', 'Crítica')], db_index=True, max_length=20, verbose_name='Severidade'),
+        ),
+        migrations.AlterField(
+            model_name='securityincident',
+            name='status',
+            field=models.CharField(choices=[('open', 'Aberto'), ('investigating', 'Em Investigação'), ('resolved', 'Resolvido'), ('closed', 'Fechado')], db_index=True, default='open', max_length=20, verbose_name='Status'),
+        ),
+        migrations.AlterField(
+            model_name='securitylog',
+            name='event_type',
+            field=models.CharField(choices=[('access', 'Acesso'), ('alert', 'Alerta'), ('violation', 'Violação'), ('system', 'Sistema'), ('other', 'Outro')], db_index=True, max_length=20, verbose_name='Tipo de Evento'),
+        ),
+    ]
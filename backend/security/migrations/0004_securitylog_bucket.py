@@ -0,0 +1,32 @@
+from django.db import migrations, models
+import security.partitions
+
+
+def populate_buckets(apps, schema_editor):
+    SecurityLog = apps.get_model('security', 'SecurityLog')
+    security.partitions.assign_buckets(SecurityLog, using=schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('security', '0003_alter_securityincident_severity_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='securitylog',
+            name='bucket',
+            field=security.partitions.TimeBucketField(null=True, verbose_name='Partição'),
+        ),
+        migrations.RunPython(populate_buckets, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='securitylog',
+            name='bucket',
+            field=security.partitions.TimeBucketField(verbose_name='Partição'),
+        ),
+        migrations.AddIndex(
+            model_name='securitylog',
+            index=models.Index(fields=['bucket', 'created_at'], name='security_log_bucket_idx'),
+        ),
+    ]
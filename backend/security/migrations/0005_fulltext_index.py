@@ -0,0 +1,21 @@
+from django.db import migrations
+import security.search
+
+
+def install_index(apps, schema_editor):
+    security.search.install(schema_editor.connection)
+
+
+def uninstall_index(apps, schema_editor):
+    security.search.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('security', '0004_securitylog_bucket'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_index, uninstall_index),
+    ]
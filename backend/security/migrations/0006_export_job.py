@@ -0,0 +1,42 @@
+# Generated by Django 4.2.10 on 2026-10-18 15:01
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('security', '0005_fulltext_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dataset', models.CharField(choices=[('logs', 'Logs de Segurança'), ('incidents', 'Incidentes de Segurança')], max_length=20, verbose_name='Conjunto')),
+                ('format', models.CharField(choices=[('csv', 'CSV'), ('ndjson', 'NDJSON')], default='csv', max_length=10, verbose_name='Formato')),
+                ('filters', models.JSONField(blank=True, default=dict, verbose_name='Filtros')),
+                ('filter_hash', models.CharField(max_length=64, verbose_name='Hash dos Filtros')),
+                ('status', models.CharField(choices=[('pending', 'Pendente'), ('running', 'Em Execução'), ('done', 'Concluído'), ('failed', 'Falhou')], db_index=True, default='pending', max_length=20, verbose_name='Status')),
+                ('file_path', models.CharField(blank=True, max_length=500, verbose_name='Arquivo')),
+                ('row_count', models.PositiveIntegerField(blank=True, null=True, verbose_name='Linhas')),
+                ('size_bytes', models.PositiveBigIntegerField(blank=True, null=True, verbose_name='Tamanho (bytes)')),
+                ('duration_ms', models.PositiveIntegerField(blank=True, null=True, verbose_name='Duração (ms)')),
+                ('error', models.TextField(blank=True, verbose_name='Erro')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Criado em')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Iniciado em')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Finalizado em')),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='security_exports', to=settings.AUTH_USER_MODEL, verbose_name='Solicitado por')),
+            ],
+            options={
+                'verbose_name': 'Exportação de Segurança',
+                'verbose_name_plural': 'Exportações de Segurança',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['filter_hash', 'status'], name='security_export_reuse_idx')],
+            },
+        ),
+    ]
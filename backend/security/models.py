@@ -1,5 +1,7 @@
+from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
+from .partitions import PartitionedLogQuerySet, TimeBucketField
 
 class SecurityIncident(models.Model):
     SEVERITY_CHOICES = [
@@ -18,8 +20,8 @@ class SecurityIncident(models.Model):
 
     title = models.CharField(_('Título'), max_length=200)
     description = models.TextField(_('Descrição'))
-    severity = models.CharField(_('Severidade'), max_length=20, choices=SEVERITY_CHOICES)
-    status = models.CharField(_('Status'), max_length=20, choices=STATUS_CHOICES, default='open')
+    severity = models.CharField(_('Severidade'), max_length=20, choices=SEVERITY_CHOICES, db_index=True)
+    status = models.CharField(_('Status'), max_length=20, choices=STATUS_CHOICES, default='open', db_index=True)
     reported_by = models.CharField(_('Reportado por'), max_length=100)
     reported_at = models.DateTimeField(_('Reportado em'), auto_now_add=True)
     location = models.CharField(_('Local'), max_length=100)
@@ -35,10 +37,20 @@ class SecurityIncident(models.Model):
         verbose_name = _('Incidente de Segurança')
         verbose_name_plural = _('Incidentes de Segurança')
         ordering = ['-reported_at']
+        indexes = [
+            models.Index(fields=['-reported_at', 'id'], name='security_incident_feed_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.severity} ({self.status})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Status lido do banco, para o feed ao vivo detectar mudanças
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
 
 class SecurityLog(models.Model):
     EVENT_TYPES = [
@@ -49,18 +61,77 @@ class SecurityLog(models.Model):
         ('other', _('Outro')),
     ]
 
-    event_type = models.CharField(_('Tipo de Evento'), max_length=20, choices=EVENT_TYPES)
+    event_type = models.CharField(_('Tipo de Evento'), max_length=20, choices=EVENT_TYPES, db_index=True)
     description = models.TextField(_('Descrição'))
     user = models.CharField(_('Usuário'), max_length=100)
     ip_address = models.GenericIPAddressField(_('Endereço IP'))
     device_id = models.CharField(_('ID do Dispositivo'), max_length=100, blank=True)
     location = models.CharField(_('Local'), max_length=100, blank=True)
     created_at = models.DateTimeField(_('Criado em'), auto_now_add=True)
+    bucket = TimeBucketField(_('Partição'), editable=False)
+
+    objects = PartitionedLogQuerySet.as_manager()
 
     class Meta:
         verbose_name = _('Log de Segurança')
         verbose_name_plural = _('Logs de Segurança')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', 'id'], name='security_log_feed_idx'),
+            models.Index(fields=['bucket', 'created_at'], name='security_log_bucket_idx'),
+        ]
 
     def __str__(self):
         return f"{self.event_type} - {self.user} - {self.created_at}"
+
+
+class ExportJob(models.Model):
+    DATASET_CHOICES = [
+        ('logs', _('Logs de Segurança')),
+        ('incidents', _('Incidentes de Segurança')),
+    ]
+
+    FORMAT_CHOICES = [
+        ('csv', 'CSV'),
+        ('ndjson', 'NDJSON'),
+    ]
+
+    STATUS_CHOICES = [
+        ('pending', _('Pendente')),
+        ('running', _('Em Execução')),
+        ('done', _('Concluído')),
+        ('failed', _('Falhou')),
+    ]
+
+    dataset = models.CharField(_('Conjunto'), max_length=20, choices=DATASET_CHOICES)
+    format = models.CharField(_('Formato'), max_length=10, choices=FORMAT_CHOICES, default='csv')
+    filters = models.JSONField(_('Filtros'), default=dict, blank=True)
+    filter_hash = models.CharField(_('Hash dos Filtros'), max_length=64)
+    status = models.CharField(_('Status'), max_length=20, choices=STATUS_CHOICES, default='pending', db_index=True)
+    file_path = models.CharField(_('Arquivo'), max_length=500, blank=True)
+    row_count = models.PositiveIntegerField(_('Linhas'), null=True, blank=True)
+    size_bytes = models.PositiveBigIntegerField(_('Tamanho (bytes)'), null=True, blank=True)
+    duration_ms = models.PositiveIntegerField(_('Duração (ms)'), null=True, blank=True)
+    error = models.TextField(_('Erro'), blank=True)
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_('Solicitado por'),
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='security_exports'
+    )
+    created_at = models.DateTimeField(_('Criado em'), auto_now_add=True)
+    started_at = models.DateTimeField(_('Iniciado em'), null=True, blank=True)
+    finished_at = models.DateTimeField(_('Finalizado em'), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('Exportação de Segurança')
+        verbose_name_plural = _('Exportações de Segurança')
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['filter_hash', 'status'], name='security_export_reuse_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.dataset} ({self.format}) - {self.status}"
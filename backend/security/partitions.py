@@ -0,0 +1,163 @@
+"""
+Particionamento por tempo dos logs de segurança.
+
+Cada log recebe um ``bucket`` (primeiro dia do mês ou segunda-feira da
+semana, conforme ``SECURITY_LOG_PARTITION['GRANULARITY']``) calculado a partir
+de ``created_at`` em UTC. Consultas por janela de tempo são restringidas aos
+buckets relevantes pelo índice ``(bucket, created_at)`` e a retenção remove
+buckets inteiros em vez de varrer o histórico.
+"""
+import datetime
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Count
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils import timezone
+
+from core.signals import bulk_changed
+
+
+def granularity():
+    return settings.SECURITY_LOG_PARTITION['GRANULARITY']
+
+
+def bucket_for(value):
+    """
+    Retorna o início do bucket que contém o datetime informado.
+    """
+    if timezone.is_aware(value):
+        value = value.astimezone(datetime.timezone.utc)
+    day = value.date()
+    if granularity() == 'week':
+        return day - datetime.timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+
+def next_bucket(bucket):
+    if granularity() == 'week':
+        return bucket + datetime.timedelta(days=7)
+    return (bucket + datetime.timedelta(days=32)).replace(day=1)
+
+
+def retention_cutoff(now=None):
+    """
+    Primeiro bucket que ainda deve ser mantido pela política de retenção.
+    """
+    days = settings.SECURITY_LOG_PARTITION['RETENTION_DAYS']
+    if not days:
+        return None
+    now = now or timezone.now()
+    return bucket_for(now - datetime.timedelta(days=days))
+
+
+def bucket_range(bucket):
+    """
+    Intervalo [início, fim) de um bucket em datetimes UTC.
+    """
+    start = datetime.datetime.combine(bucket, datetime.time.min, tzinfo=datetime.timezone.utc)
+    end = datetime.datetime.combine(next_bucket(bucket), datetime.time.min, tzinfo=datetime.timezone.utc)
+    return start, end
+
+
+def assign_buckets(model, using='default'):
+    """
+    Recalcula o bucket das linhas existentes com um UPDATE por bucket.
+    Usado pela migração inicial e após mudar a granularidade.
+    """
+    trunc = TruncWeek if granularity() == 'week' else TruncMonth
+    queryset = model._base_manager.using(using)
+    starts = (
+        queryset.order_by()
+        .annotate(start=trunc('created_at', tzinfo=datetime.timezone.utc))
+        .values_list('start', flat=True)
+        .distinct()
+    )
+    updated = 0
+    for start in list(starts):
+        bucket = bucket_for(start)
+        lower, upper = bucket_range(bucket)
+        updated += queryset.filter(
+            created_at__gte=lower,
+            created_at__lt=upper
+        ).exclude(bucket=bucket).update(bucket=bucket)
+    return updated
+
+
+class TimeBucketField(models.DateField):
+    """
+    Campo preenchido na inserção com o bucket de ``created_at``.
+
+    Deve ser declarado depois do campo de origem para que o ``pre_save`` de
+    ``auto_now_add`` já tenha sido aplicado, inclusive em ``bulk_create``.
+    """
+
+    def __init__(self, *args, source='created_at', **kwargs):
+        self.source = source
+        kwargs.setdefault('editable', False)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.source != 'created_at':
+            kwargs['source'] = self.source
+        kwargs.pop('editable', None)
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        source = getattr(model_instance, self.source)
+        if add and source is not None:
+            setattr(model_instance, self.attname, bucket_for(source))
+        return super().pre_save(model_instance, add)
+
+
+class PartitionedLogQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        created = super().bulk_create(objs, *args, **kwargs)
+        bulk_changed.send(sender=self.model, operation='create', objs=created)
+        return created
+
+    def between(self, start=None, end=None):
+        """
+        Filtra ``start <= created_at < end`` restringindo também os buckets.
+        """
+        queryset = self
+        if start is not None:
+            queryset = queryset.filter(bucket__gte=bucket_for(start), created_at__gte=start)
+        if end is not None:
+            queryset = queryset.filter(bucket__lte=bucket_for(end), created_at__lt=end)
+        return queryset
+
+    def bucket_sizes(self):
+        """
+        Retorna [(bucket, linhas)] em ordem cronológica.
+        """
+        rows = self.order_by('bucket').values('bucket').annotate(rows=Count('pk'))
+        return [(row['bucket'], row['rows']) for row in rows]
+
+    def expired_buckets(self, now=None):
+        cutoff = retention_cutoff(now)
+        if cutoff is None:
+            return []
+        return list(
+            self.filter(bucket__lt=cutoff)
+            .order_by('bucket')
+            .values_list('bucket', flat=True)
+            .distinct()
+        )
+
+    def drop_bucket(self, bucket, batch_size=5000):
+        """
+        Remove todas as linhas de um bucket em lotes curtos, sem segurar
+        o lock de escrita por muito tempo. Retorna o total removido.
+        """
+        removed = 0
+        while True:
+            with transaction.atomic(using=self.db):
+                ids = list(
+                    self.filter(bucket=bucket).order_by()
+                    .values_list('pk', flat=True)[:batch_size]
+                )
+                if not ids:
+                    return removed
+                removed += self.model._base_manager.using(self.db).filter(pk__in=ids).delete()[0]
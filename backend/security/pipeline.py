@@ -0,0 +1,175 @@
+"""
+Pipeline assíncrono de gravação de logs de segurança.
+
+Quando ``SECURITY_LOG_BUFFER['ENABLED']`` está ativo, os eventos são colocados
+em uma fila em memória limitada e gravados por uma thread em segundo plano
+com ``bulk_create``, por tamanho de lote ou por intervalo de tempo. Com a fila
+cheia, ``submit`` espera até ``PUT_TIMEOUT`` segundos e então descarta o
+evento (contabilizado em ``dropped``) para que o chamador aplique backpressure.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from . import live
+from .models import SecurityLog
+
+logger = logging.getLogger(__name__)
+
+
+class SecurityLogBuffer:
+    def __init__(self, max_size=10000, flush_size=500, flush_interval=1.0, put_timeout=0.05):
+        self.queue = queue.Queue(maxsize=max_size)
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._stats = {
+            'enqueued': 0,
+            'written': 0,
+            'dropped': 0,
+            'failed': 0,
+            'flushes': 0,
+            'last_flush_latency_ms': 0.0,
+            'max_flush_latency_ms': 0.0,
+            'total_flush_latency_ms': 0.0,
+        }
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name='security-log-flusher',
+                    daemon=True
+                )
+                self._thread.start()
+
+    def submit(self, data):
+        """
+        Enfileira um evento (dict de campos do SecurityLog). Retorna False se a
+        fila continuar cheia após o tempo de espera.
+        """
+        self.start()
+        try:
+            self.queue.put(data, timeout=self.put_timeout)
+        except queue.Full:
+            self._incr('dropped')
+            return False
+        self._incr('enqueued')
+        return True
+
+    def stop(self, timeout=10):
+        """
+        Interrompe a thread e grava o que restou na fila.
+        """
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        while self._flush(self._drain(block=False)):
+            pass
+
+    def metrics(self):
+        with self._lock:
+            stats = dict(self._stats)
+        total_latency = stats.pop('total_flush_latency_ms')
+        stats['avg_flush_latency_ms'] = total_latency / stats['flushes'] if stats['flushes'] else 0.0
+        stats['queue_depth'] = self.queue.qsize()
+        stats['queue_max_size'] = self.queue.maxsize
+        stats['running'] = self._thread is not None and self._thread.is_alive()
+        return stats
+
+    def _incr(self, key, amount=1):
+        with self._lock:
+            self._stats[key] += amount
+
+    def _drain(self, block=True):
+        """
+        Retira até ``flush_size`` eventos, esperando no máximo ``flush_interval``.
+        """
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.flush_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if block and remaining > 0:
+                    batch.append(self.queue.get(timeout=remaining))
+                else:
+                    batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch):
+        if not batch:
+            return 0
+        started = time.perf_counter()
+        try:
+            logs = SecurityLog.objects.bulk_create(
+                [SecurityLog(**data) for data in batch],
+                batch_size=settings.SECURITY_LOG_BATCH_CHUNK_SIZE
+            )
+            live.publish_logs(logs)
+        except Exception as e:
+            logger.error(f'Erro ao gravar lote de {len(batch)} logs: {str(e)}')
+            self._incr('failed', len(batch))
+            return len(batch)
+        finally:
+            close_old_connections()
+
+        latency = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._stats['written'] += len(batch)
+            self._stats['flushes'] += 1
+            self._stats['last_flush_latency_ms'] = latency
+            self._stats['total_flush_latency_ms'] += latency
+            self._stats['max_flush_latency_ms'] = max(
+                self._stats['max_flush_latency_ms'], latency
+            )
+        return len(batch)
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._flush(self._drain())
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def buffering_enabled():
+    return settings.SECURITY_LOG_BUFFER['ENABLED']
+
+
+def get_buffer():
+    global _buffer
+    with _buffer_lock:
+        if _buffer is None:
+            options = settings.SECURITY_LOG_BUFFER
+            _buffer = SecurityLogBuffer(
+                max_size=options['MAX_SIZE'],
+                flush_size=options['FLUSH_SIZE'],
+                flush_interval=options['FLUSH_INTERVAL'],
+                put_timeout=options['PUT_TIMEOUT'],
+            )
+            atexit.register(_buffer.stop)
+    return _buffer
+
+
+def log_event(**data):
+    """
+    Registra um evento de segurança a partir do servidor, usando a fila quando
+    o modo bufferizado está ativo. Retorna False se o evento foi descartado.
+    """
+    if buffering_enabled():
+        return get_buffer().submit(data)
+    SecurityLog.objects.create(**data)
+    return True
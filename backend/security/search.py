@@ -0,0 +1,212 @@
+"""
+Índice de texto completo para incidentes e logs de segurança.
+
+No SQLite o índice é uma tabela virtual FTS5 de conteúdo externo mantida por
+triggers, juntada uma única vez à tabela na busca (o MATCH roda uma vez e o
+``rank`` sai da própria junção); no MySQL é um índice FULLTEXT. Em outros
+bancos, ou se o índice não existir, a busca volta ao ``SearchFilter`` padrão
+(``icontains``).
+"""
+import re
+
+from django.db import connection as default_connection
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import SearchFilter
+
+from .models import SecurityIncident, SecurityLog
+
+# Modelo -> (nome do índice, colunas indexadas)
+FULLTEXT_INDEXES = {
+    SecurityIncident: (
+        'security_incident_fts',
+        ('title', 'description', 'reported_by', 'location', 'affected_assets'),
+    ),
+    SecurityLog: (
+        'security_log_fts',
+        ('description', 'user', 'ip_address', 'device_id', 'location'),
+    ),
+}
+
+# (alias do banco, índice) já encontrados; a introspecção roda só até achar
+_installed = set()
+
+# Frases entre aspas ou termos soltos, opcionalmente com * para prefixo
+TOKEN_RE = re.compile(r'"([^"]+)"|(\S+)')
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def parse_query(text):
+    """
+    Converte a busca do usuário em [(palavras, é_frase, é_prefixo)].
+    """
+    terms = []
+    for phrase, word in TOKEN_RE.findall(text.replace('\x00', '')):
+        words = WORD_RE.findall(phrase or word)
+        if words:
+            prefix = bool(word) and word.endswith('*')
+            terms.append((words, bool(phrase), prefix))
+    return terms
+
+
+def fts5_expression(terms):
+    parts = []
+    for words, _, prefix in terms:
+        part = '"%s"' % ' '.join(words)
+        parts.append(part + '*' if prefix else part)
+    return ' AND '.join(parts)
+
+
+def mysql_expression(terms):
+    parts = []
+    for words, is_phrase, prefix in terms:
+        if is_phrase or len(words) > 1:
+            parts.append('+"%s"' % ' '.join(words))
+        else:
+            parts.append('+%s%s' % (words[0], '*' if prefix else ''))
+    return ' '.join(parts)
+
+
+def _quote(connection, name):
+    return connection.ops.quote_name(name)
+
+
+def install(connection, rebuild=False):
+    """
+    Cria (se necessário) os índices e triggers de sincronização. No SQLite,
+    alterações de esquema que recriam a tabela descartam os triggers, por
+    isso esta função é idempotente e também roda no ``post_migrate``.
+    """
+    if connection.vendor == 'sqlite':
+        _install_sqlite(connection, rebuild)
+    elif connection.vendor == 'mysql':
+        _install_mysql(connection)
+
+
+def _install_sqlite(connection, rebuild):
+    with connection.cursor() as cursor:
+        for model, (index, columns) in FULLTEXT_INDEXES.items():
+            table = model._meta.db_table
+            quoted = ', '.join(_quote(connection, c) for c in columns)
+            new_values = ', '.join(f'new.{_quote(connection, c)}' for c in columns)
+            old_values = ', '.join(f'old.{_quote(connection, c)}' for c in columns)
+
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [index]
+            )
+            created = cursor.fetchone() is None
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5("
+                f"{quoted}, content='{table}', content_rowid='id', "
+                f"tokenize='unicode61 remove_diacritics 2')"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {index}_ai AFTER INSERT ON {table} BEGIN "
+                f"INSERT INTO {index}(rowid, {quoted}) VALUES (new.id, {new_values}); END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {index}_ad AFTER DELETE ON {table} BEGIN "
+                f"INSERT INTO {index}({index}, rowid, {quoted}) "
+                f"VALUES ('delete', old.id, {old_values}); END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {index}_au AFTER UPDATE ON {table} BEGIN "
+                f"INSERT INTO {index}({index}, rowid, {quoted}) "
+                f"VALUES ('delete', old.id, {old_values}); "
+                f"INSERT INTO {index}(rowid, {quoted}) VALUES (new.id, {new_values}); END"
+            )
+            if created or rebuild:
+                cursor.execute(f"INSERT INTO {index}({index}) VALUES ('rebuild')")
+
+
+def _install_mysql(connection):
+    with connection.cursor() as cursor:
+        for model, (index, columns) in FULLTEXT_INDEXES.items():
+            table = model._meta.db_table
+            cursor.execute(
+                "SELECT 1 FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s",
+                [table, index]
+            )
+            if cursor.fetchone() is None:
+                quoted = ', '.join(_quote(connection, c) for c in columns)
+                cursor.execute(
+                    f"ALTER TABLE {_quote(connection, table)} "
+                    f"ADD FULLTEXT INDEX {index} ({quoted})"
+                )
+
+
+def uninstall(connection):
+    for index, _ in FULLTEXT_INDEXES.values():
+        _installed.discard((connection.alias, index))
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            for index, _ in FULLTEXT_INDEXES.values():
+                for suffix in ('ai', 'ad', 'au'):
+                    cursor.execute(f'DROP TRIGGER IF EXISTS {index}_{suffix}')
+                cursor.execute(f'DROP TABLE IF EXISTS {index}')
+    elif connection.vendor == 'mysql':
+        with connection.cursor() as cursor:
+            for model, (index, _) in FULLTEXT_INDEXES.items():
+                cursor.execute(
+                    f'ALTER TABLE {_quote(connection, model._meta.db_table)} DROP INDEX {index}'
+                )
+
+
+def is_installed(model, connection=default_connection):
+    if model not in FULLTEXT_INDEXES:
+        return False
+    index, _ = FULLTEXT_INDEXES[model]
+    if connection.vendor == 'sqlite':
+        key = (connection.alias, index)
+        if key in _installed:
+            return True
+        if index in connection.introspection.table_names():
+            _installed.add(key)
+            return True
+        return False
+    return connection.vendor == 'mysql'
+
+
+def ranked_search(queryset, text, connection=default_connection):
+    """
+    Filtra o queryset pelo índice de texto completo e anota ``search_rank``
+    (menor = mais relevante).
+    """
+    terms = parse_query(text)
+    if not terms:
+        return queryset
+    index, columns = FULLTEXT_INDEXES[queryset.model]
+    table = queryset.model._meta.db_table
+
+    if connection.vendor == 'sqlite':
+        # Junção com o índice: o FTS5 conduz a consulta e cada linha
+        # encontrada é lida pela chave primária
+        return queryset.extra(
+            tables=[index],
+            where=[f'{index}.rowid = {table}.id', f'{index} MATCH %s'],
+            params=[fts5_expression(terms)],
+        ).annotate(search_rank=RawSQL(f'{index}.rank', []))
+
+    expression = mysql_expression(terms)
+    quoted = ', '.join(_quote(connection, c) for c in columns)
+    match = f'MATCH ({quoted}) AGAINST (%s IN BOOLEAN MODE)'
+    return queryset.annotate(
+        search_rank=RawSQL(f'-{match}', [expression])
+    ).filter(search_rank__lt=0)
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    ``?search=`` com ranking, frases ("...") e prefixos (termo*) usando o
+    índice de texto completo. Define ``view.search_ordering`` para que a
+    paginação por cursor ordene pela relevância.
+    """
+    search_ordering = ('search_rank', 'id')
+
+    def filter_queryset(self, request, queryset, view):
+        text = request.query_params.get(self.search_param, '')
+        if not text.strip() or not is_installed(queryset.model):
+            return super().filter_queryset(request, queryset, view)
+        view.search_ordering = self.search_ordering
+        return ranked_search(queryset, text)
@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from .models import SecurityIncident, SecurityLog
+from rest_framework.reverse import reverse
+from .models import ExportJob, SecurityIncident, SecurityLog
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,11 +14,12 @@ class SecurityIncidentSerializer(serializers.ModelSerializer):
 class SecurityLogSerializer(serializers.ModelSerializer):
     class Meta:
         model = SecurityLog
-        fields = '__all__'
+        # O bucket é a chave interna de particionamento, fora da API
+        exclude = ('bucket',)
         read_only_fields = ('created_at',)
 
     def validate(self, data):
-        logger.info(f'Validando dados do log: {data}')
+        logger.debug('Validando dados do log: %s', data)
         # Remover campos vazios ou nulos
         for field in list(data.keys()):
             if data[field] in [None, '', []]:
@@ -25,11 +27,36 @@ class SecurityLogSerializer(serializers.ModelSerializer):
         return data
 
     def create(self, validated_data):
-        logger.info(f'Criando log com dados validados: {validated_data}')
+        logger.debug('Criando log com dados validados: %s', validated_data)
         try:
             instance = super().create(validated_data)
-            logger.info(f'Log criado com sucesso: {instance}')
+            logger.debug('Log criado com sucesso: %s', instance)
             return instance
         except Exception as e:
             logger.error(f'Erro ao criar log: {str(e)}')
-            raise 
\ No newline at end of file
+            raise 
+
+class ExportJobSerializer(serializers.ModelSerializer):
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ExportJob
+        fields = (
+            'id', 'dataset', 'format', 'filters', 'status', 'row_count',
+            'size_bytes', 'duration_ms', 'error', 'requested_by',
+            'created_at', 'started_at', 'finished_at', 'download_url'
+        )
+        read_only_fields = (
+            'status', 'row_count', 'size_bytes', 'duration_ms', 'error',
+            'requested_by', 'created_at', 'started_at', 'finished_at'
+        )
+
+    def validate_filters(self, value):
+        if not isinstance(value, dict):
+            raise serializers.ValidationError('Informe os filtros como um objeto.')
+        return value
+
+    def get_download_url(self, obj):
+        if obj.status != 'done':
+            return None
+        return reverse('exportjob-download', args=[obj.pk], request=self.context.get('request'))
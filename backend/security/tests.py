@@ -1,3 +1,240 @@
-from django.test import TestCase
+import datetime
+import io
+import os
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import AsyncClient, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import User
+from users.tokens import issue_token
+from . import exports, live, search
+from .models import ExportJob, SecurityLog
+
+
+class SecurityLogAPITest(TestCase):
+    def setUp(self):
+        user = User.objects.create_user('seguranca', password='x', user_type='admin')
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+        self.log = SecurityLog.objects.create(
+            event_type='access', description='Entrada', user='alfred', ip_address='10.0.0.1'
+        )
+
+    def test_bucket_is_not_exposed(self):
+        response = self.client.get('/api/security/logs/')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('bucket', response.data['results'][0])
+
+        response = self.client.get(f'/api/security/logs/{self.log.pk}/')
+        self.assertNotIn('bucket', response.data)
+
+    def test_list_log_counts_page_rows(self):
+        SecurityLog.objects.create(
+            event_type='alert', description='Alarme', user='lucius', ip_address='10.0.0.2'
+        )
+        with self.assertLogs('security.views', level='INFO') as captured:
+            response = self.client.get('/api/security/logs/', {'layout': 'columnar'})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('INFO:security.views:Logs retornados: 2', captured.output)
+
+
+class AsyncSecurityAccessTest(TestCase):
+    """
+    As rotas assíncronas de segurança seguem as regras de /api/security/.
+    """
+
+    def setUp(self):
+        self.tokens = {
+            user_type: issue_token(User.objects.create_user(user_type, password='x', user_type=user_type))[1]
+            for user_type in ('manager', 'security_admin')
+        }
+
+    async def get(self, path, user_type):
+        return await AsyncClient().get(path, headers={'Authorization': f'Token {self.tokens[user_type]}'})
+
+    async def test_non_security_role_is_denied(self):
+        for path in ('/api/async/security/logs/', '/api/async/security/incidents/'):
+            response = await self.get(path, 'manager')
+            self.assertEqual(response.status_code, 403)
+
+    async def test_security_role_is_allowed(self):
+        response = await self.get('/api/async/security/logs/', 'security_admin')
+        self.assertEqual(response.status_code, 200)
+
+
+class ConditionalListTest(TestCase):
+    """
+    O ETag da listagem vem da agregação guardada por geração do modelo.
+    """
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user('analista', password='x', user_type='security_admin')
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+        SecurityLog.objects.create(event_type='access', description='Entrada', user='alfred', ip_address='10.0.0.1')
+
+    def list(self, **headers):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get('/api/security/logs/', {'event_type': 'access'}, **headers)
+        aggregates = [q['sql'] for q in captured.captured_queries if 'COUNT(' in q['sql']]
+        return response, aggregates
+
+    def test_aggregate_is_reused_until_a_write(self):
+        response, aggregates = self.list()
+        self.assertEqual(len(aggregates), 1)
+        etag = response['ETag']
+
+        response, aggregates = self.list(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(aggregates, [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SecurityLog.objects.bulk_create([
+                SecurityLog(event_type='access', description='Lote', user='lucius', ip_address='10.0.0.2')
+            ])
+        response, aggregates = self.list(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(aggregates), 1)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class LiveFeedTest(TestCase):
+    """
+    Autenticação por ticket e retomada do feed pelo Last-Event-ID.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('vigia', password='x', user_type='security_admin')
+        self.logs = [
+            SecurityLog.objects.create(event_type=event_type, description='Evento', user='alfred', ip_address='10.0.0.1')
+            for event_type in ('access', 'alert', 'access')
+        ]
+
+    def test_ticket_is_single_use(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.post('/api/security/live/ticket/')
+        self.assertEqual(response.status_code, 201)
+        ticket = response.data['ticket']
+        self.assertEqual(live.redeem_ticket(ticket), self.user.pk)
+        self.assertIsNone(live.redeem_ticket(ticket))
+
+    async def test_raw_token_in_query_string_is_refused(self):
+        token = await sync_to_async(issue_token)(self.user)
+        response = await AsyncClient().get('/api/security/live/', {'token': token[1]})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_reconnect_replays_missed_rows(self):
+        ticket = await sync_to_async(live.issue_ticket)(self.user)
+        first = self.logs[0].pk
+        response = await AsyncClient().get(
+            '/api/security/live/', {'ticket': ticket, 'event_type': 'access'},
+            headers={'Last-Event-ID': f'{first}.0.0'}
+        )
+        self.assertEqual(response.status_code, 200)
+        chunks = []
+        async for chunk in response.streaming_content:
+            chunks.append(chunk.decode() if isinstance(chunk, bytes) else chunk)
+            if len(chunks) == 2:
+                break
+        await response.streaming_content.aclose()
+        self.assertTrue(chunks[0].startswith('retry:'))
+        self.assertTrue(chunks[1].startswith(f'id: {self.logs[2].pk}.0.0\nevent: log\n'))
+
+    def test_replay_respects_filters_and_limit(self):
+        subscriber = live.Subscriber(None, kinds=['log'], event_types=['access'])
+        events, skipped = live.replay(subscriber, live.Position())
+        self.assertEqual([event.pk for event in events], [self.logs[0].pk, self.logs[2].pk])
+        self.assertEqual(skipped, 0)
+
+        with self.settings(SECURITY_LIVE={**settings.SECURITY_LIVE, 'REPLAY_LIMIT': 1}):
+            events, skipped = live.replay(subscriber, live.Position())
+        self.assertEqual((len(events), skipped), (1, 1))
+
+
+class ExportWorkerTest(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        override = self.settings(SECURITY_EXPORTS={**settings.SECURITY_EXPORTS, 'DIRECTORY': self.directory})
+        override.enable()
+        self.addCleanup(override.disable)
+        SecurityLog.objects.create(event_type='access', description='Entrada', user='alfred', ip_address='10.0.0.1')
+
+    def job(self, **fields):
+        return ExportJob.objects.create(dataset='logs', filter_hash=str(ExportJob.objects.count()), **fields)
+
+    def test_submit_respects_worker_limit(self):
+        with mock.patch.object(exports, 'spawn_worker') as spawn:
+            exports.submit('logs', 'csv', {'event_type': 'access'})
+            self.assertEqual(spawn.call_count, 1)
+            for _ in range(2):
+                self.job(status='running', started_at=timezone.now())
+            job, _ = exports.submit('logs', 'ndjson', {})
+            self.assertEqual(spawn.call_count, 1)
+            self.assertEqual(job.status, 'pending')
+
+            # Job parado além da janela não ocupa vaga
+            ExportJob.objects.filter(status='running').update(
+                started_at=timezone.now() - datetime.timedelta(days=1)
+            )
+            exports.submit('incidents', 'csv', {})
+            self.assertEqual(spawn.call_count, 2)
+
+    def test_job_worker_drains_queue_and_purges(self):
+        old_path = os.path.join(self.directory, 'antigo.csv.gz')
+        open(old_path, 'wb').close()
+        old = self.job(status='done', file_path=old_path)
+        ExportJob.objects.filter(pk=old.pk).update(created_at=timezone.now() - datetime.timedelta(days=30))
+        first, queued = self.job(), self.job(format='ndjson')
+
+        call_command('run_export_worker', job=first.pk, stdout=io.StringIO())
+
+        self.assertEqual(
+            set(ExportJob.objects.values_list('pk', 'status')),
+            {(first.pk, 'done'), (queued.pk, 'done')}
+        )
+        self.assertFalse(os.path.exists(old_path))
+
+
+class FullTextSearchTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user('analista', password='x', user_type='security_admin')
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+        for description in ('Porta da garagem aberta', 'Porta aberta, porta forçada', 'Alarme da torre'):
+            SecurityLog.objects.create(event_type='alert', description=description, user='alfred', ip_address='10.0.0.1')
+
+    def test_ranked_search_matches_once(self):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get('/api/security/logs/', {'search': 'porta'})
+        self.assertEqual(response.status_code, 200)
+        descriptions = [row['description'] for row in response.data['results']]
+        self.assertEqual(descriptions, ['Porta aberta, porta forçada', 'Porta da garagem aberta'])
+        for query in captured:
+            self.assertLessEqual(query['sql'].count('MATCH'), 1)
+
+    def test_cursor_pages_by_rank(self):
+        response = self.client.get('/api/security/logs/', {'search': 'porta', 'page_size': 1})
+        self.assertEqual(response.data['results'][0]['description'], 'Porta aberta, porta forçada')
+        response = self.client.get(response.data['next'])
+        self.assertEqual([r['description'] for r in response.data['results']], ['Porta da garagem aberta'])
+        self.assertIsNone(response.data['next'])
+
+    def test_installed_check_is_cached(self):
+        self.assertTrue(search.is_installed(SecurityLog))
+        with self.assertNumQueries(0):
+            self.assertTrue(search.is_installed(SecurityLog))
@@ -1,8 +1,13 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import SecurityIncidentViewSet, SecurityLogViewSet
+from .views import ExportJobViewSet, LiveTicketView, SecurityIncidentViewSet, SecurityLogViewSet, live_feed
 
 router = DefaultRouter()
 router.register('incidents', SecurityIncidentViewSet)
 router.register('logs', SecurityLogViewSet)
+router.register('exports', ExportJobViewSet)
 
-urlpatterns = router.urls 
\ No newline at end of file
+urlpatterns = [
+    path('live/', live_feed, name='security-live'),
+    path('live/ticket/', LiveTicketView.as_view(), name='security-live-ticket'),
+] + router.urls 
\ No newline at end of file
@@ -1,48 +1,284 @@
+from django.conf import settings
+from django.db import transaction
 from django.shortcuts import render
-from rest_framework import viewsets
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import FileResponse, JsonResponse, StreamingHttpResponse
+from rest_framework import mixins, viewsets, status
+from rest_framework.decorators import action
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+from rest_framework.filters import OrderingFilter
+from rest_framework.parsers import JSONParser
 from rest_framework.permissions import IsAuthenticated
-from .models import SecurityIncident, SecurityLog
-from .serializers import SecurityIncidentSerializer, SecurityLogSerializer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from .models import ExportJob, SecurityIncident, SecurityLog
+from .serializers import ExportJobSerializer, SecurityIncidentSerializer, SecurityLogSerializer
+from wayne_backend.pagination import SecurityIncidentPagination, SecurityLogPagination
+from wayne_backend.conditional import ConditionalGetMixin
+from wayne_backend.fastread import FastReadMixin
+from wayne_backend.parsers import NDJSONParser
+from wayne_backend.streaming import StreamingListMixin
+from .pipeline import buffering_enabled, get_buffer
+from .filters import SecurityLogFilter
+from .search import FullTextSearchFilter
+from . import exports, live
+from users.authentication import CachedTokenAuthentication
+from users.models import User
+from users.permissions import IsAdminOrSecurityAdmin
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
 # Create your views here.
 
-class SecurityIncidentViewSet(viewsets.ModelViewSet):
+class SecurityIncidentViewSet(StreamingListMixin, ConditionalGetMixin, FastReadMixin, viewsets.ModelViewSet):
     queryset = SecurityIncident.objects.all()
     serializer_class = SecurityIncidentSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = SecurityIncidentPagination
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, OrderingFilter]
     filterset_fields = ['severity', 'status']
     search_fields = ['title', 'description', 'reported_by', 'location', 'affected_assets']
     ordering_fields = ['reported_at', 'severity', 'status', 'created_at']
     ordering = ['-reported_at']
 
-class SecurityLogViewSet(viewsets.ModelViewSet):
+class SecurityLogViewSet(StreamingListMixin, ConditionalGetMixin, FastReadMixin, viewsets.ModelViewSet):
     queryset = SecurityLog.objects.all()
     serializer_class = SecurityLogSerializer
     permission_classes = [IsAuthenticated]
-    filterset_fields = ['event_type']
+    pagination_class = SecurityLogPagination
+    last_modified_field = 'created_at'
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, OrderingFilter]
+    filterset_class = SecurityLogFilter
     search_fields = ['description', 'user', 'ip_address', 'device_id', 'location']
     ordering_fields = ['created_at', 'event_type']
     ordering = ['-created_at']
 
     def create(self, request, *args, **kwargs):
-        logger.info(f'Recebendo dados para criar log: {request.data}')
+        logger.debug('Recebendo dados para criar log: %s', request.data)
+        if buffering_enabled():
+            return self.enqueue(request)
         try:
             response = super().create(request, *args, **kwargs)
-            logger.info(f'Log criado com sucesso: {response.data}')
+            logger.debug('Log criado com sucesso: %s', response.data)
             return response
         except Exception as e:
             logger.error(f'Erro ao criar log: {str(e)}')
             raise
 
+    def enqueue(self, request):
+        """
+        Valida o evento e o coloca na fila de gravação assíncrona.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        if not get_buffer().submit(serializer.validated_data):
+            logger.warning('Fila de logs cheia, evento descartado')
+            return Response(
+                {'error': 'Fila de logs cheia. Tente novamente em instantes.'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={'Retry-After': '1'}
+            )
+        return Response({'queued': True}, status=status.HTTP_202_ACCEPTED)
+
     def list(self, request, *args, **kwargs):
         logger.info('Listando logs de segurança')
         try:
             response = super().list(request, *args, **kwargs)
-            logger.info(f'Logs encontrados: {len(response.data)}')
+            # Conta pela página, não pelo payload (que muda com ?layout=)
+            page = getattr(self.paginator, 'page', None)
+            if page is not None and response.status_code == status.HTTP_200_OK:
+                logger.info(f'Logs retornados: {len(page)}')
             return response
         except Exception as e:
             logger.error(f'Erro ao listar logs: {str(e)}')
             raise
+
+
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='batch',
+        parser_classes=[JSONParser, NDJSONParser]
+    )
+    def batch(self, request):
+        """
+        Ingestão em lote: recebe uma lista JSON ou um corpo NDJSON de eventos,
+        valida todos com uma única instância do serializer e grava os válidos
+        com bulk_create em uma única transação.
+        """
+        items = request.data
+        if not isinstance(items, list):
+            return Response(
+                {'error': 'Envie uma lista de eventos.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(items) > settings.SECURITY_LOG_BATCH_MAX_SIZE:
+            return Response(
+                {'error': f'Máximo de {settings.SECURITY_LOG_BATCH_MAX_SIZE} eventos por lote.'},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+
+        serializer = self.get_serializer()
+        logs = []
+        errors = []
+        for index, item in enumerate(items):
+            try:
+                logs.append(SecurityLog(**serializer.run_validation(item)))
+            except ValidationError as e:
+                errors.append({'index': index, 'errors': e.detail})
+
+        with transaction.atomic():
+            SecurityLog.objects.bulk_create(
+                logs,
+                batch_size=settings.SECURITY_LOG_BATCH_CHUNK_SIZE
+            )
+            live.publish_logs(logs)
+        logger.info(f'Lote de logs recebido: {len(logs)} criados, {len(errors)} com erro')
+
+        if not errors:
+            response_status = status.HTTP_201_CREATED
+        elif logs:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response(
+            {'created': len(logs), 'errors': errors},
+            status=response_status
+        )
+
+    @action(detail=False, methods=['get'], url_path='pipeline')
+    def pipeline(self, request):
+        """
+        Métricas da fila de gravação assíncrona de logs.
+        """
+        metrics = get_buffer().metrics()
+        metrics['enabled'] = buffering_enabled()
+        metrics['live'] = live.broker.metrics()
+        return Response(metrics)
+
+
+class ExportJobViewSet(mixins.CreateModelMixin,
+                       mixins.ListModelMixin,
+                       mixins.RetrieveModelMixin,
+                       viewsets.GenericViewSet):
+    """
+    Exportações do histórico de segurança: POST cria (ou reaproveita) o job,
+    GET acompanha o status e ``download`` entrega o arquivo gzip.
+    """
+    queryset = ExportJob.objects.all()
+    serializer_class = ExportJobSerializer
+    permission_classes = [IsAdminOrSecurityAdmin]
+    filterset_fields = ['dataset', 'status', 'format']
+    ordering_fields = ['created_at', 'finished_at']
+    ordering = ['-created_at']
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        job, reused = exports.submit(
+            serializer.validated_data['dataset'],
+            serializer.validated_data.get('format', 'csv'),
+            serializer.validated_data.get('filters', {}),
+            request.user
+        )
+        logger.info(f'Exportação {job.pk} {"reaproveitada" if reused else "criada"}')
+        return Response(
+            self.get_serializer(job).data,
+            status=status.HTTP_200_OK if reused else status.HTTP_202_ACCEPTED
+        )
+
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None):
+        job = self.get_object()
+        if job.status != 'done' or not os.path.exists(job.file_path):
+            return Response(
+                {'error': 'Exportação ainda não disponível.', 'status': job.status},
+                status=status.HTTP_409_CONFLICT
+            )
+        return FileResponse(
+            open(job.file_path, 'rb'),
+            as_attachment=True,
+            filename=os.path.basename(job.file_path),
+            content_type='application/gzip'
+        )
+
+
+def _csv_param(request, name):
+    value = request.GET.get(name, '')
+    return {item.strip() for item in value.split(',') if item.strip()}
+
+
+class LiveTicketView(APIView):
+    """
+    Emite o ticket de uso único com que o navegador abre o feed ao vivo, sem
+    expor o token na URL.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        return Response({
+            'ticket': live.issue_ticket(request.user),
+            'expires_in': settings.SECURITY_LIVE['TICKET_TTL'],
+        }, status=status.HTTP_201_CREATED)
+
+
+def _live_user(request):
+    header = request.headers.get('Authorization', '').split()
+    if len(header) == 2 and header[0].lower() == 'token':
+        user, _ = CachedTokenAuthentication().authenticate_credentials(header[1].encode())
+        return user
+    ticket = request.GET.get('ticket')
+    user_id = live.redeem_ticket(ticket) if ticket else None
+    if user_id is None:
+        raise AuthenticationFailed('Ticket inválido ou expirado.')
+    user = User.objects.filter(pk=user_id, is_active=True).first()
+    if user is None:
+        raise AuthenticationFailed('Usuário inativo ou removido.')
+    return user
+
+
+async def live_feed(request):
+    """
+    Feed ao vivo (text/event-stream) de logs e incidentes.
+
+    Autenticação pelo cabeçalho ``Authorization: Token ...`` ou, para o
+    EventSource do navegador, por ``?ticket=`` emitido em ``live/ticket/``.
+    ``Last-Event-ID`` (ou ``?last_event_id=``) retoma o feed do ponto em que
+    o cliente parou. Filtros: ``kinds``, ``severity`` e ``event_type``,
+    separados por vírgula.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {'error': 'O feed ao vivo exige o servidor ASGI.'},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+    try:
+        await sync_to_async(_live_user)(request)
+    except AuthenticationFailed as e:
+        return JsonResponse({'error': str(e.detail)}, status=status.HTTP_401_UNAUTHORIZED)
+
+    if live.broker.metrics()['subscribers'] >= settings.SECURITY_LIVE['MAX_SUBSCRIBERS']:
+        response = JsonResponse(
+            {'error': 'Limite de conexões ao vivo atingido.'},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+        response['Retry-After'] = str(settings.SECURITY_LIVE['RETRY_MS'] // 1000)
+        return response
+
+    kinds = _csv_param(request, 'kinds') & set(live.KINDS)
+    subscriber = live.broker.subscribe(
+        kinds=kinds or None,
+        severities=_csv_param(request, 'severity'),
+        event_types=_csv_param(request, 'event_type')
+    )
+    last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    position = live.Position.parse(last_event_id) if last_event_id else None
+    response = StreamingHttpResponse(live.stream(subscriber, position), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -1,6 +1,25 @@
 from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 
 
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
+
+    def ready(self):
+        from knox.models import get_token_model
+
+        from . import authentication, signals
+        from .models import Permission, Role, User
+
+        m2m_changed.connect(signals.user_roles_changed, sender=User.roles.through)
+        m2m_changed.connect(signals.role_permissions_changed, sender=Role.permissions.through)
+        for model in (Role, Permission):
+            pre_delete.connect(signals.collect_affected_users, sender=model)
+            post_delete.connect(signals.invalidate_affected_users, sender=model)
+        post_save.connect(signals.permission_saved, sender=Permission)
+
+        # Cache de tokens verificados
+        post_delete.connect(authentication.token_deleted, sender=get_token_model())
+        post_save.connect(authentication.user_changed, sender=User)
+        post_delete.connect(authentication.user_changed, sender=User)
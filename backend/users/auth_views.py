@@ -3,8 +3,9 @@ from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from knox.views import LoginView as KnoxLoginView
-from knox.auth import TokenAuthentication
-from knox.models import AuthToken
+from .authentication import CachedTokenAuthentication
+from .hashing import LoginPoolSaturated
+from .tokens import issue_token
 from .serializers import UserSerializer, UserCreateSerializer, AuthTokenSerializer
 import logging
 from django.views.decorators.csrf import ensure_csrf_cookie
@@ -21,7 +22,7 @@ class RegisterView(APIView):
         serializer = UserCreateSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
-            _, token = AuthToken.objects.create(user)
+            _, token = issue_token(user)
             return Response({
                 "user": UserSerializer(user).data,
                 "token": token
@@ -57,7 +58,7 @@ class LoginView(APIView):
                 logger.info('Usuário autenticado com sucesso: %s', user.username)
                 
                 # Criar token usando o Knox
-                _, token = AuthToken.objects.create(user)
+                _, token = issue_token(user)
                 logger.info('Token criado para o usuário: %s', user.username)
                 
                 return Response({
@@ -70,7 +71,15 @@ class LoginView(APIView):
                 {'error': 'Credenciais inválidas. Verifique seu usuário e senha.'},
                 status=status.HTTP_401_UNAUTHORIZED
             )
-            
+
+        except LoginPoolSaturated as e:
+            logger.warning('Verificação de senhas saturada, login recusado')
+            return Response(
+                {'error': 'Muitas tentativas de login simultâneas. Tente novamente em instantes.'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={'Retry-After': str(e.retry_after)}
+            )
+
         except Exception as e:
             logger.error('Erro durante o processo de login: %s', str(e))
             return Response(
@@ -79,7 +88,7 @@ class LoginView(APIView):
             )
 
 class UserAPIView(APIView):
-    authentication_classes = (TokenAuthentication,)
+    authentication_classes = (CachedTokenAuthentication,)
     permission_classes = (permissions.IsAuthenticated,)
 
     def get(self, request):
@@ -0,0 +1,122 @@
+"""
+Autenticação Knox com cache de tokens verificados.
+
+O resultado da verificação (usuário e dados do token) fica no cache pelo
+digest do token durante ``TOKEN_CACHE_TTL`` segundos, evitando a consulta à
+tabela de tokens em cada requisição. A renovação automática da validade é
+agrupada: cada token é gravado no máximo uma vez a cada
+``TOKEN_REFRESH_INTERVAL`` segundos, mesmo entre processos que compartilham o
+cache. Exclusão de tokens (logout, logout-all, expurgo) e alterações no
+usuário invalidam as entradas pelos sinais conectados em ``users.apps``.
+"""
+import binascii
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from knox.auth import TokenAuthentication
+from knox.crypto import hash_token
+from knox.models import get_token_model
+from knox.settings import knox_settings
+from rest_framework import exceptions
+
+TOKEN_KEY = 'knox:token:{}'
+USER_GENERATION_KEY = 'knox:user-generation:{}'
+REFRESH_LOCK_KEY = 'knox:refresh:{}'
+
+
+def user_generation(user_id):
+    return cache.get(USER_GENERATION_KEY.format(user_id), 0)
+
+
+def invalidate_user_tokens(user_id):
+    """
+    Invalida todas as entradas em cache dos tokens de um usuário.
+    """
+    key = USER_GENERATION_KEY.format(user_id)
+    if not cache.add(key, 1, None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+
+
+def invalidate_token(digest):
+    cache.delete(TOKEN_KEY.format(digest))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+
+    def authenticate_credentials(self, token):
+        try:
+            digest = hash_token(token.decode('utf-8'))
+        except (TypeError, binascii.Error, UnicodeDecodeError):
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        entry = cache.get(TOKEN_KEY.format(digest))
+        if entry is not None and self._entry_is_valid(entry):
+            auth_token = self._token_from_entry(digest, entry)
+            self.refresh(auth_token)
+            return self.validate_user(auth_token)
+
+        user, auth_token = super().authenticate_credentials(token)
+        self.store(auth_token)
+        return user, auth_token
+
+    def renew_token(self, auth_token):
+        # A renovação passa pelo mesmo controle de intervalo do caminho em cache
+        self.refresh(auth_token)
+
+    def refresh(self, auth_token):
+        if not knox_settings.AUTO_REFRESH or auth_token.expiry is None:
+            return
+        interval = settings.TOKEN_REFRESH_INTERVAL
+        if not cache.add(REFRESH_LOCK_KEY.format(auth_token.digest), 1, interval):
+            return
+
+        new_expiry = timezone.now() + knox_settings.TOKEN_TTL
+        if knox_settings.AUTO_REFRESH_MAX_TTL is not None:
+            new_expiry = min(new_expiry, auth_token.created + knox_settings.AUTO_REFRESH_MAX_TTL)
+        if new_expiry <= auth_token.expiry:
+            return
+        auth_token.expiry = new_expiry
+        get_token_model().objects.filter(digest=auth_token.digest).update(expiry=new_expiry)
+        self.store(auth_token)
+
+    def store(self, auth_token):
+        user = auth_token.user
+        # Estado calculado por requisição não deve ir para o cache
+        user.__dict__.pop('_permission_profile', None)
+        cache.set(TOKEN_KEY.format(auth_token.digest), {
+            'token_key': auth_token.token_key,
+            'created': auth_token.created,
+            'expiry': auth_token.expiry,
+            'user': user,
+            'generation': user_generation(user.pk),
+        }, settings.TOKEN_CACHE_TTL)
+
+    def _entry_is_valid(self, entry):
+        if entry['expiry'] is not None and entry['expiry'] < timezone.now():
+            return False
+        return entry['generation'] == user_generation(entry['user'].pk)
+
+    def _token_from_entry(self, digest, entry):
+        auth_token = get_token_model()(
+            digest=digest,
+            token_key=entry['token_key'],
+            user=entry['user'],
+            created=entry['created'],
+            expiry=entry['expiry'],
+        )
+        auth_token._state.adding = False
+        auth_token._state.db = 'default'
+        return auth_token
+
+
+def token_deleted(sender, instance, **kwargs):
+    invalidate_token(instance.digest)
+
+
+def user_changed(sender, instance, **kwargs):
+    invalidate_user_tokens(instance.pk)
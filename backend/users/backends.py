@@ -0,0 +1,39 @@
+"""
+Backend de autenticação que verifica a senha no pool de ``users.hashing``.
+
+Mantém o contrato do ``ModelBackend`` (``user_can_authenticate``, hash
+descartável para usuários inexistentes, atualização do hash), de modo que o
+login continua passando por ``django.contrib.auth.authenticate`` e seus
+sinais. ``LoginPoolSaturated`` é propagada para a view responder 503.
+"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from .hashing import get_pool
+
+UserModel = get_user_model()
+
+
+class PooledModelBackend(ModelBackend):
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # Hash descartável: o tempo de resposta não revela se o usuário existe
+            get_pool().verify(password, None)
+            return None
+
+        matched, upgrade = get_pool().verify(password, user.password)
+        if not matched:
+            return None
+        if upgrade:
+            user.set_password(password)
+            user.save(update_fields=['password'])
+        if self.user_can_authenticate(user):
+            return user
+        return None
@@ -0,0 +1,127 @@
+"""
+Verificação de senhas fora das threads de requisição.
+
+O hash (PBKDF2 por padrão) roda em um pool de threads dedicado com
+``LOGIN_HASHING['WORKERS']`` threads; o ``hashlib`` libera o GIL durante o
+cálculo, então as leituras comuns da API continuam sendo atendidas. No
+máximo ``WORKERS + MAX_PENDING`` verificações ficam em andamento ou na fila
+(a vaga só é liberada quando o hash termina ou é cancelado); além disso
+``verify`` levanta ``LoginPoolSaturated`` e o login responde 503 com
+``Retry-After``. O login usa o pool pelo backend ``users.backends``.
+"""
+import atexit
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class LoginPoolSaturated(Exception):
+    def __init__(self, retry_after):
+        super().__init__('Pool de verificação de senhas saturado')
+        self.retry_after = retry_after
+
+
+class PasswordHashPool:
+    def __init__(self, workers=2, max_pending=16, wait_timeout=0.5, result_timeout=10.0):
+        self.workers = workers
+        self.wait_timeout = wait_timeout
+        self.result_timeout = result_timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hash')
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        self._lock = threading.Lock()
+        self._stats = {
+            'verified': 0,
+            'rejected': 0,
+            'in_flight': 0,
+            'total_hash_ms': 0.0,
+        }
+
+    def verify(self, password, encoded):
+        """
+        Retorna (senha confere, precisa atualizar o hash). Com ``encoded``
+        None roda um hash descartável para não revelar se o usuário existe.
+        """
+        if not self._slots.acquire(timeout=self.wait_timeout):
+            self._incr('rejected')
+            raise LoginPoolSaturated(retry_after=self.retry_after())
+        self._incr('in_flight')
+        try:
+            future = self._executor.submit(self._check, password, encoded)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        try:
+            return future.result(timeout=self.result_timeout)
+        except FutureTimeoutError:
+            # Retira da fila o hash que ainda não começou; um já em execução
+            # mantém a vaga até terminar
+            future.cancel()
+            self._incr('rejected')
+            raise LoginPoolSaturated(retry_after=self.retry_after())
+
+    def _release(self, future=None):
+        self._incr('in_flight', -1)
+        self._slots.release()
+
+    def _check(self, password, encoded):
+        started = time.perf_counter()
+        if encoded is None:
+            hashers.make_password(password)
+            matched, upgrade = False, False
+        else:
+            upgrades = []
+            # O setter só registra; a gravação do novo hash fica com o chamador
+            matched = hashers.check_password(password, encoded, setter=upgrades.append)
+            upgrade = bool(upgrades)
+        elapsed = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._stats['verified'] += 1
+            self._stats['total_hash_ms'] += elapsed
+        return matched, upgrade
+
+    def retry_after(self):
+        """
+        Estimativa em segundos para o pool esvaziar, pelo tempo médio de hash.
+        """
+        metrics = self.metrics()
+        backlog = metrics['in_flight'] / self.workers
+        return max(1, round(backlog * metrics['avg_hash_ms'] / 1000))
+
+    def metrics(self):
+        with self._lock:
+            stats = dict(self._stats)
+        total = stats.pop('total_hash_ms')
+        stats['avg_hash_ms'] = total / stats['verified'] if stats['verified'] else 0.0
+        stats['workers'] = self.workers
+        return stats
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+    def _incr(self, key, amount=1):
+        with self._lock:
+            self._stats[key] += amount
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            options = settings.LOGIN_HASHING
+            _pool = PasswordHashPool(
+                workers=options['WORKERS'],
+                max_pending=options['MAX_PENDING'],
+                wait_timeout=options['WAIT_TIMEOUT'],
+                result_timeout=options['RESULT_TIMEOUT'],
+            )
+            atexit.register(_pool.shutdown)
+    return _pool
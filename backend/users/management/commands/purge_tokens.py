@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from users import tokens
+
+
+class Command(BaseCommand):
+    help = 'Remove os tokens de autenticação vencidos em lotes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Tokens removidos por transação.',
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0.0,
+            help='Segundos de espera entre lotes.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Apenas conta os tokens vencidos, sem removê-los.',
+        )
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            expired = tokens.expired_tokens().count()
+            self.stdout.write(self.style.WARNING(f'{expired} tokens vencidos'))
+            return
+        removed = tokens.purge_expired(
+            batch_size=options['batch_size'],
+            pause=options['pause']
+        )
+        self.stdout.write(self.style.SUCCESS(f'{removed} tokens vencidos removidos'))
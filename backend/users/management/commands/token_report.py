@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from users import tokens
+
+
+class Command(BaseCommand):
+    help = 'Exibe o tamanho da tabela de tokens e a latência da busca por token'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--samples',
+            type=int,
+            default=200,
+            help='Quantidade de buscas usadas para medir a latência.',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=10,
+            help='Quantidade de usuários listados por número de tokens.',
+        )
+
+    def handle(self, *args, **options):
+        report = tokens.table_report(samples=options['samples'], top=options['top'])
+        self.stdout.write(
+            f"Tokens: {report['total']} | vencidos: {report['expired']} | "
+            f"sem validade: {report['without_expiry']} | "
+            f"limite por usuário: {report['max_per_user'] or 'sem limite'}"
+        )
+        for row in report['top_users']:
+            self.stdout.write(f"  {row['user__username']}: {row['tokens']} tokens")
+
+        latency = report['lookup_ms']
+        if latency is None:
+            self.stdout.write('Latência: tabela vazia')
+        else:
+            self.stdout.write(
+                f"Latência da busca ({latency['samples']} amostras): "
+                f"média {latency['avg']:.3f} ms | p50 {latency['p50']:.3f} ms | "
+                f"p95 {latency['p95']:.3f} ms | máx {latency['max']:.3f} ms"
+            )
+        self.stdout.write(f"Plano da busca: {report['lookup_plan']}")
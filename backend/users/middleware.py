@@ -1,42 +1,121 @@
+import threading
+import time
+
 from django.http import HttpResponseForbidden
 from django.utils.translation import gettext_lazy as _
 
+from .permissions import ACCESS_RULES
+
+
+def compile_requirement(requirement):
+    """
+    Converte um requisito declarativo em uma função (usuário) -> bool.
+    """
+    if requirement.startswith('perm:'):
+        codename = requirement[len('perm:'):]
+        return lambda user: user.has_permission(codename)
+    if requirement == 'security_access':
+        return lambda user: user.has_security_access()
+    if requirement == 'manager_access':
+        return lambda user: user.has_manager_access()
+    if requirement == 'admin_access':
+        return lambda user: user.has_admin_access()
+    raise ValueError(f'Requisito de acesso desconhecido: {requirement}')
+
+
+class AccessRouter:
+    """
+    Trie de segmentos de caminho compilada a partir de ``ACCESS_RULES``.
+
+    Cada nó com regra guarda o prefixo mais específico e a lista acumulada de
+    verificações dos prefixos ancestrais, então uma requisição faz uma única
+    descida pela trie.
+    """
+
+    def __init__(self, rules):
+        self.root = {}
+        for prefix in sorted(rules, key=len):
+            node = self.root
+            inherited = ()
+            for segment in self._segments(prefix):
+                node = node.setdefault(segment, {})
+                if '$rule' in node:
+                    inherited = node['$rule'][1]
+            checks = inherited + tuple(compile_requirement(r) for r in rules[prefix])
+            node['$rule'] = (prefix, checks)
+
+    @staticmethod
+    def _segments(path):
+        return [segment for segment in path.split('/') if segment]
+
+    def match(self, path):
+        """
+        Retorna (prefixo, verificações) da regra mais específica, ou None.
+        """
+        segments = self._segments(path)
+        if path.endswith('/'):
+            candidates = segments
+        else:
+            # Prefixos terminam em '/': o último segmento só conta se for completo
+            candidates = segments[:-1]
+        node = self.root
+        rule = None
+        for segment in candidates:
+            node = node.get(segment)
+            if node is None:
+                break
+            rule = node.get('$rule', rule)
+        return rule
+
+
+class AccessMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def record(self, prefix, allowed, elapsed_ns):
+        with self._lock:
+            entry = self._data.setdefault(
+                prefix, {'allowed': 0, 'denied': 0, 'total_ns': 0, 'max_ns': 0}
+            )
+            entry['allowed' if allowed else 'denied'] += 1
+            entry['total_ns'] += elapsed_ns
+            entry['max_ns'] = max(entry['max_ns'], elapsed_ns)
+
+    def snapshot(self):
+        with self._lock:
+            data = {prefix: dict(entry) for prefix, entry in self._data.items()}
+        for entry in data.values():
+            decisions = entry['allowed'] + entry['denied']
+            entry['avg_us'] = round(entry.pop('total_ns') / decisions / 1000, 3)
+            entry['max_us'] = round(entry.pop('max_ns') / 1000, 3)
+        return data
+
+
+router = AccessRouter(ACCESS_RULES)
+metrics = AccessMetrics()
+
 
 class PermissionMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
+        user = getattr(request, 'user', None)
         # Verificar se o usuário está autenticado
-        if not request.user.is_authenticated:
+        if user is None or not user.is_authenticated:
+            return self.get_response(request)
+
+        started = time.perf_counter_ns()
+        rule = router.match(request.path)
+        if rule is None:
             return self.get_response(request)
 
-        # Verificar se o usuário tem permissão para acessar a área restrita
-        if request.path.startswith('/api/security/areas/'):
-            if not request.user.has_permission('access_restricted_area'):
-                return HttpResponseForbidden(
-                    _('Você não tem permissão para acessar esta área.')
-                )
-
-        # Verificar se o usuário tem permissão para acessar a área de segurança
-        if request.path.startswith('/api/security/'):
-            if not request.user.has_security_access():
-                return HttpResponseForbidden(
-                    _('Você não tem permissão para acessar esta área.')
-                )
-
-        # Verificar se o usuário tem permissão para acessar a área de gerenciamento
-        if request.path.startswith('/api/management/'):
-            if not request.user.has_manager_access():
-                return HttpResponseForbidden(
-                    _('Você não tem permissão para acessar esta área.')
-                )
-
-        # Verificar se o usuário tem permissão para acessar a área de administração
-        if request.path.startswith('/api/admin/'):
-            if not request.user.has_admin_access():
-                return HttpResponseForbidden(
-                    _('Você não tem permissão para acessar esta área.')
-                )
-
-        return self.get_response(request) 
\ No newline at end of file
+        prefix, checks = rule
+        allowed = all(check(user) for check in checks)
+        metrics.record(prefix, allowed, time.perf_counter_ns() - started)
+        if not allowed:
+            return HttpResponseForbidden(
+                _('Você não tem permissão para acessar esta área.')
+            )
+        return self.get_response(request)
@@ -0,0 +1,44 @@
+from django.db import migrations, models
+
+# Índices extras na tabela do Knox: expurgo por validade e descarte dos
+# tokens mais antigos de cada usuário. A busca por prefixo já usa o índice
+# de ``token_key`` criado pelo próprio Knox.
+INDEXES = [
+    models.Index(fields=['expiry'], name='knox_token_expiry_idx'),
+    models.Index(fields=['user', 'created'], name='knox_token_user_created_idx'),
+]
+
+
+def _existing(schema_editor, model):
+    with schema_editor.connection.cursor() as cursor:
+        return schema_editor.connection.introspection.get_constraints(
+            cursor, model._meta.db_table
+        )
+
+
+def add_indexes(apps, schema_editor):
+    AuthToken = apps.get_model('knox', 'AuthToken')
+    existing = _existing(schema_editor, AuthToken)
+    for index in INDEXES:
+        if index.name not in existing:
+            schema_editor.add_index(AuthToken, index)
+
+
+def remove_indexes(apps, schema_editor):
+    AuthToken = apps.get_model('knox', 'AuthToken')
+    existing = _existing(schema_editor, AuthToken)
+    for index in INDEXES:
+        if index.name in existing:
+            schema_editor.remove_index(AuthToken, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        ('knox', '0009_extend_authtoken_field'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_indexes, remove_indexes),
+    ]
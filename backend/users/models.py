@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.utils.translation import gettext_lazy as _
+from .permission_cache import PERMISSION_BITS, decode_permissions, get_profile
 
 
 class Role(models.Model):
@@ -100,12 +101,15 @@ class User(AbstractUser):
         return self.user_type == 'admin'
 
     def has_permission(self, permission_codename):
-        return self.roles.filter(
-            permissions__codename=permission_codename
-        ).exists()
+        # Consulta ao bitset compilado, sem acesso ao banco após o primeiro uso
+        mask, extra = get_profile(self)
+        bit = PERMISSION_BITS.get(permission_codename)
+        if bit:
+            return bool(mask & bit)
+        return permission_codename in extra
+
+    def get_permission_codenames(self):
+        return decode_permissions(get_profile(self))
 
     def get_all_permissions(self):
-        permissions = set()
-        for role in self.roles.all():
-            permissions.update(role.permissions.all())
-        return permissions
+        return set(Permission.objects.filter(role__user=self).distinct())
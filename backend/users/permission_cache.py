@@ -0,0 +1,70 @@
+"""
+Conjunto de permissões efetivas de cada usuário, compilado em um bitset.
+
+A posição de cada permissão segue a ordem estável de
+``users.permissions.ALL_PERMISSIONS``; códigos fora dessa lista (criados
+direto no banco) ficam em um conjunto à parte. O perfil compilado fica no
+cache entre requisições e é invalidado pelos sinais em ``users.signals``.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from .permissions import ALL_PERMISSIONS
+
+PERMISSION_BITS = {
+    codename: 1 << position
+    for position, codename in enumerate(ALL_PERMISSIONS)
+}
+
+CACHE_KEY = 'users:permissions:{}'
+
+
+def compile_permissions(codenames):
+    """
+    Retorna (bitset, códigos desconhecidos) para uma coleção de códigos.
+    """
+    mask = 0
+    extra = set()
+    for codename in codenames:
+        bit = PERMISSION_BITS.get(codename)
+        if bit:
+            mask |= bit
+        else:
+            extra.add(codename)
+    return mask, frozenset(extra)
+
+
+def decode_permissions(profile):
+    mask, extra = profile
+    return {
+        codename for codename, bit in PERMISSION_BITS.items() if mask & bit
+    } | extra
+
+
+def get_profile(user):
+    """
+    Perfil compilado do usuário: memorizado na instância, depois no cache e,
+    só na falta de ambos, calculado com uma única consulta.
+    """
+    profile = getattr(user, '_permission_profile', None)
+    if profile is not None:
+        return profile
+
+    key = CACHE_KEY.format(user.pk)
+    profile = cache.get(key)
+    if profile is None:
+        from .models import Permission
+        codenames = Permission.objects.filter(
+            role__user=user
+        ).values_list('codename', flat=True).distinct()
+        profile = compile_permissions(codenames)
+        cache.set(key, profile, settings.PERMISSION_CACHE_TTL)
+
+    user._permission_profile = profile
+    return profile
+
+
+def invalidate(user_ids):
+    user_ids = [user_id for user_id in user_ids if user_id is not None]
+    if user_ids:
+        cache.delete_many([CACHE_KEY.format(user_id) for user_id in user_ids])
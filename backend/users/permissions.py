@@ -136,4 +136,18 @@ ROLES = {
         'access_restricted_area',
     ],
     'admin': list(ALL_PERMISSIONS.keys()),
-} 
\ No newline at end of file
+} 
+
+# Áreas protegidas por prefixo de rota e os requisitos de cada uma. Um
+# caminho precisa atender aos requisitos de todos os prefixos que casam com
+# ele (ex.: /api/security/areas/ exige acesso de segurança e a permissão).
+# Requisitos: 'security_access', 'manager_access', 'admin_access' ou
+# 'perm:<código>' (consultado no perfil de permissões compilado). As rotas
+# assíncronas (/api/async/) repetem as regras das síncronas equivalentes.
+ACCESS_RULES = {
+    '/api/security/': ['security_access'],
+    '/api/security/areas/': ['perm:access_restricted_area'],
+    '/api/async/security/': ['security_access'],
+    '/api/management/': ['manager_access'],
+    '/api/admin/': ['admin_access'],
+}
@@ -18,19 +18,7 @@ class AuthTokenSerializer(serializers.Serializer):
         logger.debug('Dados recebidos: username=%s, password=****', username)
 
         if username and password:
-            # Verificar se o usuário existe
-            try:
-                user = User.objects.get(username=username)
-                logger.debug('Usuário encontrado: %s', user.username)
-                logger.debug('Usuário ativo: %s', user.is_active)
-            except User.DoesNotExist:
-                logger.warning('Usuário não encontrado: %s', username)
-                raise serializers.ValidationError(
-                    'Credenciais inválidas. Verifique seu usuário e senha.',
-                    code='authorization'
-                )
-
-            # Tentar autenticar o usuário
+            # O hash da senha roda no pool dedicado (users.backends.PooledModelBackend)
             user = authenticate(
                 request=self.context.get('request'),
                 username=username,
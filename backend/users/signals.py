@@ -0,0 +1,75 @@
+from .models import Role, User
+from .permission_cache import invalidate
+
+
+def _users_with_roles(role_ids):
+    return list(User.objects.filter(roles__in=role_ids).values_list('pk', flat=True).distinct())
+
+
+def _users_with_permissions(permission_ids):
+    return list(
+        User.objects.filter(roles__permissions__in=permission_ids)
+        .values_list('pk', flat=True).distinct()
+    )
+
+
+def _forget(instance):
+    if isinstance(instance, User):
+        instance.__dict__.pop('_permission_profile', None)
+
+
+def user_roles_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    User.roles: ``instance`` é o usuário ou, no lado reverso, o papel.
+    """
+    if not reverse:
+        if action.startswith('post_'):
+            _forget(instance)
+            invalidate([instance.pk])
+        return
+
+    if action == 'pre_clear':
+        instance._permission_users = _users_with_roles([instance.pk])
+    elif action == 'post_clear':
+        invalidate(instance.__dict__.pop('_permission_users', []))
+    elif action in ('post_add', 'post_remove'):
+        invalidate(pk_set or [])
+
+
+def role_permissions_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Role.permissions: ``instance`` é o papel ou, no lado reverso, a permissão.
+    """
+    if action == 'pre_clear':
+        if reverse:
+            instance._permission_users = _users_with_permissions([instance.pk])
+        else:
+            instance._permission_users = _users_with_roles([instance.pk])
+    elif action == 'post_clear':
+        invalidate(instance.__dict__.pop('_permission_users', []))
+    elif action in ('post_add', 'post_remove'):
+        if reverse:
+            invalidate(_users_with_roles(pk_set or []))
+        else:
+            invalidate(_users_with_roles([instance.pk]))
+
+
+def collect_affected_users(sender, instance, **kwargs):
+    """
+    Antes de excluir um papel ou permissão, guarda os usuários afetados, pois
+    as linhas das tabelas intermediárias somem junto.
+    """
+    if isinstance(instance, Role):
+        instance._permission_users = _users_with_roles([instance.pk])
+    else:
+        instance._permission_users = _users_with_permissions([instance.pk])
+
+
+def invalidate_affected_users(sender, instance, **kwargs):
+    invalidate(instance.__dict__.pop('_permission_users', []))
+
+
+def permission_saved(sender, instance, created, **kwargs):
+    # Mudança de código altera o bitset de quem já tem a permissão
+    if not created:
+        invalidate(_users_with_permissions([instance.pk]))
@@ -1,3 +1,233 @@
+import datetime
+import threading
+
+from django.contrib.auth import hashers
+from django.contrib.auth.signals import user_login_failed
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from knox.models import AuthToken
+from rest_framework.test import APIClient
+
+from .authentication import REFRESH_LOCK_KEY, TOKEN_KEY
+from .hashing import LoginPoolSaturated, PasswordHashPool
+from .models import Permission, Role, User
+from .permission_cache import compile_permissions, decode_permissions
+from .tokens import issue_token
+
+
+class PermissionProfileTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.view = Permission.objects.create(name='Ver veículo', codename='view_vehicle')
+        self.change = Permission.objects.create(name='Alterar veículo', codename='change_vehicle')
+        self.custom = Permission.objects.create(name='Abrir cofre', codename='open_vault')
+        self.role = Role.objects.create(name='Frota')
+        self.role.permissions.add(self.view, self.custom)
+        self.user = User.objects.create_user('lucius', password='x')
+        self.user.roles.add(self.role)
+
+    def fresh_user(self):
+        return User.objects.get(pk=self.user.pk)
+
+    def test_compile_round_trip(self):
+        profile = compile_permissions(['view_vehicle', 'open_vault'])
+        self.assertEqual(profile[1], frozenset({'open_vault'}))
+        self.assertEqual(decode_permissions(profile), {'view_vehicle', 'open_vault'})
+
+    def test_has_permission_uses_compiled_profile(self):
+        user = self.fresh_user()
+        with self.assertNumQueries(1):
+            self.assertTrue(user.has_permission('view_vehicle'))
+            self.assertTrue(user.has_permission('open_vault'))
+            self.assertFalse(user.has_permission('change_vehicle'))
+        self.assertEqual(user.get_permission_codenames(), {'view_vehicle', 'open_vault'})
+
+        # Outra instância do mesmo usuário lê o perfil do cache
+        user = self.fresh_user()
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_permission('view_vehicle'))
+
+    def test_role_permission_change_invalidates(self):
+        self.assertFalse(self.fresh_user().has_permission('change_vehicle'))
+        self.role.permissions.add(self.change)
+        self.assertTrue(self.fresh_user().has_permission('change_vehicle'))
+        self.role.permissions.remove(self.view)
+        self.assertFalse(self.fresh_user().has_permission('view_vehicle'))
+        self.role.permissions.clear()
+        self.assertEqual(self.fresh_user().get_permission_codenames(), set())
+
+    def test_user_roles_change_invalidates(self):
+        self.assertTrue(self.user.has_permission('view_vehicle'))
+        self.user.roles.remove(self.role)
+        # A própria instância também esquece o perfil memorizado
+        self.assertFalse(self.user.has_permission('view_vehicle'))
+        self.role.user_set.add(self.user)
+        self.assertTrue(self.fresh_user().has_permission('view_vehicle'))
+        self.role.user_set.clear()
+        self.assertFalse(self.fresh_user().has_permission('view_vehicle'))
+
+    def test_delete_and_rename_invalidate(self):
+        self.assertTrue(self.fresh_user().has_permission('open_vault'))
+        self.custom.codename = 'open_safe'
+        self.custom.save()
+        user = self.fresh_user()
+        self.assertFalse(user.has_permission('open_vault'))
+        self.assertTrue(user.has_permission('open_safe'))
+
+        self.view.delete()
+        self.assertFalse(self.fresh_user().has_permission('view_vehicle'))
+        self.role.delete()
+        self.assertEqual(self.fresh_user().get_permission_codenames(), set())
+
+
+class CachedTokenAuthenticationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('bruce', password='x')
+        self.instance, token = issue_token(self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token}')
+
+    def token_queries(self, path='/api/auth/user/'):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path)
+        return response, [q['sql'] for q in queries if 'knox_authtoken' in q['sql']]
+
+    def test_verified_token_is_cached(self):
+        response, queries = self.token_queries()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(queries)
+
+        response, queries = self.token_queries()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['user']['username'], 'bruce')
+        self.assertEqual(queries, [])
+
+    def test_logout_invalidates_cached_token(self):
+        self.assertEqual(self.client.get('/api/auth/user/').status_code, 200)
+        self.assertEqual(self.client.post('/api/auth/logout/').status_code, 204)
+        self.assertEqual(self.client.get('/api/auth/user/').status_code, 401)
+
+    def test_user_change_invalidates_cached_token(self):
+        self.assertEqual(self.client.get('/api/auth/user/').status_code, 200)
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get('/api/auth/user/').status_code, 401)
+
+    def test_expired_cached_token_is_rejected(self):
+        self.assertEqual(self.client.get('/api/auth/user/').status_code, 200)
+        past = timezone.now() - datetime.timedelta(minutes=1)
+        AuthToken.objects.filter(digest=self.instance.digest).update(expiry=past)
+        key = TOKEN_KEY.format(self.instance.digest)
+        entry = cache.get(key)
+        entry['expiry'] = past
+        cache.set(key, entry)
+        self.assertEqual(self.client.get('/api/auth/user/').status_code, 401)
+
+    def test_auto_refresh_is_coalesced(self):
+        AuthToken.objects.filter(digest=self.instance.digest).update(
+            expiry=timezone.now() + datetime.timedelta(days=1)
+        )
+        updates = []
+        for _ in range(3):
+            response, queries = self.token_queries()
+            self.assertEqual(response.status_code, 200)
+            updates += [sql for sql in queries if sql.startswith('UPDATE')]
+        # Uma única gravação da nova validade dentro do intervalo
+        self.assertEqual(len(updates), 1)
+        self.assertIsNotNone(cache.get(REFRESH_LOCK_KEY.format(self.instance.digest)))
+        expiry = AuthToken.objects.get(digest=self.instance.digest).expiry
+        self.assertGreater(expiry, timezone.now() + datetime.timedelta(days=6))
+
+
+class PasswordHashPoolTest(TestCase):
+    def setUp(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.checks = []
+        self.pool = PasswordHashPool(workers=1, max_pending=1, wait_timeout=0.01, result_timeout=0.05)
+        self.addCleanup(self.pool.shutdown)
+        self.addCleanup(self.release.set)
+
+        def check(password, encoded):
+            self.checks.append(password)
+            self.started.set()
+            self.release.wait(5)
+            return True, False
+        self.pool._check = check
+
+    def busy_worker(self):
+        # Ocupa a única thread do pool até ``release``
+        thread = threading.Thread(target=self.verify_quietly, args=('primeira',))
+        thread.start()
+        self.started.wait(5)
+        return thread
+
+    def verify_quietly(self, password):
+        try:
+            self.pool.verify(password, 'hash')
+        except LoginPoolSaturated:
+            pass
+
+    def test_timed_out_queued_hash_is_cancelled(self):
+        thread = self.busy_worker()
+        with self.assertRaises(LoginPoolSaturated):
+            self.pool.verify('na fila', 'hash')
+        # A vaga da verificação cancelada volta na hora
+        self.assertEqual(self.pool.metrics()['in_flight'], 1)
+        self.release.set()
+        thread.join()
+        self.pool._executor.submit(lambda: None).result(5)
+        self.assertEqual(self.checks, ['primeira'])
+        self.assertEqual(self.pool.metrics()['in_flight'], 0)
+
+    def test_running_hash_keeps_slot_until_done(self):
+        thread = self.busy_worker()
+        thread.join()
+        # O hash em execução não pode ser cancelado e continua ocupando a vaga
+        self.assertEqual(self.pool.metrics()['in_flight'], 1)
+        self.release.set()
+        self.pool._executor.submit(lambda: None).result(5)
+        self.assertEqual(self.pool.metrics()['in_flight'], 0)
+
+
+class LoginTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('bruce', password='batcaverna')
+        self.client = APIClient()
+        self.failures = []
+
+        def record(sender, credentials, **kwargs):
+            self.failures.append(credentials['username'])
+        user_login_failed.connect(record)
+        self.addCleanup(user_login_failed.disconnect, record)
+
+    def login(self, username, password):
+        return self.client.post('/api/auth/login/', {'username': username, 'password': password}, format='json')
+
+    def test_login_goes_through_authenticate(self):
+        response = self.login('bruce', 'batcaverna')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['token'])
+        self.assertEqual(self.failures, [])
+
+    def test_failed_logins_send_signal(self):
+        self.assertEqual(self.login('bruce', 'errada').status_code, 401)
+        self.assertEqual(self.login('coringa', 'errada').status_code, 401)
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.login('bruce', 'batcaverna').status_code, 401)
+        self.assertEqual(len(self.failures), 3)
 
-# Create your tests here.
+    def test_outdated_hash_is_upgraded(self):
+        hasher = hashers.PBKDF2PasswordHasher()
+        old = hasher.encode('batcaverna', hasher.salt(), iterations=1000)
+        self.user.password = old
+        self.user.save()
+        self.assertEqual(self.login('bruce', 'batcaverna').status_code, 200)
+        self.user.refresh_from_db()
+        self.assertNotEqual(self.user.password, old)
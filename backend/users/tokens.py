@@ -0,0 +1,109 @@
+"""
+Ciclo de vida dos tokens Knox.
+
+``issue_token`` cria o token do login/registro e descarta os mais antigos do
+usuário além de ``TOKEN_MAX_PER_USER``. ``purge_expired`` remove tokens
+vencidos em lotes curtos (uma transação por lote) e ``table_report`` mede o
+tamanho da tabela e a latência da busca por prefixo (``token_key``).
+"""
+import random
+import statistics
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+from knox.models import get_token_model
+
+
+def issue_token(user):
+    """
+    Cria um token para o usuário e aplica o limite por usuário, removendo os
+    tokens mais antigos. Retorna (instância, token em texto).
+    """
+    AuthToken = get_token_model()
+    with transaction.atomic():
+        instance, token = AuthToken.objects.create(user)
+        limit = settings.TOKEN_MAX_PER_USER
+        if limit:
+            evicted = list(
+                AuthToken.objects.filter(user=user)
+                .order_by('-created', '-digest')
+                .values_list('digest', flat=True)[limit:]
+            )
+            if evicted:
+                AuthToken.objects.filter(digest__in=evicted).delete()
+    return instance, token
+
+
+def expired_tokens(now=None):
+    return get_token_model().objects.filter(expiry__lt=now or timezone.now())
+
+
+def purge_expired(batch_size=1000, pause=0.0, now=None):
+    """
+    Remove tokens vencidos em lotes de ``batch_size``, com uma transação curta
+    por lote e ``pause`` segundos entre lotes. Retorna o total removido.
+    """
+    AuthToken = get_token_model()
+    now = now or timezone.now()
+    removed = 0
+    while True:
+        digests = list(
+            expired_tokens(now).order_by('expiry')
+            .values_list('digest', flat=True)[:batch_size]
+        )
+        if not digests:
+            return removed
+        with transaction.atomic():
+            removed += AuthToken.objects.filter(digest__in=digests).delete()[0]
+        if len(digests) < batch_size:
+            return removed
+        if pause:
+            time.sleep(pause)
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def table_report(samples=200, top=10):
+    """
+    Tamanho da tabela de tokens, distribuição por usuário e latência (ms) da
+    busca por ``token_key``, medida com prefixos reais sorteados.
+    """
+    AuthToken = get_token_model()
+    now = timezone.now()
+    tokens = AuthToken.objects.order_by()
+    report = {
+        'total': tokens.count(),
+        'expired': tokens.filter(expiry__lt=now).count(),
+        'without_expiry': tokens.filter(expiry__isnull=True).count(),
+        'max_per_user': settings.TOKEN_MAX_PER_USER,
+        'top_users': list(
+            tokens.values('user__username')
+            .annotate(tokens=Count('digest'))
+            .order_by('-tokens')[:top]
+        ),
+        'lookup_ms': None,
+    }
+
+    keys = list(tokens.values_list('token_key', flat=True)[:samples * 10])
+    if keys:
+        latencies = []
+        for key in random.sample(keys, min(samples, len(keys))):
+            started = time.perf_counter()
+            list(AuthToken.objects.filter(token_key=key).values_list('digest', flat=True))
+            latencies.append((time.perf_counter() - started) * 1000)
+        report['lookup_ms'] = {
+            'samples': len(latencies),
+            'avg': statistics.mean(latencies),
+            'p50': _percentile(latencies, 0.5),
+            'p95': _percentile(latencies, 0.95),
+            'max': max(latencies),
+        }
+
+    report['lookup_plan'] = AuthToken.objects.filter(token_key='').only('digest').explain()
+    return report
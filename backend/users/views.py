@@ -6,11 +6,13 @@ from django.contrib.auth import get_user_model
 from .serializers import (
     UserSerializer, UserCreateSerializer, UserUpdateSerializer
 )
-from .permissions import IsAdminOrSecurityAdmin, IsAdminOrManager
+from .permissions import IsAdmin, IsAdminOrSecurityAdmin, IsAdminOrManager
+from .middleware import metrics as access_metrics
+from wayne_backend.conditional import ConditionalGetMixin
 
 User = get_user_model()
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -25,6 +27,8 @@ class UserViewSet(viewsets.ModelViewSet):
     def get_permissions(self):
         if self.action in ['create', 'destroy']:
             permission_classes = [IsAdminOrSecurityAdmin]
+        elif self.action == 'access_metrics':
+            permission_classes = [IsAdmin]
         elif self.action in ['update', 'partial_update']:
             permission_classes = [IsAdminOrManager]
         else:
@@ -36,6 +40,13 @@ class UserViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(request.user)
         return Response(serializer.data)
 
+    @action(detail=False, methods=['get'], url_path='access-metrics')
+    def access_metrics(self, request):
+        """
+        Decisões e latência de autorização por prefixo (PermissionMiddleware).
+        """
+        return Response(access_metrics.snapshot())
+
     @action(detail=True, methods=['post'])
     def change_password(self, request, pk=None):
         user = self.get_object()
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.10 on 2026-10-18 14:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vehicles', '0004_alter_vehicle_vin'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='vehicle',
+            name='fuel_type',
+            field=models.CharField(choices=[('GASOLINE', 'Gasolina'), ('ETHANOL', 'Etanol'), ('DIESEL', 'Diesel'), ('FLEX', 'Flex'), ('ELECTRIC', 'Elétrico'), ('HYBRID', 'Híbrido')], db_index=True, default='FLEX', max_length=20, verbose_name='Tipo de Combustível'),
+        ),
+        migrations.AlterField(
+            model_name='vehicle',
+            name='status',
+            field=models.CharField(choices=[('ACTIVE', 'Ativo'), ('MAINTENANCE', 'Em Manutenção'), ('INACTIVE', 'Inativo')], db_index=True, default='ACTIVE', max_length=20, verbose_name='Status'),
+        ),
+        migrations.AlterField(
+            model_name='vehicle',
+            name='type',
+            field=models.CharField(choices=[('car', 'Carro'), ('motorcycle', 'Motocicleta'), ('truck', 'Caminhão'), ('van', 'Van'), ('other', 'Outro')], db_index=True, max_length=20, verbose_name='Tipo'),
+        ),
+    ]
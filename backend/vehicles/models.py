@@ -1,7 +1,10 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
+from core.counters import CountedModel
+
+class Vehicle(CountedModel):
+    counter_dimensions = ('status', 'type', 'fuel_type')
 
-class Vehicle(models.Model):
     FUEL_CHOICES = [
         ('GASOLINE', 'Gasolina'),
         ('ETHANOL', 'Etanol'),
@@ -26,7 +29,7 @@ class Vehicle(models.Model):
     ]
 
     name = models.CharField(_('Nome'), max_length=100)
-    type = models.CharField(_('Tipo'), max_length=20, choices=VEHICLE_TYPES)
+    type = models.CharField(_('Tipo'), max_length=20, choices=VEHICLE_TYPES, db_index=True)
     model = models.CharField(_('Modelo'), max_length=100)
     manufacturer = models.CharField(_('Fabricante'), max_length=100)
     year = models.IntegerField(_('Ano'))
@@ -36,14 +39,16 @@ class Vehicle(models.Model):
         _('Status'),
         max_length=20,
         choices=STATUS_CHOICES,
-        default='ACTIVE'
+        default='ACTIVE',
+        db_index=True
     )
     mileage = models.IntegerField(_('Quilometragem'))
     fuel_type = models.CharField(
         _('Tipo de Combustível'),
         max_length=20,
         choices=FUEL_CHOICES,
-        default='FLEX'
+        default='FLEX',
+        db_index=True
     )
     last_maintenance = models.DateField(_('Última Manutenção'), null=True, blank=True)
     next_maintenance = models.DateField(_('Próxima Manutenção'), null=True, blank=True)
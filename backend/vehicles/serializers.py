@@ -1,6 +1,10 @@
+import logging
+
 from rest_framework import serializers
 from .models import Vehicle
 
+logger = logging.getLogger(__name__)
+
 
 class VehicleSerializer(serializers.ModelSerializer):
     def validate(self, data):
@@ -13,7 +17,7 @@ class VehicleSerializer(serializers.ModelSerializer):
         if 'next_maintenance' not in data:
             data['next_maintenance'] = None
 
-        print("Dados recebidos após validação:", data)  # Debug
+        logger.debug("Dados recebidos após validação: %s", data)
         return data
 
     class Meta:
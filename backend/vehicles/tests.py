@@ -1,3 +1,74 @@
+import datetime
+
 from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from users.models import User
+from wayne_backend.fastread import get_plan
+from .models import Vehicle
+from .serializers import VehicleSerializer
+
+
+class FastReadParityTest(TestCase):
+    """
+    A leitura compilada deve gerar o mesmo JSON que o VehicleSerializer.
+    """
+
+    def setUp(self):
+        Vehicle.objects.create(
+            name='Batmóvel', type='car', model='Tumbler', manufacturer='Wayne',
+            year=2008, license_plate='WAY-0001', vin='VIN0001', mileage=1200,
+            fuel_type='ELECTRIC', last_maintenance=datetime.date(2024, 1, 31),
+            notes='', color='preto'
+        )
+        Vehicle.objects.create(
+            name='Batwing', type='other', model='BW-2', manufacturer='Wayne',
+            year=2012, license_plate='WAY-0002', vin='VIN0002', mileage=0,
+            color='preto', status='MAINTENANCE'
+        )
+        user = User.objects.create_user('parity', password='x', user_type='admin')
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+
+    def expected(self, queryset):
+        return JSONRenderer().render(VehicleSerializer(queryset, many=True).data)
+
+    def test_plan_matches_serializer(self):
+        plan = get_plan(VehicleSerializer)
+        self.assertIsNotNone(plan)
+        queryset = Vehicle.objects.order_by('pk')
+        rendered = JSONRenderer().render(plan.render(queryset.values(*plan.columns)))
+        self.assertEqual(rendered, self.expected(queryset))
+
+    def test_list_and_retrieve_match_serializer(self):
+        response = self.client.get('/api/vehicles/', {'ordering': 'name'})
+        self.assertEqual(
+            JSONRenderer().render(response.data['results']),
+            self.expected(Vehicle.objects.order_by('name'))
+        )
+
+        vehicle = Vehicle.objects.get(license_plate='WAY-0001')
+        response = self.client.get(f'/api/vehicles/{vehicle.pk}/')
+        self.assertEqual(
+            JSONRenderer().render(response.data),
+            JSONRenderer().render(VehicleSerializer(vehicle).data)
+        )
+
+    def test_sparse_fields_and_columnar_layout(self):
+        response = self.client.get('/api/vehicles/', {'fields': 'license_plate,name', 'ordering': 'name'})
+        self.assertEqual(response.data['results'], [
+            {'name': 'Batmóvel', 'license_plate': 'WAY-0001'},
+            {'name': 'Batwing', 'license_plate': 'WAY-0002'},
+        ])
+
+        response = self.client.get('/api/vehicles/', {'exclude': 'notes', 'layout': 'columnar', 'ordering': 'name'})
+        expected = [
+            {name: value for name, value in item.items() if name != 'notes'}
+            for item in VehicleSerializer(Vehicle.objects.order_by('name'), many=True).data
+        ]
+        results = response.data['results']
+        self.assertEqual([dict(zip(results['columns'], row)) for row in results['rows']], expected)
 
-# Create your tests here.
+        response = self.client.get('/api/vehicles/', {'fields': 'unknown'})
+        self.assertEqual(response.status_code, 400)
@@ -1,10 +1,14 @@
 from django.urls import path
+from core.views import CSVImportView
 from .views import (
+    VehicleBulkUpdateView,
     VehicleListCreateView,
     VehicleRetrieveUpdateDestroyView
 )
 
 urlpatterns = [
     path('', VehicleListCreateView.as_view(), name='vehicle-list-create'),
+    path('bulk/', VehicleBulkUpdateView.as_view(), name='vehicle-bulk-update'),
+    path('import/', CSVImportView.as_view(source='vehicles'), name='vehicle-import'),
     path('<int:pk>/', VehicleRetrieveUpdateDestroyView.as_view(), name='vehicle-detail'),
 ] 
\ No newline at end of file
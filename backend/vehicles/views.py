@@ -2,10 +2,15 @@ from rest_framework import generics, permissions
 from .models import Vehicle
 from .serializers import VehicleSerializer
 from users.permissions import IsAdminOrManager
+from wayne_backend.bulk import BulkUpdateMixin
+from wayne_backend.conditional import ConditionalGetMixin
+from wayne_backend.fastread import FastReadMixin
+from wayne_backend.response_cache import ResponseCacheMixin
+from wayne_backend.streaming import StreamingListMixin
 
 # Create your views here.
 
-class VehicleListCreateView(generics.ListCreateAPIView):
+class VehicleListCreateView(StreamingListMixin, ResponseCacheMixin, ConditionalGetMixin, FastReadMixin, generics.ListCreateAPIView):
     """
     API endpoint que permite listar e criar veículos.
     """
@@ -23,17 +28,7 @@ class VehicleListCreateView(generics.ListCreateAPIView):
     ordering_fields = ['name', 'status', 'mileage', 'created_at', 'updated_at']
     ordering = ['name']
 
-    def get_queryset(self):
-        """
-        Opcionalmente filtra o conjunto de resultados com base em parâmetros da URL
-        """
-        queryset = Vehicle.objects.all()
-        status = self.request.query_params.get('status', None)
-        if status is not None:
-            queryset = queryset.filter(status=status)
-        return queryset
-
-class VehicleRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class VehicleRetrieveUpdateDestroyView(ResponseCacheMixin, ConditionalGetMixin, FastReadMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     API endpoint que permite visualizar, atualizar e deletar um veículo específico.
     """
@@ -45,3 +40,16 @@ class VehicleRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         if self.request.method == 'GET':
             return [permissions.IsAuthenticated()]
         return [IsAdminOrManager()]
+
+class VehicleBulkUpdateView(BulkUpdateMixin, generics.GenericAPIView):
+    """
+    API endpoint que altera vários veículos de uma vez (PATCH).
+    """
+    queryset = Vehicle.objects.all()
+    serializer_class = VehicleSerializer
+    permission_classes = [IsAdminOrManager]
+    filterset_fields = ['type', 'status', 'fuel_type']
+    search_fields = ['name', 'license_plate', 'vin', 'model', 'manufacturer']
+
+    def patch(self, request, *args, **kwargs):
+        return self.bulk_update(request)
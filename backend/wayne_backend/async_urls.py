@@ -0,0 +1,31 @@
+"""
+Rotas de leitura assíncronas (``api/async/``), servidas pelo ``asgi.py``.
+Mesma saída das rotas síncronas correspondentes.
+"""
+from django.urls import path
+from devices.views import DeviceViewSet
+from equipment.views import EquipmentViewSet
+from security.views import SecurityIncidentViewSet, SecurityLogViewSet
+from vehicles.views import VehicleListCreateView, VehicleRetrieveUpdateDestroyView
+from .asyncread import AsyncReadView
+from .dashboard import AsyncDashboardView
+
+
+def read_routes(prefix, list_view, detail_view=None):
+    detail_view = detail_view or list_view
+    return [
+        path(f'{prefix}/', AsyncReadView.as_view(view_class=list_view, action='list'),
+             name=f'async-{prefix.replace("/", "-")}-list'),
+        path(f'{prefix}/<int:pk>/', AsyncReadView.as_view(view_class=detail_view, action='retrieve'),
+             name=f'async-{prefix.replace("/", "-")}-detail'),
+    ]
+
+
+urlpatterns = [
+    path('dashboard/', AsyncDashboardView.as_view(), name='async-dashboard'),
+    *read_routes('vehicles', VehicleListCreateView, VehicleRetrieveUpdateDestroyView),
+    *read_routes('equipment', EquipmentViewSet),
+    *read_routes('devices', DeviceViewSet),
+    *read_routes('security/logs', SecurityLogViewSet),
+    *read_routes('security/incidents', SecurityIncidentViewSet),
+]
@@ -0,0 +1,151 @@
+"""
+Caminho de leitura assíncrono (ASGI) para list/retrieve.
+
+``AsyncReadView`` reaproveita a configuração de uma view DRF existente
+(autenticação, permissões, filtros, paginação, serializer e plano compilado
+de ``fastread``), mas é uma view assíncrona do Django: a preparação (token,
+permissões, montagem do queryset) roda em uma única chamada
+``sync_to_async`` e as consultas da página usam o ORM assíncrono (``acount``,
+``aget`` e iteração com ``async for``). Sob ``asgi.py`` a conexão aguarda o
+banco sem ocupar um worker inteiro, como acontece no WSGI.
+
+O cache de respostas e o GET condicional ficam no caminho síncrono; estas
+rotas sempre consultam o banco.
+"""
+import inspect
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ObjectDoesNotExist, ValidationError as DjangoValidationError
+from django.core.paginator import InvalidPage
+from django.views import View
+from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from users.middleware import router as access_router
+from .fastread import checks_object_permissions
+from .pagination import KeysetPagination
+
+
+async def apaginate(paginator, queryset, request, view):
+    """
+    Equivalente assíncrono de ``paginator.paginate_queryset``.
+    """
+    if isinstance(paginator, KeysetPagination):
+        query = paginator.page_queryset(queryset, request, view)
+        return paginator.set_page([row async for row in query])
+    if not isinstance(paginator, PageNumberPagination):
+        return await sync_to_async(paginator.paginate_queryset)(queryset, request, view)
+
+    page_size = paginator.get_page_size(request)
+    if not page_size:
+        return None
+    django_paginator = paginator.django_paginator_class(queryset, page_size)
+    django_paginator.count = await queryset.acount()
+    page_number = request.query_params.get(paginator.page_query_param) or 1
+    if page_number in paginator.last_page_strings:
+        page_number = django_paginator.num_pages
+    try:
+        page = django_paginator.page(page_number)
+    except InvalidPage as exc:
+        raise NotFound(paginator.invalid_page_message.format(
+            page_number=page_number, message=str(exc)
+        ))
+    page.object_list = [row async for row in page.object_list]
+    paginator.page = page
+    paginator.request = request
+    return list(page)
+
+
+class AsyncAPIView(View):
+    """
+    Base das views assíncronas: monta a view DRF de ``view_class`` para a
+    requisição, executa ``initial`` (autenticação, permissões, throttling) e
+    ``prepare`` fora do event loop e então aguarda ``read``.
+
+    Subclasses definem ``async def read(self, view, request, state, **kwargs)``,
+    que recebe o retorno de ``prepare`` e devolve a ``Response``; a ausência
+    é acusada na definição da classe.
+    """
+    view_class = None
+    action = None
+    http_method_names = ['get']
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not inspect.iscoroutinefunction(getattr(cls, 'read', None)):
+            raise TypeError(f'{cls.__name__} deve definir "async def read(...)"')
+
+    async def get(self, request, **kwargs):
+        view = self.view_class()
+        try:
+            state = await sync_to_async(self.initial)(view, request, kwargs)
+            response = await self.read(view, view.request, state, **kwargs)
+        except Exception as exc:
+            response = view.handle_exception(exc)
+        return view.finalize_response(view.request, response).render()
+
+    def initial(self, view, request, kwargs):
+        view.args, view.kwargs = (), kwargs
+        view.format_kwarg = None
+        view.action_map = {'get': self.action}
+        view.renderer_classes = [JSONRenderer]
+        view.request = view.initialize_request(request, **kwargs)
+        view.headers = view.default_response_headers
+        view.initial(view.request)
+        self.check_access_rules(view.request)
+        return self.prepare(view, view.request)
+
+    def check_access_rules(self, request):
+        # Mesmas regras de ``ACCESS_RULES`` do PermissionMiddleware, aplicadas
+        # depois da autenticação por token do DRF
+        rule = access_router.match(request.path)
+        if rule is not None and not all(check(request.user) for check in rule[1]):
+            raise PermissionDenied('Você não tem permissão para acessar esta área.')
+
+    def prepare(self, view, request):
+        return None
+
+
+class AsyncReadView(AsyncAPIView):
+    """
+    List (sem ``pk`` na URL) e retrieve de uma view DRF, com a mesma saída.
+    """
+
+    def prepare(self, view, request):
+        # Filtros podem consultar o banco (ex.: índice de texto completo)
+        return view.filter_queryset(view.get_queryset())
+
+    async def read(self, view, request, queryset, **kwargs):
+        plan = view.get_read_plan() if hasattr(view, 'get_read_plan') else None
+        lookup_url_kwarg = view.lookup_url_kwarg or view.lookup_field
+        if lookup_url_kwarg in kwargs:
+            lookup = {view.lookup_field: kwargs[lookup_url_kwarg]}
+            return await self.retrieve(view, request, queryset, plan, lookup)
+        return await self.list(view, request, queryset, plan)
+
+    async def list(self, view, request, queryset, plan):
+        rows = view.get_read_rows(queryset, plan) if plan else queryset
+        if view.paginator is None:
+            return Response(self.render(view, plan, [row async for row in rows]))
+        page = await apaginate(view.paginator, rows, request, view)
+        if page is None:
+            return Response(self.render(view, plan, [row async for row in rows]))
+        return view.paginator.get_paginated_response(self.render(view, plan, page))
+
+    async def retrieve(self, view, request, queryset, plan, lookup):
+        try:
+            if plan is not None and not checks_object_permissions(view):
+                row = await view.get_read_rows(queryset, plan).aget(**lookup)
+                return Response(plan.render_one(row))
+            instance = await queryset.aget(**lookup)
+        except (ObjectDoesNotExist, TypeError, ValueError, DjangoValidationError):
+            raise NotFound()
+        await sync_to_async(view.check_object_permissions)(request, instance)
+        return Response(view.get_serializer(instance).data)
+
+    def render(self, view, plan, items):
+        if plan is not None:
+            return view.render_rows(plan, items)
+        return view.get_serializer(items, many=True).data
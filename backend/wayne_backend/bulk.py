@@ -0,0 +1,139 @@
+"""
+Alteração em massa (PATCH) de inventário.
+
+``PATCH <recurso>/bulk/`` recebe ``{"ids": [...], "changes": {...}}`` ou os
+mesmos filtros da listagem na query string (``?status=available&search=...``)
+com ``{"changes": {...}}``. Parâmetros que não são filtros declarados são
+recusados, para que um filtro com erro de digitação não altere tudo. As alterações passam pelo serializer em modo
+parcial e são gravadas com um único ``UPDATE ... WHERE``, com ``updated_at``
+atualizado. O ``CountedQuerySet`` ajusta os contadores e envia
+``bulk_changed``, que invalida o cache de respostas e o índice de busca.
+"""
+from django.utils import timezone
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from users.permissions import IsAdminOrManager
+
+# Parâmetros da listagem aceitos na query string, mas que não restringem o
+# conjunto alterado. Qualquer outro parâmetro que não seja filtro é recusado.
+NON_FILTER_PARAMS = {'ordering', 'page', 'page_size', 'cursor', 'format'}
+
+
+class BulkUpdateMixin:
+    """
+    Acrescenta a ação ``bulk`` a um ViewSet. Views genéricas podem chamar
+    ``bulk_update`` a partir de ``patch``.
+    """
+    bulk_max_ids = 10000
+
+    @action(detail=False, methods=['patch'], url_path='bulk', permission_classes=[IsAdminOrManager])
+    def bulk(self, request, *args, **kwargs):
+        return self.bulk_update(request)
+
+    def bulk_update(self, request):
+        data = request.data if isinstance(request.data, dict) else {}
+        ids = data.get('ids')
+        changes = data.get('changes')
+        if not isinstance(changes, dict) or not changes:
+            return Response(
+                {'error': 'Informe os campos a alterar em "changes".'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        has_filters, errors = self.check_bulk_filters(request)
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        if ids is None and not has_filters and data.get('all') is not True:
+            return Response(
+                {'error': 'Informe "ids", filtros na query string ou "all": true.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if ids is not None:
+            if not isinstance(ids, list) or not all(isinstance(pk, int) for pk in ids):
+                return Response(
+                    {'error': '"ids" deve ser uma lista de inteiros.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if len(ids) > self.bulk_max_ids:
+                return Response(
+                    {'error': f'Máximo de {self.bulk_max_ids} ids por requisição.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        errors = self.check_bulk_fields(changes)
+        if errors:
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = self.get_serializer(data=changes, partial=True)
+        serializer.is_valid(raise_exception=True)
+        # validate() pode preencher campos ausentes; grava só o que foi enviado
+        values = {name: value for name, value in serializer.validated_data.items() if name in changes}
+
+        queryset = self.filter_queryset(self.get_queryset())
+        if ids is not None:
+            queryset = queryset.filter(pk__in=ids)
+        model = queryset.model
+        # Subconsulta por pk: descarta ordenação e anotações da listagem
+        target = model._default_manager.filter(pk__in=queryset.values('pk'))
+        updated = target.update(**values, updated_at=timezone.now())
+
+        result = {'updated': updated, 'changes': {
+            name: None if value is None else serializer.fields[name].to_representation(value)
+            for name, value in values.items()
+        }}
+        if ids is not None:
+            result['requested'] = len(set(ids))
+            if updated < result['requested']:
+                found = set(model._default_manager.filter(pk__in=ids).values_list('pk', flat=True))
+                result['not_found'] = sorted(set(ids) - found)
+        return Response(result)
+
+    def check_bulk_filters(self, request):
+        """
+        Retorna (há filtro efetivo, erros). Só contam filtros declarados com
+        valor e a busca não vazia; parâmetros desconhecidos (ex.: um filtro
+        digitado errado, que o django-filter ignoraria) são recusados.
+        """
+        known = set(NON_FILTER_PARAMS)
+        active = False
+        for backend_class in self.filter_backends:
+            backend = backend_class()
+            if isinstance(backend, DjangoFilterBackend):
+                filterset = backend.get_filterset(request, self.get_queryset(), self)
+                if filterset is None:
+                    continue
+                known.update(filterset.form.fields)
+                if not filterset.is_valid():
+                    return False, filterset.errors
+                active = active or any(
+                    value not in (None, '', [], ())
+                    for value in filterset.form.cleaned_data.values()
+                )
+            search_param = getattr(backend, 'search_param', None)
+            if search_param:
+                known.add(search_param)
+                active = active or bool(request.query_params.get(search_param, '').strip())
+
+        unknown = sorted(set(request.query_params) - known)
+        if unknown:
+            return False, {'error': f'Parâmetros desconhecidos: {", ".join(unknown)}.'}
+        return active, {}
+
+    def check_bulk_fields(self, changes):
+        """
+        Recusa campos somente leitura, desconhecidos ou únicos (o mesmo valor
+        em várias linhas violaria a restrição).
+        """
+        fields = self.get_serializer().fields
+        model = self.get_queryset().model
+        errors = {}
+        for name in changes:
+            field = fields.get(name)
+            if field is None or field.read_only:
+                errors[name] = ['Campo inexistente ou somente leitura.']
+                continue
+            model_field = model._meta.get_field(field.source)
+            if model_field.unique or model_field.primary_key:
+                errors[name] = ['Campo único não pode ser alterado em massa.']
+        return errors
@@ -0,0 +1,110 @@
+"""
+GET condicional (ETag / Last-Modified) para list e retrieve.
+
+Os validadores da listagem saem de uma agregação sobre o queryset já
+filtrado, ``MAX(last_modified_field)`` e ``COUNT(*)``, somada aos parâmetros
+da consulta e ao formato da resposta. A agregação fica no cache de respostas
+com a geração do modelo na chave (ver ``response_cache.versioned_models``):
+só é recalculada depois de uma escrita no modelo, e as páginas de uma mesma
+consulta compartilham o resultado. Com ``If-None-Match`` ou
+``If-Modified-Since`` válidos a view responde 304 sem buscar as linhas nem
+serializar. A contagem faz parte do ETag para que exclusões também mudem o
+validador; quando o cliente envia os dois cabeçalhos, o ETag prevalece.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.generics import get_object_or_404
+
+from . import response_cache
+from .fastread import checks_object_permissions
+
+STATS_KEY = 'conditional:{}:{}:{}'
+# Parâmetros que mudam a página ou a forma da resposta, mas não o conjunto filtrado
+PAGE_PARAMS = {'cursor', 'page', 'page_size', 'ordering', 'fields', 'layout', 'format'}
+
+
+class ConditionalGetMixin:
+    last_modified_field = 'updated_at'
+
+    def list(self, request, *args, **kwargs):
+        stats = self._list_stats(request)
+        return self._conditional(
+            request,
+            self._etag('list', stats['last_modified'], stats['total']),
+            stats['last_modified'],
+            super().list, args, kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        if checks_object_permissions(self):
+            return super().retrieve(request, *args, **kwargs)
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = get_object_or_404(
+            self.filter_queryset(self.get_queryset()).values('pk', self.last_modified_field),
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        last_modified = row[self.last_modified_field]
+        return self._conditional(
+            request,
+            self._etag('detail', last_modified, row['pk']),
+            last_modified,
+            super().retrieve, args, kwargs
+        )
+
+    def _list_stats(self, request):
+        model = self.get_queryset().model
+        params = sorted(
+            (name, values) for name, values in request.query_params.lists()
+            if name not in PAGE_PARAMS
+        )
+        raw = '|'.join([repr(params), response_cache.profile_key(request.user)])
+        key = STATS_KEY.format(
+            model._meta.label_lower,
+            response_cache.generation(model),
+            hashlib.md5(raw.encode('utf-8')).hexdigest()
+        )
+        cache = response_cache.get_cache()
+        stats = cache.get(key)
+        if stats is None:
+            queryset = self.filter_queryset(self.get_queryset()).order_by()
+            stats = queryset.aggregate(
+                last_modified=Max(self.last_modified_field),
+                total=Count('pk')
+            )
+            cache.set(key, stats, response_cache.options()['TIMEOUT'])
+        return stats
+
+    def _etag(self, kind, last_modified, marker):
+        request = self.request
+        params = sorted(request.query_params.lists())
+        fmt = request.accepted_renderer.format if hasattr(request, 'accepted_renderer') else ''
+        key = '|'.join([
+            self.get_queryset().model._meta.label_lower,
+            kind,
+            repr(params),
+            fmt,
+            last_modified.isoformat() if last_modified else '',
+            str(marker),
+        ])
+        return 'W/"%s"' % hashlib.md5(key.encode('utf-8')).hexdigest()
+
+    def _conditional(self, request, etag, last_modified, handler, args, kwargs):
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if not_modified is None:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        else:
+            response = not_modified
+
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+        # O navegador guarda a resposta, mas revalida a cada uso
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
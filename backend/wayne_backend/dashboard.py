@@ -1,48 +1,133 @@
+import asyncio
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import permissions
 from vehicles.models import Vehicle
 from equipment.models import Equipment
 from devices.models import Device
+from core.counters import aread_counts, read_counts
+from .asyncread import AsyncAPIView
+
+DASHBOARD_CACHE_KEY = 'dashboard:snapshot'
+
+# Garante que requisições simultâneas compartilhem um único cálculo
+_snapshot_lock = threading.Lock()
+# Cálculo em andamento por event loop (caminho assíncrono)
+_pending_snapshots = {}
+
+
+def build_snapshot():
+    """
+    Monta o snapshot do dashboard a partir dos contadores materializados.
+    """
+    return _snapshot(
+        read_counts(Vehicle, 'status'),
+        read_counts(Equipment, 'type'),
+        read_counts(Device, 'status')
+    )
+
+
+async def abuild_snapshot():
+    return _snapshot(
+        await aread_counts(Vehicle, 'status'),
+        await aread_counts(Equipment, 'type'),
+        await aread_counts(Device, 'status')
+    )
+
+
+def _snapshot(vehicles_by_status, equipment_by_type, devices_by_status):
+    vehicles_count = sum(vehicles_by_status.values())
+    equipment_count = sum(equipment_by_type.values())
+    devices_count = sum(devices_by_status.values())
+
+    return {
+        'summary': {
+            'total_vehicles': vehicles_count,
+            'total_equipment': equipment_count,
+            'total_devices': devices_count,
+        },
+        'vehicles': {
+            'total': vehicles_count,
+            'by_status': vehicles_by_status
+        },
+        'equipment': {
+            'total': equipment_count,
+            'by_type': equipment_by_type
+        },
+        'devices': {
+            'total': devices_count,
+            'by_status': devices_by_status
+        },
+        'generated_at': timezone.now().isoformat(),
+    }
+
+
+def get_snapshot():
+    """
+    Retorna o snapshot em cache ou recalcula quando o TTL expira.
+    """
+    snapshot = cache.get(DASHBOARD_CACHE_KEY)
+    if snapshot is not None:
+        return snapshot
+
+    with _snapshot_lock:
+        # Outra thread pode ter recalculado enquanto esperávamos o lock
+        snapshot = cache.get(DASHBOARD_CACHE_KEY)
+        if snapshot is None:
+            snapshot = build_snapshot()
+            cache.set(
+                DASHBOARD_CACHE_KEY,
+                snapshot,
+                settings.DASHBOARD_CACHE_TTL
+            )
+    return snapshot
+
+
+async def aget_snapshot():
+    """
+    Versão assíncrona de ``get_snapshot``: requisições simultâneas no mesmo
+    event loop aguardam um único cálculo.
+    """
+    snapshot = await cache.aget(DASHBOARD_CACHE_KEY)
+    if snapshot is not None:
+        return snapshot
+
+    loop = asyncio.get_running_loop()
+    task = _pending_snapshots.get(loop)
+    if task is None:
+        task = loop.create_task(_astore_snapshot())
+        _pending_snapshots[loop] = task
+        task.add_done_callback(lambda _: _pending_snapshots.pop(loop, None))
+    return await asyncio.shield(task)
+
+
+async def _astore_snapshot():
+    snapshot = await abuild_snapshot()
+    await cache.aset(DASHBOARD_CACHE_KEY, snapshot, settings.DASHBOARD_CACHE_TTL)
+    return snapshot
+
+
+def invalidate_snapshot():
+    cache.delete(DASHBOARD_CACHE_KEY)
+
 
 class DashboardView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        # Contagem de veículos por status
-        vehicles_count = Vehicle.objects.count()
-        vehicles_by_status = {}
-        for status in Vehicle.objects.values_list('status', flat=True).distinct():
-            vehicles_by_status[status] = Vehicle.objects.filter(status=status).count()
-
-        # Contagem de equipamentos por tipo
-        equipment_count = Equipment.objects.count()
-        equipment_by_type = {}
-        for type in Equipment.objects.values_list('type', flat=True).distinct():
-            equipment_by_type[type] = Equipment.objects.filter(type=type).count()
-
-        # Contagem de dispositivos por status
-        devices_count = Device.objects.count()
-        devices_by_status = {}
-        for status in Device.objects.values_list('status', flat=True).distinct():
-            devices_by_status[status] = Device.objects.filter(status=status).count()
-
-        return Response({
-            'summary': {
-                'total_vehicles': vehicles_count,
-                'total_equipment': equipment_count,
-                'total_devices': devices_count,
-            },
-            'vehicles': {
-                'total': vehicles_count,
-                'by_status': vehicles_by_status
-            },
-            'equipment': {
-                'total': equipment_count,
-                'by_type': equipment_by_type
-            },
-            'devices': {
-                'total': devices_count,
-                'by_status': devices_by_status
-            }
-        }) 
\ No newline at end of file
+        return Response(get_snapshot())
+
+
+class AsyncDashboardView(AsyncAPIView):
+    """
+    Dashboard para o servidor ASGI, com as permissões de ``DashboardView``.
+    """
+    view_class = DashboardView
+
+    async def read(self, view, request, state, **kwargs):
+        return Response(await aget_snapshot())
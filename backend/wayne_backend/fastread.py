@@ -0,0 +1,300 @@
+"""
+Leitura compilada para list/retrieve.
+
+Um ``ModelSerializer`` monta a árvore de campos e chama ``get_attribute`` e
+``to_representation`` de cada campo para cada objeto. Para serializers
+simples (campos do próprio modelo e chaves estrangeiras por pk) o plano de
+leitura é calculado uma única vez por classe: colunas para ``values()``, a
+ordem declarada dos campos e um conversor por campo que reproduz a saída do
+DRF. Serializers que não se encaixam (campos calculados, aninhados, com
+``source`` composto ou ``to_representation`` próprio) seguem o caminho normal.
+"""
+import threading
+from collections import OrderedDict
+
+from rest_framework import fields as drf_fields
+from rest_framework import relations
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import get_object_or_404
+from rest_framework.permissions import BasePermission
+from rest_framework.response import Response
+from rest_framework.serializers import ModelSerializer
+from rest_framework.settings import api_settings
+
+from .pagination import KeysetPagination
+
+ISO_8601 = 'iso-8601'
+
+
+def _identity(value):
+    return value
+
+
+def _iso_datetime(field):
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return None
+
+    def bind():
+        # O fuso é resolvido por requisição, como faz o DateTimeField
+        tz = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+
+        def convert(value):
+            if tz is None or isinstance(value, str) or value.tzinfo is None:
+                return field.to_representation(value)
+            text = value.astimezone(tz).isoformat()
+            return text[:-6] + 'Z' if text.endswith('+00:00') else text
+        return convert
+    return bind
+
+
+def _iso_date(field):
+    output_format = getattr(field, 'format', api_settings.DATE_FORMAT)
+    if output_format is None or output_format.lower() != ISO_8601:
+        return None
+    return lambda: lambda value: value if isinstance(value, str) else value.isoformat()
+
+
+def _choice(field):
+    # Chaves string são devolvidas como estão; outras passam pelo campo
+    if all(isinstance(key, str) for key in field.choices):
+        return lambda: str
+    return None
+
+
+def _constant(converter):
+    return lambda field: lambda: converter
+
+
+# Tipo de campo do DRF -> fábrica de conversor (None = usar to_representation)
+CONVERTERS = [
+    (drf_fields.DateTimeField, _iso_datetime),
+    (drf_fields.DateField, _iso_date),
+    (drf_fields.ChoiceField, _choice),
+    (drf_fields.BooleanField, _constant(bool)),
+    (drf_fields.IntegerField, _constant(int)),
+    (drf_fields.CharField, _constant(str)),
+]
+
+
+class ReadPlan:
+    """
+    Plano compilado de um serializer: ``columns`` para ``values()`` e
+    (nome, coluna, fábrica de conversor) na ordem de saída.
+    """
+
+    def __init__(self, columns, entries):
+        self.columns = columns
+        self.entries = entries
+        self.names = [name for name, _, _ in entries]
+        self._selections = {}
+
+    def select(self, names):
+        """
+        Plano restrito aos campos ``names`` (na ordem do serializer), lendo
+        só as colunas necessárias.
+        """
+        names = tuple(names)
+        if names == tuple(self.names):
+            return self
+        plan = self._selections.get(names)
+        if plan is None:
+            entries = [entry for entry in self.entries if entry[0] in names]
+            columns = [column for column in self.columns if any(entry[1] == column for entry in entries)]
+            plan = self._selections[names] = ReadPlan(columns, entries)
+        return plan
+
+    def bind(self):
+        """
+        Resolve os conversores para a requisição atual.
+        """
+        return [(name, column, factory()) for name, column, factory in self.entries]
+
+    def iter_render(self, rows):
+        entries = self.bind()
+        for row in rows:
+            yield OrderedDict([
+                (name, None if row[column] is None else convert(row[column]))
+                for name, column, convert in entries
+            ])
+
+    def render(self, rows):
+        return list(self.iter_render(rows))
+
+    def render_one(self, row):
+        return self.render([row])[0]
+
+    def render_columnar(self, rows):
+        """
+        Formato colunar: ``{"columns": [...], "rows": [[...], ...]}``.
+        """
+        entries = self.bind()
+        return {
+            'columns': self.names,
+            'rows': [
+                [None if row[column] is None else convert(row[column]) for _, column, convert in entries]
+                for row in rows
+            ],
+        }
+
+
+def _field_entry(name, field):
+    if isinstance(field, relations.PrimaryKeyRelatedField):
+        if field.pk_field is not None:
+            return None
+        return lambda: _identity
+    if isinstance(field, (relations.RelatedField, relations.ManyRelatedField, drf_fields.SerializerMethodField)):
+        return None
+    to_representation = field.to_representation
+    for field_class, factory in CONVERTERS:
+        if type(field).to_representation is field_class.to_representation:
+            return factory(field) or (lambda: to_representation)
+    return lambda: to_representation
+
+
+def compile_plan(serializer_class):
+    """
+    Compila o plano de leitura de um serializer, ou retorna None se ele
+    precisar do caminho completo do DRF.
+    """
+    if not issubclass(serializer_class, ModelSerializer):
+        return None
+    if serializer_class.to_representation is not ModelSerializer.to_representation:
+        return None
+
+    serializer = serializer_class()
+    model = serializer.Meta.model
+    columns, entries = [], []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        source = field.source
+        if source == '*' or '.' in source:
+            return None
+        try:
+            model_field = model._meta.get_field(source)
+        except Exception:
+            return None
+        if model_field.many_to_many or model_field.one_to_many or not model_field.concrete:
+            return None
+        factory = _field_entry(name, field)
+        if factory is None:
+            return None
+        if source not in columns:
+            columns.append(source)
+        entries.append((name, source, factory))
+    return ReadPlan(columns, entries)
+
+
+def checks_object_permissions(view):
+    """
+    Indica se alguma permissão da view depende do objeto carregado.
+    """
+    return any(
+        type(permission).has_object_permission is not BasePermission.has_object_permission
+        for permission in view.get_permissions()
+    )
+
+
+_plans = {}
+_plans_lock = threading.Lock()
+
+
+def get_plan(serializer_class):
+    with _plans_lock:
+        if serializer_class not in _plans:
+            _plans[serializer_class] = compile_plan(serializer_class)
+        return _plans[serializer_class]
+
+
+def _csv_param(request, name):
+    value = request.query_params.get(name, '')
+    return {item.strip() for item in value.split(',') if item.strip()}
+
+
+def select_fields(request, available):
+    """
+    Campos pedidos em ``?fields=`` menos os de ``?exclude=``, na ordem de
+    ``available``.
+    """
+    fields = _csv_param(request, 'fields')
+    exclude = _csv_param(request, 'exclude')
+    unknown = (fields | exclude) - set(available)
+    if unknown:
+        raise ValidationError({'fields': [f'Campos desconhecidos: {", ".join(sorted(unknown))}.']})
+    selected = [name for name in available if (not fields or name in fields) and name not in exclude]
+    if not selected:
+        raise ValidationError({'fields': ['Nenhum campo selecionado.']})
+    return selected
+
+
+class FastReadMixin:
+    """
+    Usa o plano compilado em ``list`` e ``retrieve`` quando o serializer da
+    view é compilável. ``fast_read = False`` desativa por view.
+
+    ``?fields=a,b`` e ``?exclude=c`` restringem os campos da resposta e as
+    colunas lidas em ``values()``; ``?layout=columnar`` devolve a lista como
+    ``{"columns": [...], "rows": [[...]]}``. Serializers sem plano compilado
+    respondem sempre com todos os campos.
+    """
+    fast_read = True
+    layouts = ('records', 'columnar')
+
+    def get_read_plan(self):
+        if not self.fast_read:
+            return None
+        plan = get_plan(self.get_serializer_class())
+        if plan is None:
+            return None
+        return plan.select(select_fields(self.request, plan.names))
+
+    def get_read_rows(self, queryset, plan):
+        # Anotações (ex.: relevância da busca) e campos do cursor seguem junto
+        extra = [name for name in queryset.query.annotations if name not in plan.columns]
+        extra += [
+            name for name in self.get_cursor_columns(queryset)
+            if name not in plan.columns and name not in extra
+        ]
+        return queryset.values(*plan.columns, *extra)
+
+    def get_cursor_columns(self, queryset):
+        paginator = self.paginator
+        if not isinstance(paginator, KeysetPagination):
+            return []
+        return paginator._field_names(paginator.get_ordering(self.request, queryset, self))
+
+    def get_layout(self):
+        layout = self.request.query_params.get('layout', 'records')
+        if layout not in self.layouts:
+            raise ValidationError({'layout': [f'Use um de: {", ".join(self.layouts)}.']})
+        return layout
+
+    def render_rows(self, plan, rows):
+        if self.get_layout() == 'columnar':
+            return plan.render_columnar(rows)
+        return plan.render(rows)
+
+    def list(self, request, *args, **kwargs):
+        plan = self.get_read_plan()
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+
+        rows = self.get_read_rows(self.filter_queryset(self.get_queryset()), plan)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(self.render_rows(plan, page))
+        return Response(self.render_rows(plan, rows))
+
+    def retrieve(self, request, *args, **kwargs):
+        plan = self.get_read_plan()
+        if plan is None or checks_object_permissions(self):
+            return super().retrieve(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = get_object_or_404(
+            self.get_read_rows(queryset, plan),
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        return Response(plan.render_one(row))
@@ -0,0 +1,216 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class StandardResultsSetPagination(PageNumberPagination):
+    """
+    Paginação padrão dos endpoints de inventário, com tamanho de página limitado.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+
+class _Row:
+    """
+    Acesso por atributo a uma linha de ``values()`` para ``value_to_string``.
+    """
+
+    def __init__(self, row):
+        self.__dict__.update(row)
+
+    def __getattr__(self, name):
+        # Chaves estrangeiras vêm de ``values()`` pelo nome do campo, sem ``_id``
+        if name.endswith('_id') and name[:-3] in self.__dict__:
+            return self.__dict__[name[:-3]]
+        raise AttributeError(name)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginação por cursor (keyset) sobre uma ordenação fixa e única.
+
+    O cursor guarda os valores da última linha entregue, de modo que cada
+    página é buscada por ``WHERE (campos) após (cursor)`` usando o índice da
+    ordenação, com custo constante independente da profundidade. Um
+    ``?ordering=`` válido para a view substitui a ordenação padrão, com ``id``
+    como desempate; na falta dele, ``view.search_ordering`` (definido pela
+    busca de texto completo) ordena pela relevância.
+    """
+    ordering = ('-pk',)
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = _('Cursor inválido')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.set_page(list(self.page_queryset(queryset, request, view)))
+
+    def page_queryset(self, queryset, request, view=None):
+        """
+        Monta a consulta da página (uma linha a mais para saber se há
+        próxima), sem executá-la.
+        """
+        self.request = request
+        self.model = queryset.model
+        self.base_url = request.build_absolute_uri()
+        self.current_page_size = self.get_page_size(request)
+        self.current_ordering = self.get_ordering(request, queryset, view)
+        self.position, self.reverse = self.decode_cursor(request, queryset.model)
+
+        ordering = self.current_ordering
+        if self.reverse:
+            ordering = tuple(self._invert(field) for field in ordering)
+
+        queryset = queryset.order_by(*ordering)
+        if self.position is not None:
+            queryset = queryset.filter(self._after(ordering, self.position))
+        return queryset[:self.current_page_size + 1]
+
+    def set_page(self, results):
+        """
+        Recebe as linhas de ``page_queryset`` e define a página e os links.
+        """
+        has_more = len(results) > self.current_page_size
+        results = results[:self.current_page_size]
+        if self.reverse:
+            results.reverse()
+
+        self.page = results
+        self.has_next = has_more if not self.reverse else self.position is not None
+        self.has_previous = self.position is not None if not self.reverse else has_more
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'previous': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+    def get_ordering(self, request, queryset, view):
+        ordering_filter = OrderingFilter()
+        if view is None or not request.query_params.get(ordering_filter.ordering_param):
+            return tuple(getattr(view, 'search_ordering', None) or self.ordering)
+        ordering = ordering_filter.get_ordering(request, queryset, view)
+        if not ordering:
+            return tuple(self.ordering)
+        ordering = tuple(ordering)
+        if not {'id', 'pk'} & set(self._field_names(ordering)):
+            ordering += ('id',)
+        return ordering
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, instance, reverse):
+        if isinstance(instance, dict):
+            # Linha de ``values()`` (leitura compilada)
+            instance = _Row(instance)
+        position = []
+        for name in self._field_names(self.current_ordering):
+            field = self._field(self.model._meta, name)
+            if field is None:
+                # Anotação (ex.: relevância da busca), serializada como está
+                position.append(getattr(instance, name))
+            else:
+                position.append(field.value_to_string(instance))
+        payload = json.dumps({'p': position, 'r': int(reverse)})
+        token = base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request, model):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+            names = self._field_names(self.current_ordering)
+            if len(payload['p']) != len(names):
+                raise ValueError
+            position = []
+            for name, value in zip(names, payload['p']):
+                field = self._field(model._meta, name)
+                position.append(value if field is None else field.to_python(value))
+            return position, bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _after(self, ordering, position):
+        """
+        Monta ``(a < x) OR (a = x AND b > y) ...`` respeitando a direção de cada campo.
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    @staticmethod
+    def _invert(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+    @staticmethod
+    def _field_names(ordering):
+        return [field.lstrip('-') for field in ordering]
+
+    @staticmethod
+    def _field(opts, name):
+        if name == 'pk':
+            return opts.pk
+        try:
+            return opts.get_field(name)
+        except FieldDoesNotExist:
+            return None
+
+
+class SecurityLogPagination(KeysetPagination):
+    ordering = ('-created_at', 'id')
+
+
+class SecurityIncidentPagination(KeysetPagination):
+    ordering = ('-reported_at', 'id')
+
+
+class DueDatePagination(KeysetPagination):
+    ordering = ('due_date', 'id')
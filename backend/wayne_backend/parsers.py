@@ -0,0 +1,42 @@
+import codecs
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """
+    Interpreta um corpo NDJSON (um objeto JSON por linha) como uma lista.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        items = []
+        for number, line in enumerate(stream, start=1):
+            line = line.decode(encoding).strip()
+            if not line:
+                continue
+            try:
+                items.append(json.loads(line))
+            except ValueError as exc:
+                raise ParseError(f'NDJSON inválido na linha {number}: {exc}')
+        return items
+
+
+class CSVParser(BaseParser):
+    """
+    Entrega o corpo text/csv como um iterador de linhas de texto, sem
+    carregar o arquivo inteiro em memória.
+    """
+    media_type = 'text/csv'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if stream is None:
+            raise ParseError('Corpo CSV vazio.')
+        return codecs.iterdecode(stream, encoding)
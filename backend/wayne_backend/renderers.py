@@ -0,0 +1,24 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Um objeto JSON por linha. Listas geram uma linha por item; qualquer outro
+    dado vira uma única linha.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        items = data if isinstance(data, list) else [data]
+        return ''.join(dumps(item) for item in items).encode(self.charset)
+
+
+def dumps(item):
+    return json.dumps(item, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':')) + '\n'
@@ -0,0 +1,226 @@
+"""
+Cache de respostas de leitura por viewset.
+
+As respostas de list/retrieve dos modelos em ``RESPONSE_CACHE['MODELS']``
+ficam no cache configurado em ``RESPONSE_CACHE['ALIAS']`` (locmem por
+padrão, ou qualquer backend compartilhado). A chave combina a URL com os
+parâmetros normalizados, o formato da resposta, o perfil de permissões do
+usuário e o número de geração do modelo. Save, delete e operações em massa
+(``core.signals.bulk_changed``) incrementam a geração após o commit, o que
+invalida de uma vez todas as páginas do modelo.
+
+O limite de tamanho é aplicado por processo: cada processo guarda a ordem de
+uso das chaves que gravou e remove a menos usada ao passar de
+``MAX_ENTRIES``. Entradas gravadas por outros processos expiram por
+``TIMEOUT``.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from users.permission_cache import get_profile
+from users.permissions import IsAdmin
+
+GENERATION_KEY = 'responses:generation:{}'
+ENTRY_KEY = 'responses:{}:{}:{}'
+CACHED_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control')
+
+
+def options():
+    return settings.RESPONSE_CACHE
+
+
+def get_cache():
+    return caches[options()['ALIAS']]
+
+
+def cached_models():
+    from django.apps import apps
+    return [apps.get_model(label) for label in options()['MODELS']]
+
+
+def versioned_models():
+    """
+    Modelos com geração mantida: os de resposta em cache e os que só a usam
+    como validador do GET condicional.
+    """
+    from django.apps import apps
+    labels = options()['MODELS'] + options().get('VERSIONED_MODELS', [])
+    return [apps.get_model(label) for label in labels]
+
+
+def is_cached(model):
+    return model._meta.label in options()['MODELS']
+
+
+def generation(model):
+    key = GENERATION_KEY.format(model._meta.label_lower)
+    cache = get_cache()
+    value = cache.get(key)
+    if value is None:
+        # Base em nanossegundos: uma geração perdida nunca volta a um valor antigo
+        cache.add(key, time.time_ns(), None)
+        value = cache.get(key)
+    return value
+
+
+def bump(model):
+    key = GENERATION_KEY.format(model._meta.label_lower)
+    cache = get_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+    stats.record(model, 'invalidations')
+
+
+def profile_key(user):
+    """
+    Parte da chave que depende de quem chama: tipo de usuário e bitset de
+    permissões compilado.
+    """
+    if not user or not user.is_authenticated:
+        return 'anonymous'
+    mask, extra = get_profile(user)
+    return f'{user.user_type}:{int(user.is_superuser)}:{mask}:{",".join(sorted(extra))}'
+
+
+def entry_key(view, kind):
+    request = view.request
+    model = view.get_queryset().model
+    params = sorted(request.query_params.lists())
+    raw = '|'.join([
+        request.build_absolute_uri(request.path),
+        kind,
+        repr(params),
+        request.accepted_renderer.format,
+        profile_key(request.user),
+    ])
+    digest = hashlib.md5(raw.encode('utf-8')).hexdigest()
+    return ENTRY_KEY.format(model._meta.label_lower, generation(model), digest)
+
+
+class CacheStats:
+    """
+    Contadores por modelo (neste processo) e ordem de uso das chaves gravadas.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._keys = OrderedDict()
+
+    def record(self, model, counter):
+        with self._lock:
+            counters = self._counters.setdefault(model._meta.label_lower, {
+                'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'invalidations': 0,
+            })
+            counters[counter] += 1
+
+    def touch(self, key):
+        with self._lock:
+            if key in self._keys:
+                self._keys.move_to_end(key)
+
+    def add(self, key, model, max_entries):
+        """
+        Registra uma chave gravada e retorna as que devem ser removidas.
+        """
+        with self._lock:
+            self._keys[key] = model
+            self._keys.move_to_end(key)
+            evicted = []
+            while len(self._keys) > max_entries:
+                evicted.append(self._keys.popitem(last=False))
+        for _, evicted_model in evicted:
+            self.record(evicted_model, 'evictions')
+        return [evicted_key for evicted_key, _ in evicted]
+
+    def snapshot(self):
+        with self._lock:
+            models = {label: dict(counters) for label, counters in self._counters.items()}
+            size = len(self._keys)
+        for counters in models.values():
+            lookups = counters['hits'] + counters['misses']
+            counters['hit_rate'] = counters['hits'] / lookups if lookups else 0.0
+        return {'entries': size, 'max_entries': options()['MAX_ENTRIES'], 'models': models}
+
+
+stats = CacheStats()
+
+
+class ResponseCacheMixin:
+    """
+    Guarda as respostas 200 de list/retrieve. Deve vir antes de
+    ``ConditionalGetMixin`` para que um acerto responda 304 sem consultar o banco.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response('list', super().list, request, args, kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response('detail', super().retrieve, request, args, kwargs)
+
+    def _cached_response(self, kind, handler, request, args, kwargs):
+        model = self.get_queryset().model
+        if not is_cached(model):
+            return handler(request, *args, **kwargs)
+
+        cache = get_cache()
+        key = entry_key(self, kind)
+        entry = cache.get(key)
+        if entry is not None:
+            stats.touch(key)
+            stats.record(model, 'hits')
+            return self._from_entry(request, entry)
+
+        stats.record(model, 'misses')
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200 and isinstance(response, Response):
+            cache.set(key, {
+                'data': response.data,
+                'headers': {name: response[name] for name in CACHED_HEADERS if name in response},
+            }, options()['TIMEOUT'])
+            stats.record(model, 'stores')
+            evicted = stats.add(key, model, options()['MAX_ENTRIES'])
+            if evicted:
+                cache.delete_many(evicted)
+        return response
+
+    def _from_entry(self, request, entry):
+        headers = entry['headers']
+        last_modified = parse_http_date_safe(headers.get('Last-Modified', ''))
+        response = get_conditional_response(
+            request,
+            etag=headers.get('ETag'),
+            last_modified=last_modified
+        ) or Response(entry['data'])
+        for name, value in headers.items():
+            response[name] = value
+        if 'Cache-Control' not in headers:
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+def handle_change(sender, **kwargs):
+    # Após o commit, para que nenhuma leitura grave dados antigos na nova geração
+    transaction.on_commit(lambda: bump(sender))
+
+
+class ResponseCacheMetricsView(APIView):
+    """
+    Acertos, falhas, remoções e invalidações do cache de respostas.
+    """
+
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        return Response(stats.snapshot())
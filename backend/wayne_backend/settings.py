@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
 from pathlib import Path
+from datetime import timedelta
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -38,8 +39,10 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'rest_framework',
+    'django_filters',
     'corsheaders',
     'knox',
+    'core.apps.CoreConfig',
     'users.apps.UsersConfig',
     'vehicles.apps.VehiclesConfig',
     'equipment.apps.EquipmentConfig',
@@ -133,17 +136,104 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'knox.auth.TokenAuthentication',
+        'users.authentication.CachedTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_FILTER_BACKENDS': [
+        'django_filters.rest_framework.DjangoFilterBackend',
+        'rest_framework.filters.SearchFilter',
+        'rest_framework.filters.OrderingFilter',
+    ],
+    'DEFAULT_PAGINATION_CLASS': 'wayne_backend.pagination.StandardResultsSetPagination',
+    'PAGE_SIZE': 50,
+}
+
+# Configurações de Cache
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'wayne-default',
+    }
+}
+
+# Cache de respostas de leitura (list/retrieve) por viewset, invalidado por
+# geração a cada escrita no modelo
+RESPONSE_CACHE = {
+    'ALIAS': 'default',  # Alias em CACHES (locmem ou backend compartilhado)
+    'TIMEOUT': 300,  # Segundos
+    'MAX_ENTRIES': 1000,  # Respostas guardadas por processo (LRU)
+    'MODELS': ['vehicles.Vehicle', 'equipment.Equipment', 'devices.Device'],
+    # Modelos que só mantêm a geração (validadores do GET condicional), sem guardar respostas
+    'VERSIONED_MODELS': ['security.SecurityLog', 'security.SecurityIncident', 'users.User'],
+}
+
+# Linhas lidas do banco por bloco nas listagens em streaming (?stream=1)
+STREAMING_CHUNK_SIZE = 2000
+
+# Tempo (em segundos) que o snapshot do dashboard permanece em cache
+DASHBOARD_CACHE_TTL = 15
+
+# Limites do endpoint de ingestão em lote de logs de segurança
+SECURITY_LOG_BATCH_MAX_SIZE = 5000
+SECURITY_LOG_BATCH_CHUNK_SIZE = 500
+
+# Gravação assíncrona de logs de segurança (fila em memória + bulk_create)
+SECURITY_LOG_BUFFER = {
+    'ENABLED': False,
+    'MAX_SIZE': 10000,  # Eventos na fila antes de aplicar backpressure
+    'FLUSH_SIZE': 500,  # Grava quando o lote atinge este tamanho...
+    'FLUSH_INTERVAL': 1.0,  # ...ou após este intervalo (segundos)
+    'PUT_TIMEOUT': 0.05,  # Espera máxima por espaço na fila (segundos)
+}
+
+# Particionamento por tempo dos logs de segurança. Alterar a granularidade
+# exige recalcular os buckets existentes (rollover_security_logs --rebucket).
+SECURITY_LOG_PARTITION = {
+    'GRANULARITY': 'month',  # 'month' ou 'week'
+    'RETENTION_DAYS': 365,  # None mantém todo o histórico
+}
+
+# Exportações em segundo plano do histórico de segurança
+SECURITY_EXPORTS = {
+    'DIRECTORY': BASE_DIR / 'exports',  # Arquivos .gz gerados
+    'SPAWN_WORKER': True,  # Dispara um processo por job; False exige run_export_worker
+    'MAX_WORKERS': 2,  # Processos disparados simultâneos; acima disso o job aguarda na fila
+    'CHUNK_SIZE': 5000,  # Linhas lidas do banco por bloco
+    'REUSE_SECONDS': 3600,  # Janela para reaproveitar exportações com os mesmos filtros
+    'RETENTION_DAYS': 7,  # Exportações mais antigas são removidas pelo worker
+}
+
+# Feed ao vivo (SSE) de logs e incidentes; requer o servidor ASGI
+SECURITY_LIVE = {
+    'QUEUE_SIZE': 100,  # Eventos pendentes por cliente; os mais antigos são descartados
+    'HEARTBEAT': 15,  # Segundos entre comentários de keep-alive
+    'MAX_DURATION': 900,  # Segundos por conexão antes de pedir reconexão
+    'RETRY_MS': 3000,  # Intervalo de reconexão informado ao EventSource
+    'MAX_SUBSCRIBERS': 5000,  # Conexões simultâneas por processo
+    'TICKET_TTL': 30,  # Validade (segundos) do ticket de uso único do EventSource
+    'REPLAY_LIMIT': 500,  # Linhas reenviadas por tipo ao reconectar com Last-Event-ID
+}
+
+# Importação em massa de inventário via CSV (endpoint import/ e import_inventory)
+INVENTORY_IMPORT = {
+    'BATCH_SIZE': 1000,  # Linhas validadas por lote (uma consulta de unicidade por lote)
+    'INSERT_CHUNK_SIZE': 500,  # Linhas por INSERT no bulk_create
+    'MAX_REPORTED_ERRORS': 1000,  # Erros por linha incluídos no relatório
+}
+
+# Calendário de vencimentos (api/calendar/ e precompute_due_summary)
+DUE_CALENDAR = {
+    'HORIZON_DAYS': 30,  # Janela padrão de "a vencer" (dias a partir de hoje)
+    'MAX_DAYS': 366,  # Maior janela aceita em ?days=
+    'SUMMARY_RETENTION_DAYS': 90,  # Resumos diários mantidos (None = todos)
 }
 
 # Configurações do Knox
 REST_KNOX = {
-    'TOKEN_TTL': None,  # Tokens não expiram
+    'TOKEN_TTL': timedelta(days=7),  # Validade deslizante, renovada a cada uso
     'AUTO_REFRESH': True,
     'USER_SERIALIZER': 'users.serializers.UserSerializer',
     'AUTH_HEADER_PREFIX': 'Token',
@@ -200,6 +290,33 @@ SESSION_COOKIE_SECURE = False  # Mude para True em produção com HTTPS
 # Configuração do modelo de usuário personalizado
 AUTH_USER_MODEL = 'users.User'
 
+# Validade máxima (segundos) do perfil de permissões compilado em cache.
+# A invalidação normal é feita pelos sinais de m2m_changed.
+PERMISSION_CACHE_TTL = 3600
+
+# Cache de tokens verificados (segundos). Limita por quanto tempo um token
+# excluído fora dos caminhos com sinal continua aceito.
+TOKEN_CACHE_TTL = 60
+
+# Intervalo mínimo entre gravações da renovação automática de um mesmo token
+TOKEN_REFRESH_INTERVAL = 300
+
+# Login pelo ModelBackend, com a verificação de senha no pool de LOGIN_HASHING
+AUTHENTICATION_BACKENDS = [
+    'users.backends.PooledModelBackend',
+]
+
+# Verificação de senhas no login, fora das threads de requisição
+LOGIN_HASHING = {
+    'WORKERS': 2,  # Hashes calculados em paralelo
+    'MAX_PENDING': 16,  # Logins aguardando na fila antes de responder 503
+    'WAIT_TIMEOUT': 0.5,  # Espera máxima por uma vaga na fila (segundos)
+    'RESULT_TIMEOUT': 10.0,  # Espera máxima pelo resultado do hash (segundos)
+}
+
+# Tokens ativos por usuário; o login descarta os mais antigos (None = sem limite)
+TOKEN_MAX_PER_USER = 10
+
 # Configuração de Logging
 LOGGING = {
     'version': 1,
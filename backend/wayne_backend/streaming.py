@@ -0,0 +1,69 @@
+"""
+Listagem completa em streaming (NDJSON).
+
+Com ``?stream=1`` ou ``Accept: application/x-ndjson`` a view percorre o
+queryset filtrado com ``.iterator()`` em blocos de ``STREAMING_CHUNK_SIZE``
+linhas e envia cada linha serializada assim que fica pronta, sem paginação e
+sem montar a lista em memória. Usa o plano compilado de ``fastread`` quando o
+serializer permite; caso contrário serializa objeto por objeto.
+"""
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+from .renderers import NDJSONRenderer, dumps
+
+# Tamanho aproximado de cada pedaço enviado ao cliente
+FLUSH_BYTES = 64 * 1024
+
+
+class StreamingListMixin:
+    stream_param = 'stream'
+
+    def get_renderers(self):
+        return super().get_renderers() + [NDJSONRenderer()]
+
+    def wants_stream(self, request):
+        if request.query_params.get(self.stream_param) in ('1', 'true'):
+            return True
+        return isinstance(getattr(request, 'accepted_renderer', None), NDJSONRenderer)
+
+    def list(self, request, *args, **kwargs):
+        if not self.wants_stream(request):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        search_ordering = getattr(self, 'search_ordering', None)
+        if search_ordering and not request.query_params.get('ordering'):
+            # Busca de texto completo: mesma ordem por relevância da paginação
+            queryset = queryset.order_by(*search_ordering)
+        response = StreamingHttpResponse(
+            self.stream_rows(queryset),
+            content_type=f'{NDJSONRenderer.media_type}; charset=utf-8'
+        )
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    def iter_items(self, queryset):
+        chunk_size = settings.STREAMING_CHUNK_SIZE
+        plan = self.get_read_plan() if hasattr(self, 'get_read_plan') else None
+        if plan is not None:
+            yield from plan.iter_render(
+                queryset.values(*plan.columns).iterator(chunk_size=chunk_size)
+            )
+            return
+
+        serializer = self.get_serializer()
+        for instance in queryset.iterator(chunk_size=chunk_size):
+            yield serializer.to_representation(instance)
+
+    def stream_rows(self, queryset):
+        buffer, size = [], 0
+        for item in self.iter_items(queryset):
+            line = dumps(item).encode('utf-8')
+            buffer.append(line)
+            size += len(line)
+            if size >= FLUSH_BYTES:
+                yield b''.join(buffer)
+                buffer, size = [], 0
+        if buffer:
+            yield b''.join(buffer)
@@ -18,8 +18,10 @@ from django.contrib import admin
 from django.urls import path, include
 from knox import views as knox_views
 from django.conf import settings
+from core.views import DueCalendarView, DueSummaryView
 from users.auth_views import RegisterView, LoginView, UserAPIView, get_csrf_token
 from .dashboard import DashboardView
+from .response_cache import ResponseCacheMetricsView
 
 # Configuração do Admin
 admin.site.site_header = settings.ADMIN_SITE_HEADER
@@ -36,8 +38,13 @@ urlpatterns = [
     path('api/auth/csrf/', get_csrf_token, name='csrf'),
     path('api/users/', include('users.urls')),
     path('api/dashboard/', DashboardView.as_view(), name='dashboard'),
+    path('api/cache/metrics/', ResponseCacheMetricsView.as_view(), name='response-cache-metrics'),
     path('api/vehicles/', include('vehicles.urls')),
     path('api/equipment/', include('equipment.urls')),
     path('api/devices/', include('devices.urls')),
     path('api/security/', include('security.urls')),
+    path('api/lookup/', include('core.urls')),
+    path('api/calendar/', DueCalendarView.as_view(), name='due-calendar'),
+    path('api/calendar/summary/', DueSummaryView.as_view(), name='due-summary'),
+    path('api/async/', include('wayne_backend.async_urls')),
 ]
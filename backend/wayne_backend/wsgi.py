@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'wayne_backend.settings')
 
 application = get_wsgi_application()
+
+# Carrega em segundo plano o índice de busca aproximada de identificadores
+from core.lookup import warm_up  # noqa: E402
+
+warm_up()
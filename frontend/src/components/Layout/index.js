@@ -88,7 +88,7 @@ function Layout() {
   const handleLogout = async () => {
     try {
       // Registrar log de logout antes de fazer o logout
-      await SecurityLogger.logLogout('127.0.0.1'); // TODO: Pegar IP real
+      SecurityLogger.logLogout('127.0.0.1'); // TODO: Pegar IP real
       
       dispatch(logout());
       navigate('/login');
@@ -166,7 +166,7 @@ function Devices() {
         dispatch(updateItem({ type: 'securityDevices', item: updatedDevice }));
         
         // Registrar log de atualização
-        await SecurityLogger.logDeviceUpdated(
+        SecurityLogger.logDeviceUpdated(
           updatedDevice,
           '127.0.0.1' // TODO: Pegar IP real
         );
@@ -175,7 +175,7 @@ function Devices() {
         dispatch(addItem({ type: 'securityDevices', item: newDevice }));
         
         // Registrar log de criação
-        await SecurityLogger.logDeviceCreated(
+        SecurityLogger.logDeviceCreated(
           newDevice,
           '127.0.0.1' // TODO: Pegar IP real
         );
@@ -194,7 +194,7 @@ function Devices() {
         dispatch(removeItem({ type: 'securityDevices', id }));
         
         // Registrar log de exclusão
-        await SecurityLogger.logDeviceDeleted(
+        SecurityLogger.logDeviceDeleted(
           id,
           '127.0.0.1' // TODO: Pegar IP real
         );
@@ -149,7 +149,7 @@ function Equipment() {
         dispatch(updateItem({ type: 'equipment', item: updatedEquipment }));
         
         // Registrar log de atualização
-        await SecurityLogger.logEquipmentUpdated(
+        SecurityLogger.logEquipmentUpdated(
           updatedEquipment,
           '127.0.0.1' // TODO: Pegar IP real
         );
@@ -158,7 +158,7 @@ function Equipment() {
         dispatch(addItem({ type: 'equipment', item: newEquipment }));
         
         // Registrar log de criação
-        await SecurityLogger.logEquipmentCreated(
+        SecurityLogger.logEquipmentCreated(
           newEquipment,
           '127.0.0.1' // TODO: Pegar IP real
         );
@@ -177,7 +177,7 @@ function Equipment() {
         dispatch(removeItem({ type: 'equipment', id }));
         
         // Registrar log de exclusão
-        await SecurityLogger.logEquipmentDeleted(
+        SecurityLogger.logEquipmentDeleted(
           id,
           '127.0.0.1' // TODO: Pegar IP real
         );
@@ -55,7 +55,7 @@ function Login() {
 
         try {
           // Registrar log de login
-          await SecurityLogger.logLogin('127.0.0.1'); // TODO: Pegar IP real
+          SecurityLogger.logLogin('127.0.0.1'); // TODO: Pegar IP real
         } catch (logError) {
           console.error('Erro ao registrar log de login:', logError);
         }
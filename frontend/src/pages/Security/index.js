@@ -33,6 +33,7 @@ function Security() {
   const dispatch = useDispatch();
   const { alerts = [], logs = [], isLoading, error } = useSelector((state) => state.security);
   const [tabValue, setTabValue] = useState(0);
+  const [logsNext, setLogsNext] = useState(null);
   const [openDialog, setOpenDialog] = useState(false);
   const [editingItem, setEditingItem] = useState(null);
   const [formData, setFormData] = useState({
@@ -73,8 +74,9 @@ function Security() {
         }));
         dispatch(fetchSuccess({ 
           type: 'logs', 
-          data: logsData 
+          data: logsData.results 
         }));
+        setLogsNext(logsData.next);
       } catch (err) {
         dispatch(fetchFailure(err.message));
       }
@@ -82,6 +84,16 @@ function Security() {
     fetchData();
   }, [dispatch]);
 
+  const handleLoadMoreLogs = async () => {
+    try {
+      const page = await securityService.getLogs(null, logsNext);
+      dispatch(fetchSuccess({ type: 'logs', data: [...logs, ...page.results] }));
+      setLogsNext(page.next);
+    } catch (err) {
+      dispatch(fetchFailure(err.message));
+    }
+  };
+
   const handleTabChange = (event, newValue) => {
     setTabValue(newValue);
   };
@@ -149,7 +161,7 @@ function Security() {
         
         try {
           // Registrar log de atualização
-          await SecurityLogger.logIncidentUpdated(
+          SecurityLogger.logIncidentUpdated(
             updatedAlert,
             '127.0.0.1' // TODO: Pegar IP real
           );
@@ -162,7 +174,7 @@ function Security() {
         
         try {
           // Registrar log de criação
-          await SecurityLogger.logIncidentCreated(
+          SecurityLogger.logIncidentCreated(
             newAlert,
             '127.0.0.1' // TODO: Pegar IP real
           );
@@ -189,7 +201,7 @@ function Security() {
           dispatch(fetchSuccess({ type: 'alerts', data: alerts.filter(a => a.id !== id) }));
           
           // Registrar log de exclusão
-          await SecurityLogger.logIncidentDeleted(
+          SecurityLogger.logIncidentDeleted(
             id,
             '127.0.0.1' // TODO: Pegar IP real
           );
@@ -326,6 +338,13 @@ function Security() {
             </Grid>
           )}
         </Grid>
+        {logsNext && (
+          <Box sx={{ display: 'flex', justifyContent: 'center', mt: 3 }}>
+            <Button variant="outlined" onClick={handleLoadMoreLogs} disabled={isLoading}>
+              Carregar mais
+            </Button>
+          </Box>
+        )}
       </TabPanel>
 
       <FormDialog
@@ -171,7 +171,7 @@ function Vehicles() {
         dispatch(updateItem({ type: 'vehicles', item: updatedVehicle }));
         
         // Registrar log de atualização
-        await SecurityLogger.logVehicleUpdated(
+        SecurityLogger.logVehicleUpdated(
           updatedVehicle,
           '127.0.0.1' // TODO: Pegar IP real
         );
@@ -180,7 +180,7 @@ function Vehicles() {
         dispatch(addItem({ type: 'vehicles', item: newVehicle }));
         
         // Registrar log de criação
-        await SecurityLogger.logVehicleCreated(
+        SecurityLogger.logVehicleCreated(
           newVehicle,
           '127.0.0.1' // TODO: Pegar IP real
         );
@@ -199,7 +199,7 @@ function Vehicles() {
         dispatch(removeItem({ type: 'vehicles', id }));
         
         // Registrar log de exclusão
-        await SecurityLogger.logVehicleDeleted(
+        SecurityLogger.logVehicleDeleted(
           id,
           '127.0.0.1' // TODO: Pegar IP real
         );
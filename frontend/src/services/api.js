@@ -131,4 +131,17 @@ export const securityService = {
   checkAccess: (areaId) => api.post('/security/areas/check-access/', { area_id: areaId }),
 };
 
-export default api; 
\ No newline at end of file
+// Percorre todas as páginas de uma listagem paginada (número de página ou
+// cursor), seguindo o link "next" até o fim.
+export async function getAllPages(url, params = {}) {
+  const results = [];
+  let response = await api.get(url, { params: { page_size: 500, ...params } });
+  results.push(...response.data.results);
+  while (response.data.next) {
+    response = await api.get(response.data.next);
+    results.push(...response.data.results);
+  }
+  return results;
+}
+
+export default api;
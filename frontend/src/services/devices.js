@@ -1,10 +1,9 @@
-import api from './api';
+import api, { getAllPages } from './api';
 
 export const deviceService = {
   async getAll(params) {
     try {
-      const response = await api.get('/devices/', { params });
-      return response.data;
+      return await getAllPages('/devices/', params);
     } catch (error) {
       console.error('Erro ao buscar dispositivos:', error.response?.data);
       throw error;
@@ -1,10 +1,9 @@
-import api from './api';
+import api, { getAllPages } from './api';
 
 export const equipmentService = {
   async getAll(params) {
     try {
-      const response = await api.get('/equipment/', { params });
-      return response.data;
+      return await getAllPages('/equipment/', params);
     } catch (error) {
       console.error('Erro ao buscar equipamentos:', error.response?.data);
       throw error;
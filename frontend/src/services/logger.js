@@ -1,13 +1,24 @@
+import api from './api';
 import { securityService } from './security';
 import { store } from '../store';
 
+// Eventos são agrupados e enviados em lote para /security/logs/batch/.
+// Registrar um evento não espera o envio: o lote sai a cada FLUSH_SIZE
+// eventos, após FLUSH_INTERVAL_MS ou quando a página é escondida/fechada.
+const FLUSH_SIZE = 20;
+const FLUSH_INTERVAL_MS = 2000;
+const BATCH_URL = '/security/logs/batch/';
+
 class SecurityLogger {
+  static queue = [];
+  static flushTimer = null;
+
   static getCurrentUser() {
     const state = store.getState();
     return state.auth.user;
   }
 
-  static async log(eventType, description, ipAddress, location = null) {
+  static log(eventType, description, ipAddress, location = null) {
     try {
       const user = this.getCurrentUser();
       const logData = {
@@ -21,32 +32,98 @@ class SecurityLogger {
         logData.location = location.trim();
       }
 
-      console.log('Criando log com dados:', logData);
-      await securityService.createLog(logData);
+      this.enqueue(logData);
     } catch (error) {
       console.error('Erro ao criar log de segurança:', error);
-      throw error;
     }
   }
 
-  static async logLogin(ipAddress) {
-    await this.log(
+  static enqueue(logData) {
+    this.queue.push(logData);
+
+    if (this.queue.length >= FLUSH_SIZE) {
+      this.flush();
+    } else if (!this.flushTimer) {
+      this.flushTimer = setTimeout(() => this.flush(), FLUSH_INTERVAL_MS);
+    }
+  }
+
+  static takeQueue() {
+    clearTimeout(this.flushTimer);
+    this.flushTimer = null;
+
+    const events = this.queue;
+    this.queue = [];
+    return events;
+  }
+
+  static async flush() {
+    const events = this.takeQueue();
+    if (events.length === 0) {
+      return;
+    }
+
+    try {
+      const result = await securityService.createLogsBatch(events);
+      if (result.errors.length > 0) {
+        console.error('Logs rejeitados pelo servidor:', result.errors);
+      }
+    } catch (error) {
+      console.error('Erro ao enviar logs de segurança:', error);
+    }
+  }
+
+  // Envio imediato que sobrevive ao fechamento da página. O token é lido na
+  // hora, antes de um logout removê-lo.
+  static flushNow() {
+    const events = this.takeQueue();
+    if (events.length === 0) {
+      return;
+    }
+
+    const url = `${api.defaults.baseURL}${BATCH_URL}`;
+    const body = JSON.stringify(events);
+    const token = localStorage.getItem('token');
+
+    if (token) {
+      // sendBeacon não envia o cabeçalho Authorization; fetch com keepalive
+      // tem a mesma garantia de entrega no descarregamento da página
+      fetch(url, {
+        method: 'POST',
+        keepalive: true,
+        credentials: 'include',
+        headers: {
+          'Content-Type': 'application/json',
+          Authorization: `Token ${token}`
+        },
+        body
+      }).catch((error) => console.error('Erro ao enviar logs de segurança:', error));
+    } else if (navigator.sendBeacon) {
+      // Sem token, a sessão (cookie) é a única credencial disponível
+      navigator.sendBeacon(url, new Blob([body], { type: 'application/json' }));
+    }
+  }
+
+  static logLogin(ipAddress) {
+    this.log(
       'access',
       'Login realizado com sucesso',
       ipAddress
     );
   }
 
-  static async logLogout(ipAddress) {
-    await this.log(
+  static logLogout(ipAddress) {
+    this.log(
       'access',
       'Logout realizado',
       ipAddress
     );
+    // O logout remove o token em seguida
+    this.flushNow();
   }
 
-  static async logIncidentCreated(incident, ipAddress) {
-    await this.log(
+  static logIncidentCreated(incident, ipAddress) {
+    this.log(
       'alert',
       `Novo incidente criado: ${incident.title}`,
       ipAddress,
@@ -54,8 +131,8 @@ class SecurityLogger {
     );
   }
 
-  static async logIncidentUpdated(incident, ipAddress) {
-    await this.log(
+  static logIncidentUpdated(incident, ipAddress) {
+    this.log(
       'alert',
       `Incidente atualizado: ${incident.title}`,
       ipAddress,
@@ -63,16 +140,16 @@ class SecurityLogger {
     );
   }
 
-  static async logIncidentDeleted(incidentId, ipAddress) {
-    await this.log(
+  static logIncidentDeleted(incidentId, ipAddress) {
+    this.log(
       'alert',
       `Incidente excluído: ID ${incidentId}`,
       ipAddress
     );
   }
 
-  static async logDeviceCreated(device, ipAddress) {
-    await this.log(
+  static logDeviceCreated(device, ipAddress) {
+    this.log(
       'system',
       `Novo dispositivo criado: ${device.name}`,
       ipAddress,
@@ -80,8 +157,8 @@ class SecurityLogger {
     );
   }
 
-  static async logDeviceUpdated(device, ipAddress) {
-    await this.log(
+  static logDeviceUpdated(device, ipAddress) {
+    this.log(
       'system',
       `Dispositivo atualizado: ${device.name}`,
       ipAddress,
@@ -89,16 +166,16 @@ class SecurityLogger {
     );
   }
 
-  static async logDeviceDeleted(deviceId, ipAddress) {
-    await this.log(
+  static logDeviceDeleted(deviceId, ipAddress) {
+    this.log(
       'system',
       `Dispositivo excluído: ID ${deviceId}`,
       ipAddress
     );
   }
 
-  static async logEquipmentCreated(equipment, ipAddress) {
-    await this.log(
+  static logEquipmentCreated(equipment, ipAddress) {
+    this.log(
       'system',
       `Novo equipamento criado: ${equipment.name}`,
       ipAddress,
@@ -106,8 +183,8 @@ class SecurityLogger {
     );
   }
 
-  static async logEquipmentUpdated(equipment, ipAddress) {
-    await this.log(
+  static logEquipmentUpdated(equipment, ipAddress) {
+    this.log(
       'system',
       `Equipamento atualizado: ${equipment.name}`,
       ipAddress,
@@ -115,16 +192,16 @@ class SecurityLogger {
     );
   }
 
-  static async logEquipmentDeleted(equipmentId, ipAddress) {
-    await this.log(
+  static logEquipmentDeleted(equipmentId, ipAddress) {
+    this.log(
       'system',
       `Equipamento excluído: ID ${equipmentId}`,
       ipAddress
     );
   }
 
-  static async logVehicleCreated(vehicle, ipAddress) {
-    await this.log(
+  static logVehicleCreated(vehicle, ipAddress) {
+    this.log(
       'system',
       `Novo veículo criado: ${vehicle.name}`,
       ipAddress,
@@ -132,8 +209,8 @@ class SecurityLogger {
     );
   }
 
-  static async logVehicleUpdated(vehicle, ipAddress) {
-    await this.log(
+  static logVehicleUpdated(vehicle, ipAddress) {
+    this.log(
       'system',
       `Veículo atualizado: ${vehicle.name}`,
       ipAddress,
@@ -141,16 +218,16 @@ class SecurityLogger {
     );
   }
 
-  static async logVehicleDeleted(vehicleId, ipAddress) {
-    await this.log(
+  static logVehicleDeleted(vehicleId, ipAddress) {
+    this.log(
       'system',
       `Veículo excluído: ID ${vehicleId}`,
       ipAddress
     );
   }
 
-  static async logViolation(description, ipAddress, location = null) {
-    await this.log(
+  static logViolation(description, ipAddress, location = null) {
+    this.log(
       'violation',
       description,
       ipAddress,
@@ -159,4 +236,13 @@ class SecurityLogger {
   }
 }
 
-export default SecurityLogger; 
\ No newline at end of file
+if (typeof window !== 'undefined') {
+  window.addEventListener('pagehide', () => SecurityLogger.flushNow());
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') {
+      SecurityLogger.flushNow();
+    }
+  });
+}
+
+export default SecurityLogger;
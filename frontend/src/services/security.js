@@ -1,11 +1,10 @@
-import api from './api';
+import api, { getAllPages } from './api';
 
 export const securityService = {
   // Incidentes de Segurança
   async getAlerts(params) {
     try {
-      const response = await api.get('/security/incidents/', { params });
-      return response.data;
+      return await getAllPages('/security/incidents/', params);
     } catch (error) {
       console.error('Erro ao buscar incidentes:', error.response?.data);
       throw error;
@@ -105,11 +104,14 @@ export const securityService = {
     }
   },
 
-  // Logs de Segurança
-  async getLogs(params) {
+  // Logs de Segurança: o histórico não tem limite, então a listagem é lida
+  // por página. Retorna { results, next }; passe "next" para a página seguinte.
+  async getLogs(params, next = null) {
     try {
-      const response = await api.get('/security/logs/', { params });
-      return response.data;
+      const response = next
+        ? await api.get(next)
+        : await api.get('/security/logs/', { params });
+      return { results: response.data.results, next: response.data.next };
     } catch (error) {
       console.error('Erro ao buscar logs:', error.response?.data);
       throw error;
@@ -125,5 +127,106 @@ export const securityService = {
       console.error('Erro ao criar log:', error.response?.data);
       throw error;
     }
+  },
+
+  async createLogsBatch(events) {
+    try {
+      const response = await api.post('/security/logs/batch/', events);
+      return response.data;
+    } catch (error) {
+      console.error('Erro ao enviar lote de logs:', error.response?.data);
+      throw error;
+    }
+  },
+
+  // Exportações do histórico
+  async createExport(dataset, format, filters) {
+    try {
+      const response = await api.post('/security/exports/', { dataset, format, filters });
+      return response.data;
+    } catch (error) {
+      console.error('Erro ao solicitar exportação:', error.response?.data);
+      throw error;
+    }
+  },
+
+  async getExport(id) {
+    try {
+      const response = await api.get(`/security/exports/${id}/`);
+      return response.data;
+    } catch (error) {
+      console.error('Erro ao buscar exportação:', error.response?.data);
+      throw error;
+    }
+  },
+
+  async downloadExport(id) {
+    try {
+      const response = await api.get(`/security/exports/${id}/download/`, { responseType: 'blob' });
+      return response.data;
+    } catch (error) {
+      console.error('Erro ao baixar exportação:', error.response?.data);
+      throw error;
+    }
+  },
+
+  // Feed ao vivo (SSE) de logs e incidentes. Retorna a função que encerra a conexão.
+  // Feed ao vivo (SSE). O EventSource não envia cabeçalhos: cada conexão usa
+  // um ticket de uso único e, ao reconectar, informa o último id recebido
+  // para que o servidor reenvie o que foi perdido.
+  subscribeLive(handlers, filters = {}) {
+    let source = null;
+    let lastEventId = null;
+    let retryTimer = null;
+    let closed = false;
+
+    const connect = async () => {
+      try {
+        const { data } = await api.post('/security/live/ticket/');
+        if (closed) return;
+        const params = new URLSearchParams({ ticket: data.ticket });
+        if (lastEventId) {
+          params.set('last_event_id', lastEventId);
+        }
+        Object.entries(filters).forEach(([key, value]) => {
+          if (value && value.length) {
+            params.set(key, Array.isArray(value) ? value.join(',') : value);
+          }
+        });
+        source = new EventSource(`${api.defaults.baseURL}/security/live/?${params}`);
+        ['log', 'incident', 'incident_status', 'dropped'].forEach((kind) => {
+          source.addEventListener(kind, (event) => {
+            if (event.lastEventId) {
+              lastEventId = event.lastEventId;
+            }
+            if (handlers[kind]) {
+              handlers[kind](JSON.parse(event.data));
+            }
+          });
+        });
+        // O ticket já foi consumido: a reconexão automática do navegador
+        // falharia, então reabrimos com um ticket novo
+        source.onerror = () => {
+          source.close();
+          scheduleReconnect();
+        };
+      } catch (error) {
+        console.error('Erro ao abrir o feed ao vivo:', error.response?.data);
+        scheduleReconnect();
+      }
+    };
+
+    const scheduleReconnect = () => {
+      if (!closed) {
+        retryTimer = setTimeout(connect, 3000);
+      }
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      if (source) source.close();
+    };
   }
 }; 
\ No newline at end of file
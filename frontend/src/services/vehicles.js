@@ -1,9 +1,8 @@
-import api from './api';
+import api, { getAllPages } from './api';
 
 export const vehicleService = {
   async getAll(params) {
-    const response = await api.get('/vehicles/', { params });
-    return response.data;
+    return getAllPages('/vehicles/', params);
   },
 
   async getById(id) {